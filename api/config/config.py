@@ -34,6 +34,10 @@ def get_settings():
         secure_cookies=core_config.secure_cookies,
         rate_limit_requests=core_config.rate_limit_requests,
         rate_limit_window_seconds=core_config.rate_limit_window_seconds,
+        rate_limit_enabled=core_config.rate_limit_enabled,
+        rate_limit_routes=core_config.rate_limit_routes,
+        rate_limit_tokens=core_config.rate_limit_tokens,
+        rate_limit_sqlite_path=core_config.rate_limit_sqlite_path,
         enable_metadata_comparison=core_config.enable_metadata_comparison,
         
         # API-specific settings, potentially overridden by environment variables
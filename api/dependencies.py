@@ -24,6 +24,7 @@ from core.services.content.page_service import PageService
 from core.services.content.pipeline_service import PipelineService
 from core.services.validation_service import ValidationRunner
 from core.services.embeddings.embedding_service import EmbeddingService
+from core.services.stats.stats_service import StatsService
 from core.infrastructure.embeddings.factory import EmbeddingProviderFactory
 from core.domain.content.pipeline import (
     DefaultStateManager, DefaultComponentCoordinator,
@@ -149,6 +150,13 @@ async def get_embedding_service(
     return EmbeddingService(factory, graph_service)
 
 
+async def get_stats_service(
+    app_state: AppState = Depends(get_app_state)
+) -> Optional[StatsService]:
+    """Get the shared stats service, or None if it is not initialized."""
+    return app_state.stats_service
+
+
 @asynccontextmanager
 async def manage_page_service(
     graph_service: GraphService = Depends(get_graph_service)
@@ -321,8 +329,18 @@ async def get_task_manager(component_name: str, app_state = Depends(get_app_stat
         An initialized TaskManager instance
     """
     if component_name not in _task_managers:
+        # Agent tasks are the queries reported by /stats
+        on_task_created = []
+        stats_service = getattr(app_state, "stats_service", None)
+        if component_name == "agent" and stats_service:
+            on_task_created.append(stats_service.record_query)
+        
         # Create new TaskManager
-        task_manager = TaskManager(component_name)
+        task_manager = TaskManager(
+            component_name,
+            event_bus=getattr(app_state, "event_bus", None),
+            on_task_created=on_task_created
+        )
         await task_manager.initialize()
         _task_managers[component_name] = task_manager
         
@@ -1,9 +1,12 @@
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from typing import Dict, Any
 from contextlib import asynccontextmanager
 from api.config.config import settings
 from api.state import app_state, get_app_state, AppState
+from api.middleware import DatabaseSessionMiddleware, RateLimitMiddleware
+from api.utils.rate_limit import rate_limit_config_from_settings
 from api.routes.pages import router as pages_router
 from api.routes.analysis import router as analysis_router 
 from api.routes.graph import router as graph_router
@@ -12,7 +15,8 @@ from api.routes.llm import router as llm_router
 from api.routes.agent import router as agent_router
 from api.routes.stats import router as stats_router
 from api.routes.embeddings import router as embeddings_router
-from core.utils.logger import get_logger
+from api.routes.events import router as events_router
+from core.utils.logger import get_logger, start_queue_logging, stop_queue_logging
 
 
 # Configure logger
@@ -24,6 +28,8 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI):
     """Lifespan context manager for FastAPI application with enhanced error handling."""
     startup_success = False
+    # Log records are written by a background thread while the loop runs
+    start_queue_logging()
     try:
         logger.info("Initializing services...")
         start_time = __import__('time').time()
@@ -59,6 +65,8 @@ async def lifespan(app: FastAPI):
                 logger.info("Cleanup after failed startup complete")
         except Exception as e:
             logger.error(f"Error cleaning up services: {e}", exc_info=True)
+        finally:
+            stop_queue_logging()
 
 
 def create_application() -> FastAPI:
@@ -73,6 +81,13 @@ def create_application() -> FastAPI:
         lifespan=lifespan
     )
 
+    # Reuse Neo4j sessions across the queries of a request
+    app.add_middleware(DatabaseSessionMiddleware, get_connection=lambda: app_state.db_connection)
+
+    # Rate limit inside CORS, so 429 responses still carry CORS headers
+    if settings.rate_limit_enabled:
+        app.add_middleware(RateLimitMiddleware, config=rate_limit_config_from_settings(settings))
+
     # Set up CORS
     logger.debug(f"Configuring CORS middleware with origins: {settings.BACKEND_CORS_ORIGINS}")
     app.add_middleware(
@@ -93,6 +108,7 @@ def create_application() -> FastAPI:
     app.include_router(agent_router, prefix=prefix)
     app.include_router(stats_router, prefix=prefix)
     app.include_router(embeddings_router, prefix=prefix)
+    app.include_router(events_router, prefix=prefix)
 
     @app.get("/health")
     async def health_check():
@@ -116,8 +132,34 @@ def create_application() -> FastAPI:
                 "auth": "running" if app_state.auth_config else "not_initialized",
                 "llm": "running" if app_state.llm_factory else "not_initialized"
             },
-            "connection_pool": pool_status
+            "connection_pool": pool_status,
+            "readiness": app_state.readiness
         }
+
+    @app.get("/health/live")
+    async def liveness_check():
+        """Liveness probe: the process is up and serving requests.
+
+        Does not touch any dependency, so a slow database or an ongoing
+        warm-up never gets the process restarted.
+        """
+        return {"status": "alive"}
+
+    @app.get("/health/ready")
+    async def readiness_check():
+        """Readiness probe: warm-up finished and the service can take traffic.
+
+        Returns 503 while schema creation or model loading is still pending,
+        or if one of them failed.
+        """
+        ready = app_state.is_ready
+        return JSONResponse(
+            status_code=200 if ready else 503,
+            content={
+                "status": "ready" if ready else "not_ready",
+                "components": app_state.readiness
+            }
+        )
     
     @app.get("/debug/connection-pool")
     async def connection_pool_debug(app_state: AppState = Depends(get_app_state)) -> Dict[str, Any]:
@@ -147,6 +189,20 @@ def create_application() -> FastAPI:
                 "timestamp": __import__('datetime').datetime.now().isoformat()
             }
 
+    @app.get("/debug/query-metrics")
+    async def query_metrics_debug(
+        sort_by: str = "total_ms",
+        limit: int = 50,
+        app_state: AppState = Depends(get_app_state)
+    ) -> Dict[str, Any]:
+        """Internal endpoint with per-query latency, rows and retries by Cypher fingerprint."""
+        if not app_state.db_connection:
+            return {"status": "database_not_initialized"}
+        try:
+            return app_state.db_connection.get_query_metrics(sort_by=sort_by, limit=limit)
+        except ValueError as e:
+            return JSONResponse(status_code=400, content={"status": "error", "message": str(e)})
+
     return app
 
 
@@ -1,187 +1,328 @@
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from typing import Callable
+"""Pure ASGI middlewares.
+
+Each middleware wraps the downstream app directly instead of subclassing
+``BaseHTTPMiddleware``, so no extra task or memory stream is created per
+request and streaming responses pass through untouched. Response bodies are
+never decoded or rebuilt; per-request data (timing, request id) is added as
+headers when the response starts, and timing is also sent as a
+``Server-Timing`` trailer when the server supports HTTP trailers.
+"""
+import asyncio
+import logging
 import time
-import json
-from uuid import uuid
-from datetime import datetime
+import uuid
+from typing import Any, Awaitable, Callable, Dict, MutableMapping, Optional
+
+from fastapi.responses import JSONResponse
 from api.utils.errors import APIError
 from api.models.common import APIResponse
+from api.utils.rate_limit import (
+    RateLimit,
+    RateLimitConfig,
+    client_key,
+    create_limiter,
+    retry_after_header
+)
 from core.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-class RequestValidationMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+def _error_response(status_code: int, error: Dict[str, Any]) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content=APIResponse(success=False, error=error).model_dump()
+    )
+
+
+def _validation_error(exc: ValueError) -> JSONResponse:
+    return _error_response(422, {
+        "error_code": "VALIDATION_ERROR",
+        "message": str(exc),
+        "details": {"type": "ValueError"}
+    })
+
+
+def _bearer_token(scope: Scope) -> Optional[str]:
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            scheme, _, credentials = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer":
+                return None
+            return credentials.strip() or None
+    return None
+
+
+def _append_header(message: Message, name: bytes, value: str) -> None:
+    headers = list(message.get("headers", ()))
+    headers.append((name, value.encode("latin-1")))
+    message["headers"] = headers
+
+
+class _ResponseGuard:
+    """Wraps ``send`` to record whether the response has started.
+
+    Once headers are sent an error response can no longer be substituted,
+    so exception handlers re-raise and let the server abort the connection.
+    """
+
+    __slots__ = ("send", "started")
+
+    def __init__(self, send: Send):
+        self.send = send
+        self.started = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.started = True
+        await self.send(message)
+
+
+class RequestValidationMiddleware:
+    """Convert ValueErrors raised by handlers into 422 responses."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        guard = _ResponseGuard(send)
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, guard)
         except ValueError as e:
-            return JSONResponse(
-                status_code=422,
-                content=APIResponse(
-                    success=False,
-                    error={
-                        "error_code": "VALIDATION_ERROR",
-                        "message": str(e),
-                        "details": {"type": "ValueError"}
-                    }
-                ).model_dump()
-            )
+            if guard.started:
+                raise
+            await _validation_error(e)(scope, receive, send)
+
+
+class RateLimitMiddleware:
+    """Token-bucket rate limiting per client, route and auth token.
+
+    Clients are identified by bearer token when it is one of the configured
+    ``tokens``, otherwise by IP.
+    Each client gets one bucket per configured route prefix (or the default
+    bucket), so per-request work is a single bucket update. Rejected requests
+    get a 429 with ``Retry-After``. Limiters that may block (SQLite) are
+    called from a worker thread, never on the event loop.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        requests_per_minute: int = 60,
+        config: Optional[RateLimitConfig] = None,
+        limiter: Optional[Any] = None
+    ):
+        self.app = app
+        self.config = config or RateLimitConfig(default=RateLimit(requests_per_minute, 60.0))
+        self.limiter = limiter or create_limiter(self.config)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, requests_per_minute: int = 60):
-        super().__init__(app)
-        self.requests_per_minute = requests_per_minute
-        self.requests = {}
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        client_ip = request.client.host
-        now = datetime.now().timestamp()
-
-        # Clean old requests
-        self.requests = {ip: times for ip, times in self.requests.items()
-                        if times[-1] > now - 60}
-
-        # Check rate limit
-        if client_ip in self.requests:
-            if len(self.requests[client_ip]) >= self.requests_per_minute:
-                return JSONResponse(
-                    status_code=429,
-                    content=APIResponse(
-                        success=False,
-                        error={
-                            "error_code": "RATE_LIMIT_EXCEEDED",
-                            "message": "Too many requests",
-                            "details": {
-                                "limit": self.requests_per_minute,
-                                "window": "60 seconds"
-                            }
-                        }
-                    ).model_dump()
-                )
-            self.requests[client_ip].append(now)
+        # Unknown tokens are not an identity, or a client could send a fresh
+        # token per request and get a fresh bucket each time
+        token = _bearer_token(scope)
+        if token not in self.config.tokens:
+            token = None
+        client = scope.get("client")
+        route, limit = self.config.resolve(scope["path"], token)
+        key = f"{client_key(token, client[0] if client else None)}|{route}"
+        if getattr(self.limiter, "blocking", False):
+            decision = await asyncio.to_thread(self.limiter.acquire, key, limit)
         else:
-            self.requests[client_ip] = [now]
-
-        return await call_next(request)
-
-class TimingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        
-        # Add timing to response metadata if it's our APIResponse
-        if isinstance(response, JSONResponse):
-            try:
-                content = response.body.decode()
-                data = json.loads(content)
-                if "metadata" in data:
-                    data["metadata"]["process_time"] = process_time
-                    response = JSONResponse(
-                        status_code=response.status_code,
-                        content=data
-                    )
-            except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
-                pass
-        
-        response.headers["X-Process-Time"] = str(process_time)
-        return response
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        request_id = str(uuid.uuid4())
-        logger.info(
-            f"Request: {request.method} {request.url}",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "client_ip": request.client.host
-            }
-        )
-        
-        response = await call_next(request)
-        
-        logger.info(
-            f"Response: {response.status_code}",
-            extra={
-                "request_id": request_id,
-                "status_code": response.status_code
-            }
-        )
-        
-        # Add request_id to response metadata if it's our APIResponse
-        if isinstance(response, JSONResponse):
-            try:
-                content = response.body.decode()
-                data = json.loads(content)
-                if "metadata" in data:
-                    data["metadata"]["request_id"] = request_id
-                    response = JSONResponse(
-                        status_code=response.status_code,
-                        content=data
+            decision = self.limiter.acquire(key, limit)
+
+        if not decision.allowed:
+            response = _error_response(429, {
+                "error_code": "RATE_LIMIT_EXCEEDED",
+                "message": "Too many requests",
+                "details": {
+                    "limit": limit.requests,
+                    "window": f"{limit.window_seconds:g} seconds",
+                    "retry_after": round(decision.retry_after, 3)
+                }
+            })
+            response.headers["Retry-After"] = retry_after_header(decision)
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+
+class TimingMiddleware:
+    """Report request processing time without touching the body.
+
+    ``X-Process-Time`` (seconds until the response started) is added to the
+    response headers. If the server advertises the ``http.response.trailers``
+    extension, the total time including the body is also sent as a
+    ``Server-Timing`` trailer, which covers streamed responses.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        trailers = "http.response.trailers" in (scope.get("extensions") or {})
+
+        async def send_with_timing(message: Message) -> None:
+            message_type = message["type"]
+            if message_type == "http.response.start":
+                _append_header(message, b"x-process-time", f"{time.perf_counter() - start:.6f}")
+                if trailers:
+                    _append_header(message, b"trailer", "Server-Timing")
+                    message["trailers"] = True
+            elif trailers and message_type == "http.response.body" and not message.get("more_body"):
+                await send(message)
+                total_ms = (time.perf_counter() - start) * 1000
+                await send({
+                    "type": "http.response.trailers",
+                    "headers": [(b"server-timing", f"total;dur={total_ms:.1f}".encode("latin-1"))],
+                    "more_trailers": False
+                })
+                return
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
+
+
+class LoggingMiddleware:
+    """Log requests and responses with a request id.
+
+    The id is taken from an incoming ``X-Request-ID`` header or generated,
+    stored in ``request.state.request_id`` and echoed as a response header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = self._incoming_request_id(scope) or uuid.uuid4().hex
+        scope.setdefault("state", {})["request_id"] = request_id
+        start = time.perf_counter()
+
+        if logger.isEnabledFor(logging.INFO):
+            client = scope.get("client")
+            logger.info(
+                "Request: %s %s",
+                scope["method"],
+                scope["path"],
+                extra={
+                    "request_id": request_id,
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "client_ip": client[0] if client else None
+                }
+            )
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                _append_header(message, b"x-request-id", request_id)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Response: %s (%.1f ms)",
+                        message["status"],
+                        (time.perf_counter() - start) * 1000,
+                        extra={"request_id": request_id, "status_code": message["status"]}
                     )
-            except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
-                pass
-                
-        return response
-    
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Handle all errors and convert to consistent API responses."""
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
+
+    @staticmethod
+    def _incoming_request_id(scope: Scope) -> Optional[str]:
+        for name, value in scope.get("headers", ()):
+            if name == b"x-request-id":
+                return value.decode("latin-1")[:128]
+        return None
+
+
+class ErrorHandlerMiddleware:
+    """Handle all errors and convert them to consistent API responses."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        guard = _ResponseGuard(send)
         try:
-            response = await call_next(request)
-            return response
-            
-        except APIError as exc:
+            await self.app(scope, receive, guard)
+        except Exception as exc:
+            if guard.started:
+                raise
+            await self._to_response(exc, scope["path"])(scope, receive, send)
+
+    @staticmethod
+    def _to_response(exc: Exception, path: str) -> JSONResponse:
+        if isinstance(exc, APIError):
             logger.warning(
                 f"API Error: {exc.message}",
                 extra={
                     "error_code": exc.error_code,
                     "details": exc.details,
-                    "path": request.url.path
+                    "path": path
                 }
             )
-            return JSONResponse(
-                status_code=exc.status_code,
-                content=APIResponse(
-                    success=False,
-                    error=exc.to_dict()
-                ).model_dump()
-            )
-            
-        except ValueError as exc:
+            return _error_response(exc.status_code, exc.to_dict())
+
+        if isinstance(exc, ValueError):
             # Handle FastAPI's built-in validation errors
-            return JSONResponse(
-                status_code=422,
-                content=APIResponse(
-                    success=False,
-                    error={
-                        "error_code": "VALIDATION_ERROR",
-                        "message": str(exc),
-                        "details": {"type": "ValueError"}
-                    }
-                ).model_dump()
-            )
-            
-        except Exception as exc:
-            # Unexpected errors
-            logger.error(
-                f"Unexpected error: {str(exc)}",
-                exc_info=True,
-                extra={"path": request.url.path}
-            )
-            return JSONResponse(
-                status_code=500,
-                content=APIResponse(
-                    success=False,
-                    error={
-                        "error_code": "INTERNAL_ERROR",
-                        "message": "An unexpected error occurred",
-                        "details": {"type": str(type(exc).__name__)}
-                    }
-                ).model_dump()
-            )
\ No newline at end of file
+            return _validation_error(exc)
+
+        # Unexpected errors
+        logger.error(
+            f"Unexpected error: {str(exc)}",
+            exc_info=exc,
+            extra={"path": path}
+        )
+        return _error_response(500, {
+            "error_code": "INTERNAL_ERROR",
+            "message": "An unexpected error occurred",
+            "details": {"type": str(type(exc).__name__)}
+        })
+
+
+class DatabaseSessionMiddleware:
+    """Share Neo4j sessions between the queries of one request.
+
+    Queries run while handling a request reuse one session per access mode
+    instead of opening one each; the sessions are closed once the response
+    has been sent. Requests that run no query open no session.
+    """
+
+    def __init__(self, app: ASGIApp, get_connection: Callable[[], Optional[Any]]):
+        self.app = app
+        self.get_connection = get_connection
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        connection = self.get_connection() if scope["type"] == "http" else None
+        if connection is None:
+            await self.app(scope, receive, send)
+            return
+
+        async with connection.request_scope():
+            await self.app(scope, receive, send)
@@ -5,12 +5,19 @@ from datetime import datetime
 from api.models.common import APIResponse
 
 class GraphNode(BaseModel):
-    """Representation of a node in the graph."""
+    """Representation of a node in the graph.
+    
+    Page nodes carry a url and domain; cluster (super-)nodes produced by the
+    level-of-detail overview carry a node_type of "domain" or "keyword", a
+    label and the number of pages they aggregate in size.
+    """
     id: UUID
-    url: str
-    domain: str
+    url: Optional[str] = None
+    domain: Optional[str] = None
     title: Optional[str] = None
     last_active: Optional[datetime] = None
+    node_type: str = "page"
+    size: int = 1
     metadata: Dict[str, Any] = {}
 
 class GraphEdge(BaseModel):
@@ -1,6 +1,9 @@
+import asyncio
+import json
 from datetime import datetime
 from fastapi import APIRouter, Depends, BackgroundTasks
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
 from api.models.llm.request import GenerationRequest
 from api.state import get_app_state
@@ -9,12 +12,22 @@ from api.models.agent.request import AgentRequest, AgentTaskType
 from api.models.common import APIResponse
 from core.utils.logger import get_logger
 from api.routes.llm import _convert_to_provider_request
+from core.llm.common.utils import estimate_tokens
+from core.services.retrieval.context_builder import ContextBuilder
+from core.llm.cache.response_cache import source_fingerprint
+from core.llm.common.streaming import coalesce_deltas, decode_text, escape_text, sse_text_frame
+from core.llm.providers.base.exceptions import LLMProviderError
 
 router = APIRouter(prefix="/agent", tags=["agent"])
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/agent", tags=["agent"])
-logger = get_logger(__name__)
+context_builder = ContextBuilder()
+
+SYSTEM_PROMPT = """You are Marvin, an intelligent research assistant. 
+        Answer queries based on the provided context. 
+        If the context doesn't contain relevant information, say so rather than making things up.
+        Always cite your sources when referencing specific information."""
+MAX_OUTPUT_TOKENS = 1000
 
 @router.post("/query", response_model=APIResponse)
 async def create_agent_query(
@@ -54,6 +67,42 @@ async def create_agent_query(
     }
 
 
+@router.post("/query/stream")
+async def stream_agent_query(
+    request: AgentRequest,
+    task_manager = Depends(get_agent_task_manager),
+    app_state = Depends(get_app_state)
+):
+    """Answer an agent query as a stream of Server-Sent Events.
+    
+    Events are sent as soon as they are available:
+    
+    - ``task``: task id and status endpoint, for falling back to polling
+    - ``retrieval``: sources selected for the answer
+    - ``token``: answer text deltas
+    - ``done``: the same result the status endpoint reports on completion
+    - ``error``: processing failed
+    
+    The task is updated as for /agent/query, so /agent/status keeps working.
+    """
+    task_id = await task_manager.create_task({
+        "type": request.task_type,
+        "query": request.query,
+        "relevant_urls": request.relevant_urls or [],
+        "provider_id": request.provider_id,
+        "model_id": request.model_id,
+        "stream": True
+    })
+    
+    logger.info(f"Created streaming agent task {task_id} for query: {request.query}")
+    
+    return StreamingResponse(
+        _agent_event_stream(task_id, request, app_state, task_manager),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/status/{task_id}", response_model=APIResponse)
 async def get_task_status(
     task_id: str,
@@ -81,7 +130,7 @@ async def process_agent_query(
         })
         
         # 1. Get relevant content from knowledge graph
-        relevant_content = await get_relevant_content(
+        relevant_content, retrieval_info = await get_relevant_content(
             request.query,
             request.relevant_urls,
             app_state
@@ -93,45 +142,45 @@ async def process_agent_query(
             "message": "Analyzing content"
         })
         
-        # 2. Generate LLM response with provider flexibility
-        response_text = await generate_llm_response(
-            request.query,
-            relevant_content,
-            request.task_type,
-            request.provider_id,  # Use the requested provider
-            request.model_id,     # Use the requested model
-            app_state
+        # 2. Answer from the response cache when the same question was asked
+        # over the same (unchanged) sources, otherwise call the LLM
+        provider_id, model_id = _resolve_model(request.provider_id, request.model_id)
+        cached, store_answer = await _lookup_cached_answer(
+            request, relevant_content, provider_id, model_id, app_state
         )
         
+        if cached is not None:
+            logger.info(f"Serving agent task {task_id} from response cache")
+            response_text, context_info = cached["response"], cached["context"]
+        else:
+            response_text, context_info = await generate_llm_response(
+                request.query,
+                relevant_content,
+                request.task_type,
+                provider_id,
+                model_id,
+                app_state
+            )
+            generated = app_state.llm_factory and not response_text.startswith(
+                ("Error generating response", "No response generated")
+            )
+            if generated:
+                store_answer(response_text, context_info)
+        
         # Update progress
         await task_manager.update_task(task_id, {
             "progress": 0.8,
             "message": "Finalizing response"
         })
         
-        # 3. Create source references
-        sources = [
-            {
-                "url": item["url"],
-                "title": item.get("title", item["url"].split("/")[-1]),
-                "relevance_score": item.get("relevance", 0.8),
-                "accessed_at": datetime.now().isoformat()
-            }
-            for item in relevant_content
-        ]
-        
-        # 4. Update task with result
-        await task_manager.update_task(task_id, {
-            "status": "completed",
-            "completed_at": datetime.now().isoformat(),
-            "progress": 1.0,
-            "message": "Task completed successfully",
-            "result": {
-                "response": response_text,
-                "sources": sources,
-                "confidence_score": 0.85
-            }
-        })
+        # 3. Update task with result and source references
+        await task_manager.update_task(task_id, _completed_update(
+            response_text,
+            _source_references(relevant_content),
+            retrieval_info,
+            context_info,
+            cached is not None
+        ))
         
         logger.info(f"Completed agent task {task_id}")
         
@@ -146,28 +195,212 @@ async def process_agent_query(
             "progress": 0.0
         })
 
-async def get_relevant_content(query: str, relevant_urls: List[str], app_state):
-    """Get relevant content from knowledge graph."""
-    # Use page service if available
+async def _agent_event_stream(
+    task_id: str,
+    request: AgentRequest,
+    app_state,
+    task_manager
+) -> AsyncIterator[str]:
+    """Run an agent query, yielding SSE frames as each stage completes."""
+    yield _sse("task", {"task_id": task_id, "status_endpoint": task_manager.status_path})
+    
+    try:
+        await task_manager.update_task(task_id, {
+            "status": "processing",
+            "progress": 0.2,
+            "message": "Retrieving relevant information"
+        })
+        
+        relevant_content, retrieval_info = await get_relevant_content(
+            request.query,
+            request.relevant_urls,
+            app_state
+        )
+        sources = _source_references(relevant_content)
+        yield _sse("retrieval", {"sources": sources, "retrieval": retrieval_info})
+        
+        await task_manager.update_task(task_id, {
+            "progress": 0.4,
+            "message": "Generating response"
+        })
+        
+        provider_id, model_id = _resolve_model(request.provider_id, request.model_id)
+        cached, store_answer = await _lookup_cached_answer(
+            request, relevant_content, provider_id, model_id, app_state
+        )
+        
+        if cached is not None:
+            logger.info(f"Serving streaming agent task {task_id} from response cache")
+            response_text, context_info = cached["response"], cached["context"]
+            yield sse_text_frame(escape_text(response_text), event="token")
+        else:
+            generic_request, context_info = await _build_generation_request(
+                request.query, relevant_content, provider_id, model_id, app_state, stream=True
+            )
+            # Frames stay JSON-escaped; the answer is decoded once at the end
+            parts = []
+            async for frame in stream_llm_response(request.query, generic_request, app_state):
+                parts.append(frame)
+                yield sse_text_frame(frame, event="token")
+            response_text = decode_text(b"".join(parts))
+            if app_state.llm_factory and response_text:
+                store_answer(response_text, context_info)
+        
+        update = _completed_update(
+            response_text, sources, retrieval_info, context_info, cached is not None
+        )
+        await task_manager.update_task(task_id, update)
+        yield _sse("done", update["result"])
+        
+        logger.info(f"Completed streaming agent task {task_id}")
+        
+    except asyncio.CancelledError:
+        # Client went away; leave the task in a terminal state for pollers
+        await task_manager.update_task(task_id, {
+            "status": "error",
+            "error": "Client disconnected",
+            "message": "Stream cancelled by client",
+            "progress": 0.0
+        })
+        raise
+    except Exception as e:
+        logger.error(f"Error streaming agent task {task_id}: {str(e)}", exc_info=True)
+        await task_manager.update_task(task_id, {
+            "status": "error",
+            "error": str(e),
+            "message": f"Error: {str(e)}",
+            "progress": 0.0
+        })
+        yield _sse("error", {"error": str(e)})
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Events frame."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _source_references(relevant_content: List[dict]) -> List[Dict[str, Any]]:
+    """Source references reported with an answer."""
+    return [
+        {
+            "url": item["url"],
+            "title": item.get("title", item["url"].split("/")[-1]),
+            "relevance_score": item.get("relevance", 0.8),
+            "accessed_at": datetime.now().isoformat()
+        }
+        for item in relevant_content
+    ]
+
+
+def _completed_update(
+    response_text: str,
+    sources: List[Dict[str, Any]],
+    retrieval_info: Dict[str, Any],
+    context_info: Dict[str, Any],
+    cached: bool
+) -> Dict[str, Any]:
+    """Task update recorded when an agent query completes."""
+    return {
+        "status": "completed",
+        "completed_at": datetime.now().isoformat(),
+        "progress": 1.0,
+        "message": "Task completed successfully",
+        "result": {
+            "response": response_text,
+            "sources": sources,
+            "confidence_score": 0.85,
+            "retrieval": retrieval_info,
+            "context": context_info,
+            "cached": cached
+        }
+    }
+
+
+async def _lookup_cached_answer(
+    request: AgentRequest,
+    relevant_content: List[dict],
+    provider_id: str,
+    model_id: str,
+    app_state
+) -> Tuple[Optional[Dict[str, Any]], Callable[[str, Dict[str, Any]], None]]:
+    """Look up an answer to the same question over the same (unchanged) sources.
+    
+    Returns:
+        Tuple of (cached {"response", "context"} or None, function that
+        caches a newly generated answer under the same key)
+    """
+    cache = getattr(app_state, "response_cache", None)
+    if cache is None:
+        return None, lambda response_text, context_info: None
+    
+    source_ids = _content_source_ids(relevant_content)
+    cache_scope = cache.make_scope(
+        provider_id,
+        model_id,
+        [source_fingerprint(item.get("page_id") or item["url"], item.get("content"))
+         for item in relevant_content]
+    )
+    cache_key = cache.make_key(
+        cache_scope, request.query, {"task_type": str(request.task_type)}, normalize=True
+    )
+    cached = cache.get(cache_key)
+    
+    query_embedding = None
+    if cached is None and cache.config.enable_semantic and getattr(app_state, "embedding_service", None):
+        try:
+            embedding = await app_state.embedding_service.get_embedding(request.query)
+            query_embedding = embedding.vector if any(embedding.vector) else None
+        except Exception as e:
+            # The cache is an optimisation; answer without the semantic lookup
+            logger.error(f"Error embedding query for response cache: {str(e)}", exc_info=True)
+        cached = cache.get_similar(cache_scope, query_embedding)
+    
+    def store_answer(response_text: str, context_info: Dict[str, Any]) -> None:
+        cache.put(
+            cache_key,
+            {"response": response_text, "context": context_info},
+            scope=cache_scope,
+            sources=source_ids,
+            embedding=query_embedding
+        )
+    
+    return cached, store_answer
+
+
+async def get_relevant_content(query: str, relevant_urls: List[str], app_state) -> Tuple[List[dict], Dict[str, Any]]:
+    """Get relevant content from knowledge graph.
+    
+    Explicit URLs are fetched in a single query; otherwise the hybrid
+    retrieval service (full-text + vector, RRF-fused) selects pages.
+    
+    Returns:
+        Tuple of (content items, retrieval metadata with per-source latencies)
+    """
     content = []
+    retrieval_info: Dict[str, Any] = {}
+    graph_service = getattr(app_state, "graph_service", None)
     
     if relevant_urls:
+        pages_by_url = {}
+        if graph_service:
+            try:
+                pages = await graph_service.get_pages_content(urls=relevant_urls)
+                pages_by_url = {page["url"]: page for page in pages}
+            except Exception as e:
+                logger.warning(f"Error fetching pages {relevant_urls}: {str(e)}")
+        
         # Use specified URLs
         for url in relevant_urls:
-            # Try to get page from Neo4j
-            if hasattr(app_state, "graph_service"):
-                try:
-                    page = await app_state.graph_service.get_page_by_url(url)
-                    if page:
-                        content.append({
-                            "url": url,
-                            "title": page.get("title", url.split("/")[-1]),
-                            "content": page.get("content", ""),
-                            "relevance": 0.95
-                        })
-                        continue
-                except Exception as e:
-                    logger.warning(f"Error fetching page {url}: {str(e)}")
+            page = pages_by_url.get(url)
+            if page:
+                content.append({
+                    "page_id": page.get("id"),
+                    "url": url,
+                    "title": page.get("title") or url.split("/")[-1],
+                    "content": page.get("content") or "",
+                    "relevance": 0.95
+                })
+                continue
             
             # Fallback: Use mock content based on URL
             filename = url.split("/")[-1]
@@ -196,16 +429,27 @@ async def get_relevant_content(query: str, relevant_urls: List[str], app_state):
         # No URLs provided, search graph with query
         logger.info(f"No relevant URLs provided, searching with query: {query}")
         
-        # Try to use graph service if available
-        if hasattr(app_state, "graph_service"):
+        retrieval_service = getattr(app_state, "retrieval_service", None)
+        if retrieval_service:
             try:
-                results = await app_state.graph_service.query_pages(query, limit=3)
-                for page in results:
+                result = await retrieval_service.retrieve(query)
+                retrieval_info = result.to_dict()
+                
+                page_ids = [page.page_id for page in result.pages if page.page_id]
+                contents = {
+                    page["id"]: page.get("content") or ""
+                    for page in await graph_service.get_pages_content(page_ids=page_ids)
+                } if page_ids else {}
+                
+                for page in result.pages:
                     content.append({
-                        "url": page.get("url"),
-                        "title": page.get("title", page.get("url", "").split("/")[-1]),
-                        "content": page.get("content", ""),
-                        "relevance": page.get("score", 0.7)
+                        "page_id": page.page_id,
+                        "url": page.url,
+                        "title": page.title or (page.url or "").split("/")[-1],
+                        "content": contents.get(page.page_id, ""),
+                        "relevance": page.score,
+                        "retrieval_ranks": page.ranks,
+                        "chunks": page.chunks
                     })
             except Exception as e:
                 logger.warning(f"Error searching graph: {str(e)}")
@@ -234,7 +478,37 @@ async def get_relevant_content(query: str, relevant_urls: List[str], app_state):
                     "relevance": 0.75
                 })
     
-    return content
+    return content, retrieval_info
+
+def _resolve_model(provider_id: Optional[str], model_id: Optional[str]) -> Tuple[str, str]:
+    """Apply default provider and model ids."""
+    # Use specified provider or fall back to default
+    # Make it use the same provider_id that was configured in the test harness
+    # if app_state.environment == "test":
+    #     provider_id = provider_id or "anthropic-test"  # Use test ID in test environment
+    # else:
+    provider_id = provider_id or "anthropic"  # Use regular ID in production
+    
+    # Use specified model or fall back to provider-specific default
+    default_models = {
+        "anthropic": "claude-3-haiku-20240307",
+        "ollama": "llama3",
+        "openai": "gpt-3.5-turbo"
+    }
+    model_id = model_id or default_models.get(provider_id, "claude-3-haiku-20240307")
+    return provider_id, model_id
+
+
+def _content_source_ids(content: List[dict]) -> List[str]:
+    """Page ids and URLs a response depends on, for cache invalidation."""
+    source_ids = []
+    for item in content:
+        if item.get("page_id"):
+            source_ids.append(str(item["page_id"]))
+        if item.get("url"):
+            source_ids.append(item["url"])
+    return source_ids
+
 
 async def generate_llm_response(
     query: str, 
@@ -244,73 +518,148 @@ async def generate_llm_response(
     model_id: Optional[str],
     app_state
 ):
-    """Generate LLM response using the provided context and specified provider."""
+    """Generate LLM response using the provided context and specified provider.
+    
+    Returns:
+        Tuple of (response text, context token report)
+    """
+    context_info: Dict[str, Any] = {}
     try:
         if not app_state.llm_factory:
             logger.warning("LLM factory not initialized, using mock response")
-            return f"Mock response for query: {query}"
-        
-        # Use specified provider or fall back to default
-        # Make it use the same provider_id that was configured in the test harness
-        # if app_state.environment == "test":
-        #     provider_id = provider_id or "anthropic-test"  # Use test ID in test environment
-        # else:
-        provider_id = provider_id or "anthropic"  # Use regular ID in production
-        
-        # Use specified model or fall back to provider-specific default
-        default_models = {
-            "anthropic": "claude-3-haiku-20240307",
-            "ollama": "llama3",
-            "openai": "gpt-3.5-turbo"
-        }
-        model_id = model_id or default_models.get(provider_id, "claude-3-haiku-20240307")
-        
-        # Format context for LLM
-        context_text = "\n\n".join([
-            f"Source: {item['url']}\nTitle: {item['title']}\nContent: {item['content']}"
-            for item in content
-        ])
-        
-        system_prompt = """You are Marvin, an intelligent research assistant. 
-        Answer queries based on the provided context. 
-        If the context doesn't contain relevant information, say so rather than making things up.
-        Always cite your sources when referencing specific information."""
-        
-        user_prompt = f"Question: {query}\n\nContext:\n{context_text}"
-        
-        # Create a generic request that will be converted to provider-specific format
+            return f"Mock response for query: {query}", context_info
         
-        generic_request = GenerationRequest(
-            provider_id=provider_id,
-            model_id=model_id,
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            max_tokens=1000,
-            temperature=0.7,
-            stream=False
+        generic_request, context_info = await _build_generation_request(
+            query, content, provider_id, model_id, app_state, stream=False
         )
         
-        # Use the LLM route's helper function to convert to provider-specific request
-        async with app_state.llm_factory.get_provider_context(provider_id, model_id) as provider:
-            
-            # Determine provider type from class name if provider_type attribute doesn't exist
-            if hasattr(provider, "provider_type"):
-                provider_type = provider.provider_type
-            else:
-                # Extract from class name (e.g., 'AnthropicProvider' -> 'anthropic')
-                provider_class_name = provider.__class__.__name__
-                provider_type = provider_class_name.replace('Provider', '').lower()
-            
-            provider_request = await _convert_to_provider_request(
-                provider_type, generic_request
-            )
+        async with app_state.llm_factory.get_provider_context(
+            generic_request.provider_id, generic_request.model_id
+        ) as provider:
+            provider_request = await _provider_request(provider, generic_request)
             
             async for response in provider.generate(provider_request):
-                return response.response
+                return response.response, context_info
                 
         # Fallback
-        return f"No response generated for query: {query}"
+        return f"No response generated for query: {query}", context_info
             
     except Exception as e:
         logger.error(f"Error generating LLM response: {str(e)}", exc_info=True)
-        return f"Error generating response: {str(e)}"
\ No newline at end of file
+        return f"Error generating response: {str(e)}", context_info
+
+
+async def stream_llm_response(
+    query: str,
+    generic_request: GenerationRequest,
+    app_state
+) -> AsyncIterator[str]:
+    """Stream answer text from the provider as coalesced, JSON-escaped frames.
+    
+    Providers with ``stream_text_deltas`` are forwarded without decoding;
+    others are escaped per chunk.
+    
+    Args:
+        query: The user's query, used for the mock response
+        generic_request: Request from _build_generation_request with stream=True
+        app_state: Application state holding the LLM factory
+        
+    Yields:
+        Escaped text frames in generation order (see core.llm.common.streaming)
+    """
+    if not app_state.llm_factory:
+        logger.warning("LLM factory not initialized, using mock response")
+        yield escape_text(f"Mock response for query: {query}")
+        return
+    
+    async with app_state.llm_factory.get_provider_context(
+        generic_request.provider_id, generic_request.model_id
+    ) as provider:
+        provider_request = await _provider_request(provider, generic_request)
+        if hasattr(provider, "stream_text_deltas"):
+            deltas = provider.stream_text_deltas(provider_request)
+        else:
+            deltas = _escaped_chunks(provider.generate(provider_request))
+        async for frame in coalesce_deltas(deltas):
+            yield frame
+
+
+async def _escaped_chunks(responses: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+    """Adapt generate() responses to escaped text deltas.
+    
+    Raises:
+        LLMProviderError: If the stream ends without a final ``done`` chunk,
+            so a truncated answer is never treated as complete
+    """
+    async for chunk in responses:
+        if chunk.response:
+            yield escape_text(chunk.response)
+        if getattr(chunk, "done", False):
+            return
+    raise LLMProviderError("Provider stream ended before completion")
+
+
+async def _build_generation_request(
+    query: str,
+    content: List[dict],
+    provider_id: Optional[str],
+    model_id: Optional[str],
+    app_state,
+    stream: bool
+) -> Tuple[GenerationRequest, Dict[str, Any]]:
+    """Build the prompt for an agent answer.
+    
+    Returns:
+        Tuple of (generic generation request, context token report)
+    """
+    provider_id, model_id = _resolve_model(provider_id, model_id)
+    provider_type = await _provider_type(provider_id, app_state)
+    
+    # Fill the model's source budget with the best non-redundant chunks
+    reserved_tokens = (
+        estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(query) + MAX_OUTPUT_TOKENS
+    )
+    token_budget = context_builder.token_budget(provider_type, model_id, reserved_tokens)
+    built_context = context_builder.build(query, content, token_budget)
+    
+    generic_request = GenerationRequest(
+        provider_id=provider_id,
+        model_id=model_id,
+        prompt=f"Question: {query}\n\nContext:\n{built_context.text}",
+        system_prompt=SYSTEM_PROMPT,
+        max_tokens=MAX_OUTPUT_TOKENS,
+        temperature=0.7,
+        stream=stream
+    )
+    return generic_request, built_context.to_dict()
+
+
+async def _provider_type(provider_id: str, app_state) -> str:
+    """Provider type of a configured provider.
+    
+    Ids without a provider config (e.g. the default "anthropic") already name
+    a provider type and are returned unchanged.
+    """
+    llm_factory = getattr(app_state, "llm_factory", None)
+    if llm_factory:
+        try:
+            config = await llm_factory.config_manager.get_provider_config(provider_id)
+        except Exception as e:
+            logger.warning(f"Could not load config for provider {provider_id}: {str(e)}")
+            config = None
+        provider_type = (config or {}).get("provider_type")
+        if provider_type:
+            return getattr(provider_type, "value", provider_type)
+    return provider_id
+
+
+async def _provider_request(provider, generic_request: GenerationRequest):
+    """Convert a generic request to the provider's own request type."""
+    # Determine provider type from class name if provider_type attribute doesn't exist
+    if hasattr(provider, "provider_type"):
+        provider_type = provider.provider_type
+    else:
+        # Extract from class name (e.g., 'AnthropicProvider' -> 'anthropic')
+        provider_type = provider.__class__.__name__.replace('Provider', '').lower()
+    
+    return await _convert_to_provider_request(provider_type, generic_request)
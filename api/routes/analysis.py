@@ -155,8 +155,8 @@ async def test_analyze(
         task_id = str(uuid4())
         url = str(page.url)
         
-        # Store directly in processed_urls with success status
-        pipeline_service.processed_urls[url] = {
+        # Store directly in task status with success status
+        pipeline_service.task_status.set(url, {
             "url": url,
             "status": "completed",  # Mark as completed immediately
             "task_id": task_id,
@@ -168,7 +168,7 @@ async def test_analyze(
             "window_id": getattr(page, "window_id", None),
             "bookmark_id": getattr(page, "bookmark_id", None),
             "message": "Test task completed successfully"
-        }
+        })
         
         logger.info(f"Created test task {task_id} for {url} with completed status")
         
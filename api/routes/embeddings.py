@@ -1,7 +1,7 @@
 # api/routes/embeddings.py
 from fastapi import APIRouter, Depends, Path, Body
 
-from core.utils.logger import get_logger
+from core.utils.logger import Lazy, get_logger
 from api.state import get_app_state
 from api.dependencies import get_graph_service
 from api.models.common import APIResponse
@@ -18,6 +18,10 @@ router = APIRouter(prefix="/embeddings", tags=["embeddings"])
 logger = get_logger(__name__)
 
 
+def _text_sample(text: str, length: int = 50) -> str:
+    return text[:length] + "..." if len(text) > length else text
+
+
 @router.post("/generate", response_model=APIResponse)
 async def generate_embedding(
     request: GenerateEmbeddingRequest = Body(...),
@@ -83,14 +87,11 @@ async def generate_page_embeddings(
     app_state = Depends(get_app_state)
 ):
     """Generate embeddings for a page."""
-    logger.info(f"Received embedding request: {request.model_dump()}")
-    logger.info(f"Starting embedding generation for page {page_id} with provider {request.provider_id}, model {request.model_id}")
-    logger.info(f"RAW PAGE EMBEDDING REQUEST: page_id={page_id}, request={request.model_dump()}")
-
-    if hasattr(request, 'chunk_size') and request.chunk_size:
-        logger.info(f"CHUNK SIZE RECEIVED: {request.chunk_size}, type: {type(request.chunk_size)}")
-    else:
-        logger.warning("NO CHUNK SIZE IN REQUEST")
+    logger.info(
+        "Starting embedding generation for page %s with provider %s, model %s, chunk size %s",
+        page_id, request.provider_id, request.model_id, request.chunk_size
+    )
+    logger.debug("Page embedding request: %s", Lazy(request.model_dump))
 
     if not app_state.embedding_service:
         logger.error("Embedding service not available")
@@ -215,8 +216,11 @@ async def generate_page_embeddings(
                                 
                                 for i, chunk in enumerate(chunks):
                                     try:
-                                        chunk_text_sample = chunk.content[:50] + "..." if len(chunk.content) > 50 else chunk.content
-                                        logger.debug(f"Processing chunk {i+1}/{len(chunks)}: chars {chunk.start_char}-{chunk.end_char}, text: '{chunk_text_sample}'")
+                                        logger.debug(
+                                            "Processing chunk %d/%d: chars %d-%d, text: '%s'",
+                                            i + 1, len(chunks), chunk.start_char, chunk.end_char,
+                                            Lazy(lambda: _text_sample(chunk.content))
+                                        )
                                         
                                         # Get embedding for chunk
                                         chunk_embedding = await provider.get_embedding(
@@ -224,11 +228,7 @@ async def generate_page_embeddings(
                                             model=request.model_id
                                         )
                                         
-                                        # Log the embedding details
-                                        logger.debug(f"Generated embedding for chunk {i+1}: dimension={chunk_embedding.dimension}, model={chunk_embedding.model}")
-                                        
                                         # Store chunk embedding - use the fields directly from the ContentChunk object
-                                        logger.debug(f"Storing chunk {i+1} embedding to database")
                                         store_result = await graph_service.store_chunk_embedding(
                                             tx,
                                             page_id,
@@ -240,7 +240,6 @@ async def generate_page_embeddings(
                                             model=chunk_embedding.model
                                         )
                                         
-                                        logger.debug(f"Chunk {i+1} storage result: {store_result if store_result is not None else 'No result returned'}")
                                         successful_chunks += 1
                                         
                                         # Add to results
@@ -293,8 +292,11 @@ async def generate_page_embeddings(
                                             total_chunks=total_chunks
                                         )
                                         
-                                        chunk_text_sample = chunk.content[:50] + "..." if len(chunk.content) > 50 else chunk.content
-                                        logger.debug(f"Processing chunk {chunk.chunk_index+1}/{chunk.total_chunks}: chars {chunk.start_char}-{chunk.end_char}, text: '{chunk_text_sample}'")
+                                        logger.debug(
+                                            "Processing chunk %d/%d: chars %d-%d, text: '%s'",
+                                            chunk.chunk_index + 1, chunk.total_chunks, chunk.start_char, chunk.end_char,
+                                            Lazy(lambda: _text_sample(chunk.content))
+                                        )
                                         
                                         # Get embedding for chunk
                                         chunk_embedding = await provider.get_embedding(
@@ -303,7 +305,6 @@ async def generate_page_embeddings(
                                         )
                                         
                                         # Store chunk embedding
-                                        logger.debug(f"Storing chunk {chunk.chunk_index+1} embedding to database")
                                         store_result = await graph_service.store_chunk_embedding(
                                             tx,
                                             page_id,
@@ -315,7 +316,6 @@ async def generate_page_embeddings(
                                             model=chunk_embedding.model
                                         )
                                         
-                                        logger.debug(f"Chunk {chunk.chunk_index+1} storage result: {store_result if store_result is not None else 'No result returned'}")
                                         successful_chunks += 1
                                         
                                         # Add to results
@@ -363,8 +363,11 @@ async def generate_page_embeddings(
                                         total_chunks=total_chunks
                                     )
                                     
-                                    chunk_text_sample = chunk.content[:50] + "..." if len(chunk.content) > 50 else chunk.content
-                                    logger.debug(f"Processing chunk {chunk.chunk_index+1}/{chunk.total_chunks}: chars {chunk.start_char}-{chunk.end_char}, text: '{chunk_text_sample}'")
+                                    logger.debug(
+                                        "Processing chunk %d/%d: chars %d-%d, text: '%s'",
+                                        chunk.chunk_index + 1, chunk.total_chunks, chunk.start_char, chunk.end_char,
+                                        Lazy(lambda: _text_sample(chunk.content))
+                                    )
                                     
                                     # Get embedding for chunk
                                     chunk_embedding = await provider.get_embedding(
@@ -373,7 +376,6 @@ async def generate_page_embeddings(
                                     )
                                     
                                     # Store chunk embedding
-                                    logger.debug(f"Storing chunk {chunk.chunk_index+1} embedding to database")
                                     store_result = await graph_service.store_chunk_embedding(
                                         tx,
                                         page_id,
@@ -385,7 +387,6 @@ async def generate_page_embeddings(
                                         model=chunk_embedding.model
                                     )
                                     
-                                    logger.debug(f"Chunk {chunk.chunk_index+1} storage result: {store_result if store_result is not None else 'No result returned'}")
                                     successful_chunks += 1
                                     
                                     # Add to results
@@ -0,0 +1,112 @@
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Optional
+
+from api.models.common import APIResponse
+from api.state import get_app_state
+from core.services.events.event_bus import EventSubscription, TaskEventBus
+from core.utils.logger import get_logger
+
+router = APIRouter(prefix="/events", tags=["events"])
+logger = get_logger(__name__)
+
+# Seconds without events before a keep-alive is sent
+HEARTBEAT_INTERVAL = 15.0
+
+
+def _get_event_bus(app_state=Depends(get_app_state)) -> TaskEventBus:
+    if not getattr(app_state, "event_bus", None):
+        raise HTTPException(status_code=503, detail="Event bus not initialized")
+    return app_state.event_bus
+
+
+@router.get("/stream")
+async def stream_events(
+    topic: Optional[List[str]] = Query(None, description="analysis, agent or queue; all if omitted"),
+    task_id: Optional[List[str]] = Query(None, description="Tasks to follow; all if omitted"),
+    event_bus: TaskEventBus = Depends(_get_event_bus)
+):
+    """Stream task status transitions as Server-Sent Events.
+
+    Replaces polling of the status endpoints. With ``task_id`` the stream
+    starts with each task's latest known state and ends once each of them
+    has sent a ``terminal`` event: an analysis task only ends when every
+    URL has completed or failed, even if it already reports an error.
+    Without it, the stream follows every task of the selected topics for as
+    long as the client stays connected. A ``lagged`` event means
+    transitions were dropped for a slow client and status should be re-read
+    from the polling endpoints.
+    """
+    subscription = event_bus.subscribe(topics=topic, task_ids=task_id)
+    return StreamingResponse(
+        _sse_frames(subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/ws")
+async def websocket_events(
+    websocket: WebSocket,
+    topic: Optional[List[str]] = Query(None),
+    task_id: Optional[List[str]] = Query(None)
+):
+    """Push the same events as /events/stream over a WebSocket as JSON messages."""
+    app_state = get_app_state()
+    if not app_state.event_bus:
+        await websocket.close(code=1013)
+        return
+
+    await websocket.accept()
+    with app_state.event_bus.subscribe(topics=topic, task_ids=task_id) as subscription:
+        try:
+            async for kind, payload in _follow(subscription):
+                await websocket.send_json({"type": kind, **payload})
+            await websocket.close()
+        except WebSocketDisconnect:
+            logger.debug("Event websocket disconnected")
+
+
+@router.get("/stats", response_model=APIResponse)
+async def get_event_stats(event_bus: TaskEventBus = Depends(_get_event_bus)):
+    """Publisher and subscriber counters of the event bus."""
+    return {"success": True, "data": event_bus.stats()}
+
+
+async def _follow(subscription: EventSubscription) -> AsyncIterator[tuple]:
+    """Yield ``(kind, payload)`` pairs until the followed tasks finish."""
+    remaining = set(subscription.task_ids) if subscription.task_ids else None
+    while True:
+        event = await subscription.get(timeout=HEARTBEAT_INTERVAL)
+        if subscription.lagged:
+            subscription.lagged = False
+            yield "lagged", {"dropped": subscription.dropped}
+        if event is None:
+            if subscription.closed:
+                return
+            yield "keep-alive", {}
+            continue
+
+        yield "event", event.to_dict()
+
+        if remaining is not None and event.terminal:
+            remaining.discard(event.task_id)
+            if not remaining:
+                return
+
+
+async def _sse_frames(subscription: EventSubscription) -> AsyncIterator[str]:
+    """Format followed events as SSE frames; the subscription closes with the stream."""
+    with subscription:
+        async for kind, payload in _follow(subscription):
+            if kind == "keep-alive":
+                yield ": keep-alive\n\n"
+            elif kind == "event":
+                yield (
+                    f"id: {payload['sequence']}\n"
+                    f"event: {payload['topic']}\n"
+                    f"data: {json.dumps(payload, default=str)}\n\n"
+                )
+            else:
+                yield f"event: {kind}\ndata: {json.dumps(payload)}\n\n"
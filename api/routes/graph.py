@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, Query
-from typing import List, Optional
+import json
+import hashlib
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Dict, List, Optional
 from urllib.parse import unquote
-from uuid import UUID, uuid4
+from uuid import UUID, uuid4, uuid5, NAMESPACE_URL
 from datetime import datetime
 
 from core.utils.logger import get_logger
@@ -22,6 +25,72 @@ from api.models.graph.response import (
 logger = get_logger(__name__)
 router = APIRouter(prefix="/graph", tags=["graph"])
 
+# Page batch size used when streaming fine-grained overviews
+OVERVIEW_STREAM_BATCH = 200
+
+
+def _stable_id(kind: str, key: str) -> UUID:
+    """Derive a deterministic node id so overview responses are cacheable."""
+    return uuid5(NAMESPACE_URL, f"marvin:{kind}:{key}")
+
+
+def _page_node_id(page_id: Optional[str], url: str) -> UUID:
+    """Use the stored page id when it is a UUID, else derive one from the URL."""
+    if page_id:
+        try:
+            return UUID(str(page_id))
+        except ValueError:
+            pass
+    return _stable_id("page", url)
+
+
+def _page_node(item: Dict[str, Any]) -> GraphNode:
+    return GraphNode(
+        id=_page_node_id(item.get("id"), item["url"]),
+        url=item["url"],
+        domain=item.get("domain") or get_domain_from_url(item["url"]),
+        title=item.get("title"),
+        last_active=item.get("last_active"),
+        node_type="page"
+    )
+
+
+def _page_edge(item: Dict[str, Any]) -> GraphEdge:
+    score = item.get("score")
+    return GraphEdge(
+        source_id=_page_node_id(item.get("source_id"), item["source_url"]),
+        target_id=_page_node_id(item.get("target_id"), item["target_url"]),
+        type=item["rel_type"],
+        strength=0.5 if score is None else float(score),
+        metadata=item.get("properties") or {}
+    )
+
+
+def _cluster_node(group_by: str, item: Dict[str, Any]) -> GraphNode:
+    return GraphNode(
+        id=_stable_id(group_by, item["key"]),
+        title=item["key"],
+        domain=item["key"] if group_by == "domain" else None,
+        node_type=group_by,
+        size=item["size"]
+    )
+
+
+def _cluster_edge(group_by: str, item: Dict[str, Any], max_weight: int) -> GraphEdge:
+    return GraphEdge(
+        source_id=_stable_id(group_by, item["source"]),
+        target_id=_stable_id(group_by, item["target"]),
+        type=item["type"],
+        strength=item["weight"] / max_weight if max_weight else 0.0,
+        metadata={"weight": item["weight"]}
+    )
+
+
+def _ndjson(kind: str, data: Any) -> str:
+    if hasattr(data, "model_dump"):
+        data = data.model_dump(mode="json")
+    return json.dumps({"type": kind, "data": data}, default=str) + "\n"
+
 @router.get("/related/{url:path}", response_model=GraphResponse)
 async def get_related_pages(
     url: str,
@@ -209,6 +278,7 @@ async def get_graph_overview(
             RETURN 
                 p,
                 id(p) as node_id,
+                p.id as page_id,
                 p.url as url,
                 p.domain as domain,
                 p.title as title,
@@ -230,8 +300,8 @@ async def get_graph_overview(
                 node_id = item["node_id"]
                 node_ids.add(node_id)
                 
-                # Generate a UUID for each node instead of trying to convert the Neo4j ID
-                generated_uuid = uuid4()
+                # Stable id so repeated overview requests agree on node identity
+                generated_uuid = _page_node_id(item.get("page_id"), item["url"])
                 id_mapping[node_id] = generated_uuid
                 
                 nodes.append(GraphNode(
@@ -318,6 +388,232 @@ async def get_graph_overview(
         )
     
 
+@router.get("/overview/lod", response_model=GraphResponse)
+async def get_graph_overview_lod(
+    request: Request,
+    response: Response,
+    level: str = Query(default="coarse", pattern="^(coarse|fine)$"),
+    group_by: str = Query(default="domain", pattern="^(domain|keyword)$"),
+    cluster: Optional[str] = Query(default=None, description="Domain or keyword to expand at fine level"),
+    after: Optional[str] = Query(default=None, description="URL cursor from a previous fine-level response"),
+    limit: int = Query(default=100, ge=1, le=5000),
+    stream: bool = Query(default=False, description="Stream nodes and edges as NDJSON"),
+    app_state = Depends(get_app_state)
+):
+    """
+    Get a level-of-detail overview of the knowledge graph.
+    
+    At the coarse level pages are aggregated into domain or keyword
+    super-nodes with page counts; at the fine level real pages are returned,
+    optionally restricted to one cluster and paged by URL cursor. Responses
+    carry an ETag derived from the request and a cheap graph version key,
+    which is checked before any overview query runs. With
+    ``stream=true`` the result is emitted as NDJSON lines
+    (``meta``, ``node``, ``edge``, ``end``) for progressive rendering.
+    """
+    graph_service: Optional[GraphService] = app_state.graph_service
+    if graph_service is None:
+        return GraphResponse(
+            success=False,
+            error={
+                "error_code": "SERVICE_ERROR",
+                "message": "Graph service not available"
+            },
+            metadata={"timestamp": datetime.now().isoformat()}
+        )
+    
+    if stream:
+        return StreamingResponse(
+            _stream_overview(graph_service, level, group_by, cluster, after, limit),
+            media_type="application/x-ndjson"
+        )
+    
+    try:
+        logger.info(f"Getting {level} graph overview (group_by={group_by}, cluster={cluster}, limit={limit})")
+        
+        version = await graph_service.get_graph_version()
+        etag_source = json.dumps([version, level, group_by, cluster, after, limit])
+        etag = '"' + hashlib.sha1(etag_source.encode()).hexdigest() + '"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        
+        if level == "coarse":
+            clusters = await graph_service.get_overview_clusters(group_by, limit)
+            keys = [item["key"] for item in clusters]
+            cluster_edges = await graph_service.get_cluster_edges(keys, group_by)
+            max_weight = max((item["weight"] for item in cluster_edges), default=0)
+            
+            nodes = [_cluster_node(group_by, item) for item in clusters]
+            edges = [_cluster_edge(group_by, item, max_weight) for item in cluster_edges]
+            next_cursor = None
+        else:
+            pages = await graph_service.get_overview_pages(group_by, cluster, after, limit)
+            urls = [item["url"] for item in pages]
+            page_edges = await graph_service.get_page_edges(urls, urls, limit=limit * 2)
+            
+            nodes = [_page_node(item) for item in pages]
+            edges = [_page_edge(item) for item in page_edges]
+            next_cursor = urls[-1] if len(urls) == limit else None
+        
+        graph_data = GraphData(
+            nodes=nodes,
+            edges=edges,
+            metadata={
+                "level": level,
+                "group_by": group_by,
+                "cluster": cluster,
+                "node_count": len(nodes),
+                "edge_count": len(edges),
+                "next_cursor": next_cursor
+            }
+        )
+        
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, max-age=30"
+        
+        return GraphResponse(
+            success=True,
+            data=graph_data,
+            metadata={"timestamp": datetime.now().isoformat()}
+        )
+    except Exception as e:
+        logger.error(f"Error getting graph overview: {str(e)}", exc_info=True)
+        return GraphResponse(
+            success=False,
+            error={
+                "error_code": "GRAPH_ERROR",
+                "message": f"Failed to get graph overview: {str(e)}",
+                "details": {"level": level, "group_by": group_by}
+            },
+            metadata={"timestamp": datetime.now().isoformat()}
+        )
+
+
+async def _stream_overview(
+    graph_service: GraphService,
+    level: str,
+    group_by: str,
+    cluster: Optional[str],
+    after: Optional[str],
+    limit: int
+) -> AsyncIterator[str]:
+    """Yield an overview as NDJSON, fetching fine-level pages in batches."""
+    yield _ndjson("meta", {
+        "level": level,
+        "group_by": group_by,
+        "cluster": cluster,
+        "timestamp": datetime.now().isoformat()
+    })
+    
+    node_count = 0
+    edge_count = 0
+    next_cursor = None
+    try:
+        if level == "coarse":
+            clusters = await graph_service.get_overview_clusters(group_by, limit)
+            for item in clusters:
+                yield _ndjson("node", _cluster_node(group_by, item))
+            node_count = len(clusters)
+            
+            cluster_edges = await graph_service.get_cluster_edges(
+                [item["key"] for item in clusters], group_by
+            )
+            max_weight = max((item["weight"] for item in cluster_edges), default=0)
+            for item in cluster_edges:
+                yield _ndjson("edge", _cluster_edge(group_by, item, max_weight))
+            edge_count = len(cluster_edges)
+        else:
+            seen_urls: List[str] = []
+            cursor = after
+            while node_count < limit:
+                batch_size = min(OVERVIEW_STREAM_BATCH, limit - node_count)
+                pages = await graph_service.get_overview_pages(group_by, cluster, cursor, batch_size)
+                if not pages:
+                    break
+                
+                batch_urls = [item["url"] for item in pages]
+                for item in pages:
+                    yield _ndjson("node", _page_node(item))
+                node_count += len(pages)
+                seen_urls.extend(batch_urls)
+                
+                # Edges between this batch and everything emitted so far
+                page_edges = await graph_service.get_page_edges(
+                    batch_urls, seen_urls, limit=batch_size * 2
+                )
+                for item in page_edges:
+                    yield _ndjson("edge", _page_edge(item))
+                edge_count += len(page_edges)
+                
+                cursor = batch_urls[-1]
+                if len(pages) < batch_size:
+                    break
+            else:
+                next_cursor = cursor
+    except Exception as e:
+        logger.error(f"Error streaming graph overview: {str(e)}", exc_info=True)
+        yield _ndjson("error", {"error_code": "GRAPH_ERROR", "message": str(e)})
+        return
+    
+    yield _ndjson("end", {
+        "node_count": node_count,
+        "edge_count": edge_count,
+        "next_cursor": next_cursor
+    })
+
+
+@router.get("/keywords/{keyword}/related", response_model=GraphResponse)
+async def get_related_keywords(
+    keyword: str,
+    limit: int = Query(10, ge=1, le=100),
+    app_state = Depends(get_app_state)
+):
+    """Return a keyword's precomputed co-occurrence neighbourhood.
+
+    Neighbours are ranked by NPMI across all stored pages and served from
+    the co-occurrence service's memory rather than a graph traversal.
+    """
+    service = app_state.cooccurrence_service
+    if not service:
+        return GraphResponse(
+            success=False,
+            error={
+                "error_code": "SERVICE_ERROR",
+                "message": "Keyword co-occurrence service not available"
+            }
+        )
+
+    keyword = unquote(keyword)
+    neighbours = service.get_neighbours(keyword, limit=limit)
+    center_id = _stable_id("keyword", keyword.lower())
+    nodes = [GraphNode(id=center_id, title=keyword, node_type="keyword")]
+    edges = []
+    for neighbour in neighbours:
+        neighbour_id = _stable_id("keyword", neighbour.keyword)
+        nodes.append(GraphNode(
+            id=neighbour_id,
+            title=neighbour.keyword,
+            node_type="keyword",
+            size=neighbour.count
+        ))
+        edges.append(GraphEdge(
+            source_id=center_id,
+            target_id=neighbour_id,
+            type="RELATED_TO",
+            strength=max(0.0, neighbour.npmi),
+            metadata={"npmi": neighbour.npmi, "pmi": neighbour.pmi, "count": neighbour.count}
+        ))
+
+    return GraphResponse(
+        success=True,
+        data=GraphData(
+            nodes=nodes,
+            edges=edges,
+            metadata={"keyword": keyword, **service.stats()}
+        )
+    )
+
+
 @router.post("/initialize-schema", response_model=GraphResponse)
 async def initialize_schema(
     graph_service: GraphService = Depends(get_graph_service),
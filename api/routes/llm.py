@@ -6,6 +6,7 @@ from api.state import get_app_state
 from core.utils.logger import get_logger
 from api.models.llm.request import GenerationRequest, ModelListRequest
 from api.models.common import APIResponse
+from core.llm.common.streaming import coalesce_deltas, sse_text_frame
 
 
 
@@ -34,6 +35,23 @@ async def generate_completion(
             
             # Handle non-streaming response
             if not request.stream:
+                cache = getattr(app_state, "response_cache", None)
+                cache_key = None
+                if cache is not None:
+                    cache_key = cache.make_key(
+                        cache.make_scope(request.provider_id, request.model_id),
+                        request.prompt,
+                        {
+                            "system_prompt": request.system_prompt,
+                            "temperature": request.temperature,
+                            "max_tokens": request.max_tokens,
+                            "additional_params": request.additional_params
+                        }
+                    )
+                    cached = cache.get(cache_key)
+                    if cached is not None:
+                        return {"success": True, "data": cached, "metadata": {"cached": True}}
+                
                 response_data = {}
                 async for response in provider.generate(provider_request):
                     response_data = {
@@ -46,6 +64,9 @@ async def generate_completion(
                         }
                     }
                 
+                if cache_key and response_data:
+                    cache.put(cache_key, response_data)
+                
                 return {"success": True, "data": response_data}
             
             # Handle streaming response
@@ -59,8 +80,23 @@ async def generate_completion(
                     logger.error(f"Error in stream generation: {str(e)}", exc_info=True)
                     yield f"data: {json.dumps({'error': str(e)})}\n\n"
             
+            # Providers exposing raw deltas are forwarded without a per-token
+            # object and JSON round-trip, coalesced into time-based frames
+            async def passthrough_stream():
+                try:
+                    async for frame in coalesce_deltas(provider.stream_text_deltas(provider_request)):
+                        yield sse_text_frame(frame)
+                    yield sse_text_frame(b"", done=True)
+                except Exception as e:
+                    logger.error(f"Error in stream generation: {str(e)}", exc_info=True)
+                    yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            
+            stream = (
+                passthrough_stream() if hasattr(provider, "stream_text_deltas")
+                else generate_stream()
+            )
             return StreamingResponse(
-                generate_stream(),
+                stream,
                 media_type="text/event-stream"
             )
     except Exception as e:
@@ -127,6 +163,16 @@ async def list_providers(
         logger.error(f"Error listing providers: {str(e)}", exc_info=True)
         return {"success": False, "error": str(e)}
 
+@router.get("/cache/stats", response_model=APIResponse)
+async def get_cache_stats(
+    app_state = Depends(get_app_state)
+):
+    """Get response cache hit-rate metrics"""
+    cache = getattr(app_state, "response_cache", None)
+    if cache is None:
+        return {"success": False, "error": "Response cache not initialized"}
+    return {"success": True, "data": cache.stats()}
+
 async def _convert_to_provider_request(provider_type, request: GenerationRequest):
     """Convert generic request to provider-specific request"""
     # If provider_type is an object with provider_type attribute, use that
@@ -16,6 +16,9 @@ from core.utils.logger import get_logger
 logger = get_logger(__name__)
 router = APIRouter(prefix="/pages", tags=["pages"])
 
+# Heavy properties loaded with listings because PageData includes them
+LISTING_PROPERTIES = ("keywords_json", "custom_metadata_json")
+
 
 def create_page_data(page: Page) -> PageData:
     """Convert a Page domain object to PageData API model."""
@@ -230,7 +233,9 @@ async def query_pages(
                 limit=limit,
                 offset=offset,
                 include_relationships=include_relationships,
-                sort_by=sort_by
+                sort_by=sort_by,
+                # PageData reports keywords and custom metadata
+                properties=LISTING_PROPERTIES
             )
             await tx.commit()
             
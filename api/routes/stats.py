@@ -2,9 +2,9 @@ from fastapi import APIRouter, Depends, Query
 from datetime import datetime
 from typing import List, Optional
 
-from core.services.content.page_service import PageService
-from core.infrastructure.database.transactions import Transaction
-from api.dependencies import get_page_service
+from core.infrastructure.database.db_connection import DatabaseConnection
+from core.services.stats.stats_service import StatsService
+from api.dependencies import get_app_db_connection, get_stats_service
 from api.models.stats.response import StatsData, StatsResponse
 from core.utils.logger import get_logger
 
@@ -32,13 +32,36 @@ async def get_stats(
         False,
         description="Whether to include detailed statistics"
     ),
-    page_service: PageService = Depends(get_page_service)
+    stats_service: Optional[StatsService] = Depends(get_stats_service),
+    db_connection: DatabaseConnection = Depends(get_app_db_connection)
 ):
-    """Get system statistics."""
-    tx = Transaction()
+    """Get system statistics.
+    
+    Served from the incrementally maintained counters when available; falls
+    back to querying the graph directly otherwise.
+    """
     try:
-        # Access the connection through the graph operations
-        db_connection = page_service.graph_service.graph_operations.connection
+        if stats_service and stats_service.is_ready:
+            stats = stats_service.get_stats(start_date, end_date, detailed)
+            stats_data = StatsData(
+                captures=stats["captures"],
+                relationships=stats["relationships"],
+                queries=stats["queries"],
+                last_updated=stats["last_updated"],
+                details=stats.get("details")
+            )
+            return StatsResponse(
+                success=True,
+                data=stats_data,
+                error=None,
+                metadata={
+                    "timestamp": datetime.now().isoformat(),
+                    "source": "counters",
+                    "last_reconciled": stats["last_reconciled"]
+                }
+            )
+        
+        logger.warning("Stats counters unavailable, computing stats from graph")
         
         # Build date filter parameters
         params = {}
@@ -62,15 +85,14 @@ async def get_stats(
         captures_result = await db_connection.execute_query(
             captures_query,
             parameters=params,
-            transaction=tx
+            read_only=True
         )
         captures = captures_result[0]["count"] if captures_result else 0
         
         # Get relationship count - no date filtering for now
-        relationships_query = "MATCH ()-[r]->() RETURN count(r) as count"
         relationships_result = await db_connection.execute_query(
-            relationships_query,
-            transaction=tx
+            "MATCH ()-[r]->() RETURN count(r) as count",
+            read_only=True
         )
         relationships = relationships_result[0]["count"] if relationships_result else 0
         
@@ -85,17 +107,14 @@ async def get_stats(
         queries_result = await db_connection.execute_query(
             queries_query,
             parameters=params,
-            transaction=tx
+            read_only=True
         )
         queries = queries_result[0]["count"] if queries_result else 0
         
         # Prepare details if requested
         details = None
         if detailed:
-            details = await get_detailed_stats(db_connection, tx, start_date, end_date, params)
-        
-        # Commit transaction
-        await tx.commit()
+            details = await get_detailed_stats(db_connection, start_date, end_date, params)
         
         # Create response with all collected data
         stats_data = StatsData(
@@ -110,15 +129,13 @@ async def get_stats(
             success=True,
             data=stats_data,
             error=None,
-            metadata={"timestamp": datetime.now().isoformat()}
+            metadata={"timestamp": datetime.now().isoformat(), "source": "graph"}
         )
     except Exception as e:
-        # Ensure rollback on any error
-        await tx.rollback()
         logger.error(f"Error getting stats: {str(e)}", exc_info=True)
         raise
 
-async def get_detailed_stats(db_connection, tx, start_date=None, end_date=None, params=None):
+async def get_detailed_stats(db_connection, start_date=None, end_date=None, params=None):
     """Get detailed statistics."""
     details = {}
     params = params or {}
@@ -138,7 +155,7 @@ async def get_detailed_stats(db_connection, tx, start_date=None, end_date=None,
     domains_result = await db_connection.execute_query(
         domains_query,
         parameters=params,
-        transaction=tx
+        read_only=True
     )
     details["top_domains"] = [
         {"domain": item["domain"], "count": item["count"]} 
@@ -160,7 +177,7 @@ async def get_detailed_stats(db_connection, tx, start_date=None, end_date=None,
     contexts_result = await db_connection.execute_query(
         contexts_query,
         parameters=params,
-        transaction=tx
+        read_only=True
     )
     details["context_distribution"] = [
         {"context": item["context"], "count": item["count"]} 
@@ -170,7 +187,7 @@ async def get_detailed_stats(db_connection, tx, start_date=None, end_date=None,
     # Relationship types - no date filtering
     relationship_types_result = await db_connection.execute_query(
         "MATCH ()-[r]->() RETURN type(r) as type, count(r) as count ORDER BY count DESC",
-        transaction=tx
+        read_only=True
     )
     details["relationship_types"] = [
         {"type": item["type"], "count": item["count"]} 
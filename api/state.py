@@ -8,6 +8,7 @@ from pathlib import Path
 from core.services.graph.graph_service import GraphService
 from core.infrastructure.database.db_connection import DatabaseConnection, ConnectionConfig
 from core.infrastructure.database.graph_operations import GraphOperationManager
+from core.infrastructure.database.metrics import QueryMetricsConfig
 from core.infrastructure.database.schema import SchemaManager
 from core.infrastructure.embeddings.factory import EmbeddingProviderFactory
 from core.utils.logger import get_logger
@@ -20,11 +21,19 @@ from core.llm.factory.factory import LLMProviderFactory
 from core.llm.providers.config.config_manager import ProviderConfigManager
 from core.services.embeddings.embedding_service import EmbeddingService
 from core.services.content.pipeline_service import PipelineService
+from core.services.events.event_bus import TaskEventBus, EventBusConfig
+from core.services.stats.stats_service import StatsService
+from core.services.graph.cooccurrence_service import KeywordCooccurrenceService, CooccurrenceConfig
+from core.services.retrieval.retrieval_service import HybridRetrievalService, RetrievalConfig
+from core.llm.cache.response_cache import ResponseCache, ResponseCacheConfig
+from core.domain.content.document_frequency import DocumentFrequencyStore, DocumentFrequencyConfig
 from core.domain.content.pipeline import (
     DefaultStateManager,
     DefaultComponentCoordinator,
     DefaultEventSystem,
-    PipelineConfig
+    PipelineConfig,
+    ProcessingEvent,
+    ProcessingStage
 )
 
 
@@ -37,13 +46,22 @@ class AppState:
         self.schema_manager: Optional[SchemaManager] = None
         self.embedding_factory: Optional[EmbeddingProviderFactory] = None
         self.embedding_service: Optional[EmbeddingService] = None
+        self.stats_service: Optional[StatsService] = None
+        self.cooccurrence_service: Optional[KeywordCooccurrenceService] = None
+        self.retrieval_service: Optional[HybridRetrievalService] = None
+        self.response_cache: Optional[ResponseCache] = None
+        self.df_store: Optional[DocumentFrequencyStore] = None
+        self.event_bus: Optional[TaskEventBus] = None
         self.logger = get_logger(__name__)
         self._auth_config = None
         self.llm_factory: Optional[LLMProviderFactory] = None
         self.llm_providers: Dict[str, BaseLLMProvider] = {}
         self.agent_tasks: Dict[str, Dict[str, Any]] = {}
         self._health_check_task: Optional[asyncio.Task] = None
+        self._warm_up_task: Optional[asyncio.Task] = None
         self._shutdown_requested: bool = False
+        # Warm-up status per component: pending, ready, degraded or failed
+        self.readiness: Dict[str, str] = {}
         
 
     async def initialize(self) -> None:
@@ -65,7 +83,11 @@ class AppState:
                 username=config["neo4j_username"],
                 password=config["neo4j_password"],
                 max_connection_pool_size=int(config.get("max_connection_pool_size", 50)),
-                connection_timeout=int(config.get("connection_timeout", 30))
+                connection_timeout=int(config.get("connection_timeout", 30)),
+                query_metrics_config=QueryMetricsConfig(
+                    slow_query_threshold=float(config.get("slow_query_threshold", 1.0)),
+                    profile_slow_queries=str(config.get("profile_slow_queries", "false")).lower() == "true"
+                )
             )
             self.logger.info(f"Creating database connection (pool size: {db_config.max_connection_pool_size})")
             self.db_connection = DatabaseConnection(db_config)
@@ -78,10 +100,8 @@ class AppState:
             except Exception as pool_error:
                 self.logger.warning(f"Could not check connection pool: {str(pool_error)}")
 
-            # Initialize schema manager
-            self.logger.info("Initializing schema manager")
+            # Schema creation runs during warm-up
             self.schema_manager = SchemaManager(self.db_connection)
-            await self.schema_manager.initialize()
 
             # Initialize graph service BEFORE embedding service
             try:
@@ -95,6 +115,18 @@ class AppState:
                 self.logger.error(f"Failed to initialize graph service: {str(e)}", exc_info=True)
                 self.graph_service = None  # Explicitly set to None on failure
 
+            # Initialize stats counters (seeded from the graph once, then maintained incrementally)
+            try:
+                self.logger.info("Initializing stats service")
+                self.stats_service = StatsService(
+                    self.db_connection,
+                    reconcile_interval=int(config.get("stats_reconcile_interval", 300))
+                )
+                await self.stats_service.initialize()
+            except Exception as e:
+                self.logger.error(f"Failed to initialize stats service: {str(e)}", exc_info=True)
+                self.stats_service = None
+
             # Create pipeline config
             pipeline_config = PipelineConfig(
                 max_concurrent_pages=int(config.get("max_concurrent_pages", 10)),
@@ -110,6 +142,14 @@ class AppState:
             provider_config_manager = ProviderConfigManager(config_path)
             self.llm_factory = LLMProviderFactory(provider_config_manager)
 
+            # Response cache for completions and agent answers
+            self.response_cache = ResponseCache(ResponseCacheConfig(
+                max_entries=int(config.get("llm_cache_max_entries", 512)),
+                ttl_seconds=float(config.get("llm_cache_ttl_seconds", 3600)),
+                similarity_threshold=float(config.get("llm_cache_similarity_threshold", 0.95)),
+                enable_semantic=str(config.get("llm_cache_semantic", "false")).lower() == "true"
+            ))
+
             # Register LLM providers with factory
             self.logger.info("Registering Anthropic provider")
             self.llm_factory.register_provider(ProviderType.ANTHROPIC, AnthropicProvider)
@@ -141,22 +181,48 @@ class AppState:
                 self.embedding_factory = None  # Explicitly set to None
                 self.embedding_service = None 
 
-            # Initialize embedding schema if both services are available
-            if self.embedding_service is not None and self.graph_service is not None:
-                try:
-                    self.logger.info("Initializing embedding schema")
-                    
-                    # Create a transaction for schema initialization
-                    async with self.db_connection.transaction() as tx:
-                        # Initialize schema
-                        success = await self.embedding_service.initialize_schema(tx)
-                        
-                        if success:
-                            self.logger.info("Embedding schema initialized successfully")
-                        else:
-                            self.logger.warning("Embedding schema initialization returned False")
-                except Exception as e:
-                    self.logger.error(f"Failed to initialize embedding schema: {str(e)}", exc_info=True)
+            # Initialize hybrid retrieval (vector sources need the embedding service)
+            if self.graph_service is not None:
+                self.logger.info("Initializing hybrid retrieval service")
+                self.retrieval_service = HybridRetrievalService(
+                    graph_service=self.graph_service,
+                    embedding_service=self.embedding_service,
+                    config=RetrievalConfig(
+                        latency_budget=float(config.get("retrieval_latency_budget", 1.5))
+                    )
+                )
+
+            # Cross-page keyword co-occurrence (RELATED_TO edges)
+            try:
+                self.logger.info("Initializing keyword co-occurrence service")
+                self.cooccurrence_service = KeywordCooccurrenceService(
+                    self.db_connection,
+                    CooccurrenceConfig(
+                        top_k=int(config.get("cooccurrence_top_k", 10)),
+                        flush_interval=float(config.get("cooccurrence_flush_interval", 30))
+                    )
+                )
+                await self.cooccurrence_service.initialize()
+            except Exception as e:
+                self.logger.error(f"Failed to initialize co-occurrence service: {str(e)}", exc_info=True)
+                self.cooccurrence_service = None
+
+            # Corpus document frequencies for TF-IDF keyword scoring
+            try:
+                storage_path = Path(config.get("storage_path", "./storage"))
+                self.df_store = DocumentFrequencyStore(DocumentFrequencyConfig(
+                    path=str(storage_path / "document_frequency.sqlite"),
+                    min_documents=int(config.get("df_min_documents", 20))
+                ))
+            except Exception as e:
+                self.logger.error(f"Failed to open document frequency store: {str(e)}", exc_info=True)
+                self.df_store = None
+
+            # Task status events for streaming clients
+            self.event_bus = TaskEventBus(EventBusConfig(
+                max_pending=int(config.get("event_max_pending", 256)),
+                max_snapshots=int(config.get("event_max_snapshots", 1024))
+            ))
 
             # Create pipeline dependencies
             self.logger.info("Creating pipeline components")
@@ -172,9 +238,27 @@ class AppState:
                 component_coordinator=component_coordinator,
                 event_system=event_system,
                 config=pipeline_config,
-                db_connection=self.db_connection
+                db_connection=self.db_connection,
+                stats_service=self.stats_service,
+                df_store=self.df_store,
+                cooccurrence_service=self.cooccurrence_service,
+                event_bus=self.event_bus
             )
             await self.pipeline_service.initialize()
+            self.pipeline_service.pipeline.register_event_handler(self._invalidate_cached_responses)
+
+            # Schema creation and NLP model loading. With lazy startup they run
+            # after the server starts accepting requests and /health/ready
+            # reports when they are done; otherwise startup waits for them.
+            self.readiness = {name: "pending" for name in self._warm_up_steps()}
+            if str(config.get("lazy_startup", "true")).lower() == "true":
+                self.logger.info("Deferring schema and NLP warm-up to the background")
+                self._warm_up_task = asyncio.create_task(self.warm_up())
+            else:
+                await self.warm_up()
+                failed = [name for name, status in self.readiness.items() if status == "failed"]
+                if failed:
+                    raise RuntimeError(f"Warm-up failed for: {', '.join(failed)}")
             
             # Initialize auth config
             self.logger.info("Initializing auth provider configuration")
@@ -198,10 +282,71 @@ class AppState:
             raise
 
 
+    def _warm_up_steps(self) -> Dict[str, Any]:
+        """Warm-up steps by component name, in the order they run."""
+        steps = {"schema": self.schema_manager.initialize}
+        if self.embedding_service is not None:
+            steps["embedding_schema"] = self._initialize_embedding_schema
+        steps["nlp"] = self.pipeline_service.warm_up
+        return steps
+
+    async def warm_up(self) -> None:
+        """Run the warm-up steps, recording each component's readiness.
+
+        A step that raises is marked ``failed``; one that returns False
+        (e.g. no spaCy model available) is marked ``degraded``, as the
+        service still works without it.
+        """
+        start_time = time.time()
+        for name, step in self._warm_up_steps().items():
+            try:
+                self.logger.info(f"Warming up {name}")
+                result = await step()
+                self.readiness[name] = "degraded" if result is False else "ready"
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Warm-up of {name} failed: {str(e)}", exc_info=True)
+                self.readiness[name] = "failed"
+        self.logger.info(f"Warm-up finished in {time.time() - start_time:.2f}s: {self.readiness}")
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether warm-up finished without a failed component."""
+        return bool(self.readiness) and all(
+            status in ("ready", "degraded") for status in self.readiness.values()
+        )
+
+    async def _initialize_embedding_schema(self) -> bool:
+        """Create the vector indexes used by the embedding service.
+
+        Failures are logged and reported as degraded rather than raised, as
+        the rest of the API works without vector search.
+        """
+        try:
+            async with self.db_connection.transaction() as tx:
+                success = await self.embedding_service.initialize_schema(tx)
+        except Exception as e:
+            self.logger.error(f"Failed to initialize embedding schema: {str(e)}", exc_info=True)
+            return False
+        if success:
+            self.logger.info("Embedding schema initialized successfully")
+        else:
+            self.logger.warning("Embedding schema initialization returned False")
+        return bool(success)
+
     async def cleanup(self) -> None:
         """Cleanup application services with enhanced error handling."""
         self.logger.info("Beginning application cleanup")
         self._shutdown_requested = True
+
+        if self._warm_up_task and not self._warm_up_task.done():
+            self.logger.debug("Cancelling warm-up task")
+            self._warm_up_task.cancel()
+            try:
+                await self._warm_up_task
+            except asyncio.CancelledError:
+                self.logger.debug("Warm-up task cancelled")
         
         # Cancel health check task first
         if self._health_check_task:
@@ -228,6 +373,26 @@ class AppState:
                 self.logger.error(error_msg)
                 cleanup_errors.append(error_msg)
         
+        # Stop stats reconciliation
+        if self.stats_service:
+            try:
+                self.logger.debug("Cleaning up stats service")
+                await self.stats_service.cleanup()
+            except Exception as e:
+                error_msg = f"Error cleaning up stats service: {str(e)}"
+                self.logger.error(error_msg)
+                cleanup_errors.append(error_msg)
+
+        # Flush pending co-occurrence edges while the database is still open
+        if self.cooccurrence_service:
+            try:
+                self.logger.debug("Cleaning up co-occurrence service")
+                await self.cooccurrence_service.cleanup()
+            except Exception as e:
+                error_msg = f"Error cleaning up co-occurrence service: {str(e)}"
+                self.logger.error(error_msg)
+                cleanup_errors.append(error_msg)
+
         # Clean up LLM providers
         if self.llm_factory:
             try:
@@ -295,6 +460,16 @@ class AppState:
         else:
             self.logger.info("Application cleanup completed successfully")
 
+    def _invalidate_cached_responses(self, event: ProcessingEvent) -> None:
+        """Drop cached LLM responses that used a page which was just re-processed."""
+        if event.stage != ProcessingStage.COMPLETE or not self.response_cache:
+            return
+        page = event.metadata.get("page_object")
+        if page is None:
+            return
+        self.response_cache.invalidate_source(page.url)
+        self.response_cache.invalidate_source(str(page.id))
+
     # Property for config_dir
     @property
     def config_dir(self) -> str:
@@ -2,10 +2,16 @@ import asyncio
 import uuid
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Sequence
 
+from core.services.events.event_bus import TaskEventBus
 from core.utils.logger import get_logger
 
+
+# Called with the data of a newly created task
+TaskCreatedHook = Callable[[Dict[str, Any]], None]
+
+
 class TaskManager:
     """
     Reusable task management system for async tasks with DI support.
@@ -14,14 +20,24 @@ class TaskManager:
     creation, monitoring, and cleanup capabilities.
     """
     
-    def __init__(self, component_name: str):
+    def __init__(
+        self,
+        component_name: str,
+        event_bus: Optional[TaskEventBus] = None,
+        on_task_created: Sequence[TaskCreatedHook] = ()
+    ):
         """
         Initialize the task manager for a specific component.
         
         Args:
             component_name: Name of the component (used for path and logging)
+            event_bus: Optional bus that task transitions are published to,
+                using the component name as topic
+            on_task_created: Hooks run with the data of each new task
         """
         self.component_name = component_name
+        self.event_bus = event_bus
+        self.on_task_created = list(on_task_created)
         self.tasks: Dict[str, Dict[str, Any]] = {}
         self.logger = get_logger(f"task_manager.{component_name}")
         self.status_path = f"/api/v1/{component_name}/status/"
@@ -75,6 +91,8 @@ class TaskManager:
         }
         
         self.logger.info(f"Created {self.component_name} task: {task_id}")
+        self._notify_task_created(task_id)
+        self._publish(task_id)
         return task_id
     
     async def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
@@ -101,18 +119,46 @@ class TaskManager:
             True if task was found and updated, False otherwise
         """
         if task_id in self.tasks:
+            old_status = self.tasks[task_id].get("status", "unknown")
             self.tasks[task_id].update(updates)
             
             # Log status transitions
             if "status" in updates:
                 new_status = updates["status"]
-                old_status = self.tasks[task_id].get("status", "unknown")
                 if new_status != old_status:
                     self.logger.info(f"Task {task_id} status changed: {old_status} -> {new_status}")
             
+            self._publish(task_id)
             return True
         return False
     
+    def _notify_task_created(self, task_id: str) -> None:
+        """Run the task-created hooks; a failing hook never fails task creation."""
+        for hook in self.on_task_created:
+            try:
+                hook(self.tasks[task_id]["data"])
+            except Exception as e:
+                self.logger.warning(f"Task created hook failed for {task_id}: {str(e)}")
+
+    def _publish(self, task_id: str) -> None:
+        """Publish the current state of a task to the event bus."""
+        if not self.event_bus:
+            return
+        task = self.tasks[task_id]
+        data = {}
+        if task["status"] == "completed" and task.get("result"):
+            data["result"] = task["result"]
+        if task["status"] == "error" and task.get("error"):
+            data["error"] = task["error"]
+        self.event_bus.publish(
+            self.component_name,
+            task_id,
+            task["status"],
+            progress=task.get("progress", 0.0),
+            message=task.get("message"),
+            data=data
+        )
+    
     async def get_status_response(self, task_id: str) -> Dict[str, Any]:
         """
         Get a standardized status response for a task.
@@ -0,0 +1,258 @@
+import hashlib
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket allowing ``requests`` per ``window_seconds``, refilled continuously."""
+    requests: int
+    window_seconds: float = 60.0
+
+    @property
+    def rate(self) -> float:
+        return self.requests / self.window_seconds
+
+
+@dataclass(frozen=True)
+class RateDecision:
+    allowed: bool
+    remaining: int
+    retry_after: float
+
+
+@dataclass
+class RateLimitConfig:
+    """Configuration for API rate limiting.
+
+    Attributes:
+        default: Limit applied per client when nothing more specific matches
+        routes: Limits by path prefix; the longest matching prefix wins and
+            gets its own bucket
+        tokens: Limits by bearer token, overriding the route or default limit
+        idle_ttl: Seconds after which an unused bucket is dropped; a bucket
+            idle for a full window is full again, so this only frees memory
+        max_keys: Buckets kept in memory before the least recently used are dropped
+        sqlite_path: Share buckets between worker processes through this
+            SQLite file instead of keeping them in process memory
+        sqlite_busy_timeout: Seconds to wait for the SQLite write lock before
+            failing open
+    """
+    default: RateLimit = field(default_factory=lambda: RateLimit(60, 60.0))
+    routes: Dict[str, RateLimit] = field(default_factory=dict)
+    tokens: Dict[str, RateLimit] = field(default_factory=dict)
+    idle_ttl: float = 3600.0
+    max_keys: int = 100_000
+    sqlite_path: Optional[str] = None
+    sqlite_busy_timeout: float = 0.25
+
+    def __post_init__(self):
+        # Longest prefix first, so the most specific route matches
+        self._route_prefixes = sorted(self.routes, key=len, reverse=True)
+
+    def resolve(self, path: str, token: Optional[str]) -> Tuple[str, RateLimit]:
+        """Route key and limit for a request.
+
+        Args:
+            path: Request path
+            token: Bearer token, if any
+
+        Returns:
+            The matched route prefix (``*`` for the default) and its limit
+        """
+        route, limit = "*", self.default
+        for prefix in self._route_prefixes:
+            if path.startswith(prefix):
+                route, limit = prefix, self.routes[prefix]
+                break
+        if token is not None and token in self.tokens:
+            limit = self.tokens[token]
+        return route, limit
+
+
+def parse_rate_limits(spec: str) -> Dict[str, RateLimit]:
+    """Parse comma-separated ``key=requests/seconds`` pairs.
+
+    Args:
+        spec: e.g. ``/api/v1/agent=10/60,/api/v1/llm=30/60``
+
+    Returns:
+        Limit per key
+
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    limits = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        # Split on the last "=" so base64 tokens keep their padding
+        key, _, limit = entry.rpartition("=")
+        requests, _, seconds = limit.partition("/")
+        if not key or not requests.strip().isdigit():
+            raise ValueError(f"Invalid rate limit {entry!r}, expected key=requests/seconds")
+        limits[key.strip()] = RateLimit(int(requests), float(seconds or 60))
+    return limits
+
+
+def rate_limit_config_from_settings(settings: Any) -> RateLimitConfig:
+    """Build the middleware configuration from the ``rate_limit_*`` settings."""
+    return RateLimitConfig(
+        default=RateLimit(settings.rate_limit_requests, float(settings.rate_limit_window_seconds)),
+        routes=parse_rate_limits(settings.rate_limit_routes),
+        tokens=parse_rate_limits(settings.rate_limit_tokens),
+        sqlite_path=settings.rate_limit_sqlite_path
+    )
+
+
+def client_key(token: Optional[str], client_ip: Optional[str]) -> str:
+    """Identity a bucket is kept for; tokens are hashed so they are not stored."""
+    if token:
+        return "t:" + hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+    return "ip:" + (client_ip or "unknown")
+
+
+def _take(tokens: float, updated: float, limit: RateLimit, now: float) -> Tuple[float, RateDecision]:
+    """Refill a bucket up to ``now`` and try to take one token."""
+    tokens = min(float(limit.requests), tokens + (now - updated) * limit.rate)
+    if tokens >= 1.0:
+        tokens -= 1.0
+        return tokens, RateDecision(True, int(tokens), 0.0)
+    return tokens, RateDecision(False, 0, (1.0 - tokens) / limit.rate)
+
+
+class TokenBucketLimiter:
+    """In-process token buckets with O(1) work per request.
+
+    Buckets are kept in least recently used order; each check evicts a
+    bounded number of buckets from the cold end that have been idle longer
+    than ``idle_ttl`` or exceed ``max_keys``.
+    """
+
+    # Idle buckets inspected per request, keeping eviction amortised O(1)
+    EVICTIONS_PER_CALL = 2
+    # acquire never blocks, so it can run on the event loop
+    blocking = False
+
+    def __init__(self, config: RateLimitConfig, clock: Callable[[], float] = time.monotonic):
+        self.config = config
+        self._clock = clock
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def acquire(self, key: str, limit: RateLimit) -> RateDecision:
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(limit.requests), now]
+        else:
+            self._buckets.move_to_end(key)
+        bucket[0], decision = _take(bucket[0], bucket[1], limit, now)
+        bucket[1] = now
+        self._evict(now)
+        return decision
+
+    def _evict(self, now: float) -> None:
+        buckets = self._buckets
+        for _ in range(self.EVICTIONS_PER_CALL):
+            if not buckets:
+                return
+            oldest_key = next(iter(buckets))
+            if len(buckets) > self.config.max_keys or now - buckets[oldest_key][1] > self.config.idle_ttl:
+                del buckets[oldest_key]
+            else:
+                return
+
+
+class SQLiteTokenBucketLimiter:
+    """Token buckets in a local SQLite file, shared by worker processes.
+
+    Each check is one short ``BEGIN IMMEDIATE`` transaction on a primary key
+    lookup, so per-request cost stays constant. Idle buckets are deleted in
+    a sweep every ``idle_ttl / 2`` seconds. Wall-clock time is used because
+    monotonic clocks are not comparable across processes.
+
+    ``acquire`` can wait up to ``sqlite_busy_timeout`` for the write lock, so
+    async callers run it in a worker thread; on timeout the request is
+    allowed.
+    """
+
+    blocking = True
+
+    def __init__(self, config: RateLimitConfig, clock: Callable[[], float] = time.time):
+        self.config = config
+        self._clock = clock
+        self._lock = threading.Lock()
+        Path(config.sqlite_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            config.sqlite_path,
+            timeout=config.sqlite_busy_timeout,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL) WITHOUT ROWID"
+        )
+        self._next_sweep = self._clock() + config.idle_ttl / 2
+
+    def acquire(self, key: str, limit: RateLimit) -> RateDecision:
+        with self._lock:
+            now = self._clock()
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = self._conn.execute(
+                        "SELECT tokens, updated FROM rate_limit_buckets WHERE key = ?", (key,)
+                    ).fetchone()
+                    tokens, updated = row if row else (float(limit.requests), now)
+                    tokens, decision = _take(tokens, min(updated, now), limit, now)
+                    self._conn.execute(
+                        "INSERT INTO rate_limit_buckets (key, tokens, updated) VALUES (?, ?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated",
+                        (key, tokens, now)
+                    )
+                    if now >= self._next_sweep:
+                        self._next_sweep = now + self.config.idle_ttl / 2
+                        self._conn.execute(
+                            "DELETE FROM rate_limit_buckets WHERE updated < ?",
+                            (now - self.config.idle_ttl,)
+                        )
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                return decision
+            except sqlite3.Error as e:
+                # Fail open: a broken limiter must not take the API down
+                logger.error(f"Rate limit check failed: {str(e)}", exc_info=True)
+                return RateDecision(True, limit.requests, 0.0)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def create_limiter(config: RateLimitConfig):
+    """Limiter for a configuration: SQLite-backed if ``sqlite_path`` is set."""
+    if config.sqlite_path:
+        return SQLiteTokenBucketLimiter(config)
+    return TokenBucketLimiter(config)
+
+
+def retry_after_header(decision: RateDecision) -> str:
+    return str(max(1, math.ceil(decision.retry_after)))
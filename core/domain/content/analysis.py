@@ -0,0 +1,353 @@
+import bisect
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import spacy
+    from spacy.tokens import Doc, Span
+
+from core.utils.logger import get_logger
+from .keyword_index import KeywordPositionIndex, fold_case
+
+logger = get_logger(__name__)
+
+DEFAULT_PIPE_BATCH_SIZE = 256
+DEFAULT_ANNOTATION_CACHE_SIZE = 50000
+
+
+class AnalysisContext:
+    """Parsed representation of a single page shared by the ANALYSIS stage.
+
+    The cleaned content is run through the spaCy pipeline once; extractors,
+    keyword consolidation, validation rules and relationship detection then
+    read entities, sentences and keyword spans from the same Doc instead of
+    re-parsing the text (or each keyword) themselves.
+
+    A context belongs to one page and is not shared between pages, so its
+    lookup caches need no locking.
+    """
+
+    def __init__(self, text: str, doc: 'Doc'):
+        """Initialize with already parsed content.
+
+        Args:
+            text: The cleaned content that was parsed
+            doc: spaCy Doc for ``text``
+        """
+        self.text = text
+        self.doc = doc
+        # Same length as text, so regex offsets map straight back to it
+        self._lower_text = fold_case(text)
+        self._sentences: Optional[List['Span']] = None
+        self._sentence_texts: Optional[List[Tuple[str, str]]] = None
+        self._spans: Dict[str, Optional['Span']] = {}
+        self._parsed: Dict[str, 'Doc'] = {}
+        self._keyword_index: Optional[KeywordPositionIndex] = None
+        self._extra_positions: Dict[str, List[Tuple[int, int]]] = {}
+        self._sentence_starts: Optional[List[int]] = None
+
+    @classmethod
+    def parse(cls, nlp: 'spacy.language.Language', text: str) -> 'AnalysisContext':
+        """Parse content once and wrap it in a context.
+
+        Args:
+            nlp: Initialized spaCy language model
+            text: Cleaned page content
+
+        Returns:
+            AnalysisContext for the content
+        """
+        return cls(text, nlp(text))
+
+    def covers(self, text: str) -> bool:
+        """Whether this context was built for the given text."""
+        return text is self.text or text == self.text
+
+    @property
+    def entities(self) -> Tuple['Span', ...]:
+        """Named entities found in the content."""
+        return self.doc.ents
+
+    @property
+    def sentences(self) -> List['Span']:
+        """Sentence spans, or the whole Doc when no sentence boundaries exist."""
+        if self._sentences is None:
+            if self.doc.has_annotation("SENT_START"):
+                self._sentences = list(self.doc.sents)
+            else:
+                self._sentences = [self.doc[:]]
+        return self._sentences
+
+    @property
+    def sentence_texts(self) -> List[Tuple[str, str]]:
+        """Stripped sentence texts paired with their lowercased form."""
+        if self._sentence_texts is None:
+            texts = [sent.text.strip() for sent in self.sentences]
+            self._sentence_texts = [(text, text.lower()) for text in texts]
+        return self._sentence_texts
+
+    def sentence_index(self, char_offset: int) -> int:
+        """Index into ``sentences`` of the sentence containing a character offset."""
+        if self._sentence_starts is None:
+            self._sentence_starts = [sent.start_char for sent in self.sentences]
+        return max(bisect.bisect_right(self._sentence_starts, char_offset) - 1, 0)
+
+    def index_keywords(self, keywords: Iterable[str]) -> KeywordPositionIndex:
+        """Locate every occurrence of a candidate set in one pass.
+
+        Builds an Aho-Corasick automaton over the keywords and scans the
+        content once; the index replaces any previous one.
+
+        Args:
+            keywords: Keyword texts to locate
+
+        Returns:
+            The position index, also available via ``positions``
+        """
+        self._keyword_index = KeywordPositionIndex(self.text, keywords)
+        self._extra_positions.clear()
+        return self._keyword_index
+
+    @property
+    def keyword_index(self) -> Optional[KeywordPositionIndex]:
+        return self._keyword_index
+
+    def positions(self, keyword: str) -> List[Tuple[int, int]]:
+        """Character spans of every occurrence of a keyword in the content.
+
+        Keywords outside the indexed candidate set are located on demand
+        and cached.
+
+        Args:
+            keyword: Keyword text
+
+        Returns:
+            List of (start_char, end_char) tuples in document order
+        """
+        if self._keyword_index is not None and keyword in self._keyword_index:
+            return self._keyword_index.positions(keyword)
+        key = " ".join(fold_case(keyword).split())
+        if key not in self._extra_positions:
+            self._extra_positions[key] = KeywordPositionIndex(self.text, [key]).positions(key)
+        return self._extra_positions[key]
+
+    def span_for(self, text: str) -> Optional['Span']:
+        """Find the first occurrence of a keyword in the parsed content.
+
+        Matching is case-insensitive and on token boundaries. Lookups are
+        cached per context, so repeated variants cost a dict lookup.
+
+        Args:
+            text: Keyword text
+
+        Returns:
+            Span covering the keyword, or None if it does not occur
+        """
+        key = " ".join(fold_case(text).split())
+        if key in self._spans:
+            return self._spans[key]
+
+        span = None
+        if key:
+            pattern = r"(?<!\w)" + r"\s+".join(re.escape(part) for part in key.split()) + r"(?!\w)"
+            match = re.search(pattern, self._lower_text)
+            if match:
+                span = self.doc.char_span(match.start(), match.end(), alignment_mode="strict")
+        self._spans[key] = span
+        return span
+
+    def lemma_key(self, text: str) -> Optional[str]:
+        """Lemmatised form of a keyword, read from its span in the content.
+
+        Args:
+            text: Keyword text
+
+        Returns:
+            Space-joined lemmas, or None if the keyword is not in the content
+        """
+        span = self.span_for(text)
+        if span is None:
+            return None
+        return " ".join(token.lemma_ for token in span)
+
+    def preparse(
+        self,
+        texts: Iterable[str],
+        nlp: 'spacy.language.Language',
+        batch_size: int = DEFAULT_PIPE_BATCH_SIZE
+    ) -> int:
+        """Parse keywords that do not occur in the content in one batch.
+
+        Keywords with a span in the shared Doc are skipped; the rest are
+        streamed through ``nlp.pipe`` so that later ``doc_for`` calls are
+        served from memory instead of parsing one string at a time.
+
+        Args:
+            texts: Keyword texts that will be looked up
+            nlp: Model used to parse the missing keywords
+            batch_size: Texts per ``nlp.pipe`` batch
+
+        Returns:
+            Number of keywords parsed
+        """
+        missing = []
+        seen = set()
+        for text in texts:
+            if text in seen or text in self._parsed:
+                continue
+            seen.add(text)
+            if self.span_for(text) is None:
+                missing.append(text)
+        for text, doc in zip(missing, nlp.pipe(missing, batch_size=batch_size)):
+            self._parsed[text] = doc
+        return len(missing)
+
+    def doc_for(self, text: str, nlp: Optional['spacy.language.Language']) -> Optional[Union['Doc', 'Span']]:
+        """Return the in-content span for a keyword, parsing it only as a fallback.
+
+        Args:
+            text: Keyword text
+            nlp: Model used when the keyword does not occur in the content
+
+        Returns:
+            Span from the shared Doc, a parsed Doc, or None without a model
+        """
+        span = self.span_for(text)
+        if span is not None:
+            return span
+        doc = self._parsed.get(text)
+        if doc is None and nlp is not None:
+            doc = self._parsed[text] = nlp(text)
+        return doc
+
+
+def keyword_doc(
+    text: str,
+    nlp: Optional['spacy.language.Language'],
+    analysis: Optional[AnalysisContext] = None
+) -> Optional[Union['Doc', 'Span']]:
+    """Resolve a keyword to spaCy tokens, preferring the page's shared Doc.
+
+    Args:
+        text: Keyword text
+        nlp: Model used when no context is available or the keyword is absent
+        analysis: Optional analysis context for the current page
+
+    Returns:
+        Span or Doc for the keyword, or None without a model
+    """
+    if analysis is not None:
+        return analysis.doc_for(text, nlp)
+    return nlp(text) if nlp is not None else None
+
+
+@dataclass(frozen=True)
+class TokenAnnotation:
+    """Lemma and part-of-speech annotations for a short keyword string."""
+    tokens: Tuple[str, ...]
+    lemmas: Tuple[str, ...]
+    pos: Tuple[str, ...]
+    tags: Tuple[str, ...]
+
+    @property
+    def lemma_key(self) -> str:
+        return " ".join(self.lemmas)
+
+
+class KeywordAnnotator:
+    """Batched lemma/POS annotation of keyword candidates.
+
+    Candidate strings are streamed through ``nlp.pipe`` with the parser and
+    NER disabled, since only tokens, tags and lemmas are read. Results are
+    memoised in a process-wide LRU keyed by model and text, so recurring
+    keywords across pages are annotated once.
+    """
+
+    _cache: "OrderedDict[Tuple[str, str], TokenAnnotation]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    _cache_size = DEFAULT_ANNOTATION_CACHE_SIZE
+
+    UNUSED_PIPES = ("parser", "ner")
+
+    def __init__(self, nlp: 'spacy.language.Language', batch_size: int = DEFAULT_PIPE_BATCH_SIZE):
+        """Initialize the annotator.
+
+        Args:
+            nlp: Initialized spaCy language model
+            batch_size: Texts per ``nlp.pipe`` batch
+        """
+        self.nlp = nlp
+        self.batch_size = batch_size
+        self._disabled = [name for name in self.UNUSED_PIPES if name in nlp.pipe_names]
+        meta = getattr(nlp, "meta", {}) or {}
+        self._model_key = f"{meta.get('lang', '')}_{meta.get('name', '')}-{meta.get('version', '')}"
+
+    @classmethod
+    def configure_cache(cls, max_size: int) -> None:
+        """Set the process-wide cache size, trimming existing entries."""
+        with cls._cache_lock:
+            cls._cache_size = max(0, max_size)
+            while len(cls._cache) > cls._cache_size:
+                cls._cache.popitem(last=False)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    def annotate(self, texts: Iterable[str]) -> Dict[str, TokenAnnotation]:
+        """Annotate many keyword strings, parsing only cache misses.
+
+        Args:
+            texts: Keyword strings
+
+        Returns:
+            Mapping of each distinct text to its annotation
+        """
+        results: Dict[str, TokenAnnotation] = {}
+        # Insertion-ordered set of texts to parse
+        pending: Dict[str, None] = {}
+        cls = type(self)
+        with cls._cache_lock:
+            for text in texts:
+                if text in results or text in pending:
+                    continue
+                cached = cls._cache.get((self._model_key, text))
+                if cached is None:
+                    pending[text] = None
+                    continue
+                cls._cache.move_to_end((self._model_key, text))
+                results[text] = cached
+
+        if not pending:
+            return results
+
+        missing = list(pending)
+        parsed = self.nlp.pipe(missing, batch_size=self.batch_size, disable=self._disabled)
+        annotations = [
+            (text, TokenAnnotation(
+                tokens=tuple(token.text for token in doc),
+                lemmas=tuple(token.lemma_ for token in doc),
+                pos=tuple(token.pos_ for token in doc),
+                tags=tuple(token.tag_ for token in doc)
+            ))
+            for text, doc in zip(missing, parsed)
+        ]
+
+        with cls._cache_lock:
+            for text, annotation in annotations:
+                results[text] = annotation
+                if cls._cache_size:
+                    cls._cache[(self._model_key, text)] = annotation
+            while len(cls._cache) > cls._cache_size:
+                cls._cache.popitem(last=False)
+
+        logger.debug(f"Annotated {len(missing)} keyword strings ({len(results) - len(missing)} cached)")
+        return results
+
+    def annotate_one(self, text: str) -> TokenAnnotation:
+        """Annotate a single keyword string."""
+        return self.annotate([text])[text]
@@ -14,12 +14,14 @@ class ContentProcessorConfig:
         max_variants: Maximum number of variants per keyword
         enable_stemming: Whether to use stemming in normalization
         extractor_config: Configuration for keyword extractors
+        nlp_batch_size: Texts per nlp.pipe batch for keyword candidates
     """ 
     min_content_length: int = 100
     min_keyword_score: float = 0.3
     max_variants: int = 5
     enable_stemming: bool = True
     relationship_confidence_threshold: float = 0.5
+    nlp_batch_size: int = 256
     # Content extraction settings
     extract_content: bool = True  # Enable/disable content extraction
     content_extraction_timeout: float = 2.0  # Seconds before timing out
@@ -0,0 +1,197 @@
+import math
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Set
+
+from core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# custom_metadata key under which the analysis stage hands a page's terms to
+# storage; storage removes it so the terms are never persisted
+DOCUMENT_TERMS_KEY = "document_terms"
+
+
+@dataclass
+class DocumentFrequencyConfig:
+    """Configuration for the corpus document-frequency store.
+
+    Attributes:
+        path: SQLite file holding the counters
+        min_documents: Corpus size below which IDF is not applied
+        refresh_interval: Seconds between checks for writes by other processes
+    """
+    path: str = "./storage/document_frequency.sqlite"
+    min_documents: int = 20
+    refresh_interval: float = 60.0
+
+
+def document_terms(content: Optional[str], keywords: Iterable[str] = ()) -> Set[str]:
+    """Distinct normalised terms a page contributes to the corpus counts.
+
+    Every word of the content is counted, plus each extracted keyword phrase,
+    so single-word and phrase IDF can both be looked up. Words are split the
+    same way TfidfExtractor splits terms (lowercase, whitespace).
+
+    Args:
+        content: Cleaned page content
+        keywords: Keyword phrases stored for the page
+
+    Returns:
+        Set of normalised terms
+    """
+    terms = set(content.lower().split()) if content else set()
+    for keyword in keywords:
+        normalized = " ".join(keyword.lower().split())
+        if normalized:
+            terms.add(normalized)
+    return terms
+
+
+class DocumentFrequencyStore:
+    """Incrementally maintained document frequencies for TF-IDF.
+
+    Counters live in a small SQLite table (term -> number of pages containing
+    it), updated once per newly stored page. Readers keep an in-memory copy
+    that is only reloaded when the file has changed, so extractor lookups
+    are plain dict reads and never touch disk.
+    """
+
+    def __init__(self, config: Optional[DocumentFrequencyConfig] = None):
+        self.config = config or DocumentFrequencyConfig()
+        self.logger = get_logger(__name__)
+        self._write_lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+        self._document_count = 0
+        self._loaded_mtime: Optional[float] = None
+        self._last_refresh = 0.0
+        self._ensure_schema()
+        self.load()
+
+    @property
+    def document_count(self) -> int:
+        return self._document_count
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the corpus is large enough for IDF to be meaningful."""
+        return self._document_count >= self.config.min_documents
+
+    def load(self) -> None:
+        """Load all counters into memory."""
+        try:
+            with self._connect() as conn:
+                counts = dict(conn.execute("SELECT term, df FROM document_frequency"))
+                row = conn.execute(
+                    "SELECT value FROM corpus_meta WHERE key = 'document_count'"
+                ).fetchone()
+            # Swap in complete snapshots so readers never see a partial load
+            self._counts = counts
+            self._document_count = int(row[0]) if row else 0
+            self._loaded_mtime = self._mtime()
+            self._last_refresh = time.monotonic()
+            self.logger.debug(
+                f"Loaded document frequencies for {len(counts)} terms "
+                f"over {self._document_count} documents"
+            )
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to load document frequencies: {str(e)}", exc_info=True)
+
+    def refresh(self) -> None:
+        """Reload if another process changed the file since the last load."""
+        now = time.monotonic()
+        if now - self._last_refresh < self.config.refresh_interval:
+            return
+        self._last_refresh = now
+        if self._mtime() != self._loaded_mtime:
+            self.load()
+
+    def document_frequency(self, term: str) -> int:
+        return self._counts.get(term, 0)
+
+    def idf(self, term: str) -> float:
+        """Smoothed inverse document frequency of a normalised term.
+
+        Phrases that were never counted are estimated from their rarest word,
+        since a phrase cannot occur in more pages than any of its words.
+        """
+        df = self._counts.get(term)
+        if df is None and " " in term:
+            word_counts = [self._counts.get(word, 0) for word in term.split()]
+            df = min(word_counts) if word_counts else 0
+        return math.log((self._document_count + 1) / ((df or 0) + 1)) + 1.0
+
+    def max_idf(self) -> float:
+        """IDF of a term that occurs in no document."""
+        return math.log(self._document_count + 1) + 1.0
+
+    def add_document(self, terms: Iterable[str]) -> None:
+        """Count one new document containing the given distinct terms.
+
+        Args:
+            terms: Distinct normalised terms of the document
+        """
+        terms = set(terms)
+        with self._write_lock:
+            try:
+                with self._connect() as conn:
+                    conn.executemany(
+                        "INSERT INTO document_frequency (term, df) VALUES (?, 1) "
+                        "ON CONFLICT(term) DO UPDATE SET df = df + 1",
+                        ((term,) for term in terms)
+                    )
+                    conn.execute(
+                        "UPDATE corpus_meta SET value = value + 1 WHERE key = 'document_count'"
+                    )
+            except sqlite3.Error as e:
+                self.logger.error(f"Failed to update document frequencies: {str(e)}", exc_info=True)
+                return
+
+            # Apply the same increments to the in-memory copy; single-key
+            # updates are atomic, so concurrent readers need no lock
+            counts = self._counts
+            for term in terms:
+                counts[term] = counts.get(term, 0) + 1
+            self._document_count += 1
+            self._loaded_mtime = self._mtime()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success and is always closed."""
+        conn = sqlite3.connect(self.config.path, timeout=10)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _ensure_schema(self) -> None:
+        Path(self.config.path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS document_frequency ("
+                "term TEXT PRIMARY KEY, df INTEGER NOT NULL) WITHOUT ROWID"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS corpus_meta ("
+                "key TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO corpus_meta (key, value) VALUES ('document_count', 0)"
+            )
+
+    def _mtime(self) -> Optional[float]:
+        # WAL mode writes land in the -wal file until checkpointed
+        mtimes = []
+        for suffix in ("", "-wal"):
+            try:
+                mtimes.append(os.path.getmtime(self.config.path + suffix))
+            except OSError:
+                continue
+        return max(mtimes) if mtimes else None
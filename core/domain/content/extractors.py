@@ -1,14 +1,15 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Optional
 from collections import defaultdict
 import uuid
-import spacy
 from core.utils.logger import get_logger
 from .types import (
     KeywordType, RawKeyword
 )
 from .keyword_identifier import KeywordNormalizer
+from .analysis import AnalysisContext
+from .document_frequency import DocumentFrequencyStore
 from core.common.errors import ProcessingError
 
 @dataclass
@@ -73,11 +74,14 @@ class BaseExtractor(ABC):
         self.logger = get_logger(f"{__name__}.{self.__class__.__name__}")
         
     @abstractmethod
-    def _extract_implementation(self, text: str) -> List[RawKeyword]:
+    def _extract_implementation(self,
+                                text: str,
+                                analysis: Optional[AnalysisContext] = None) -> List[RawKeyword]:
         """Implementation of the extraction logic.
         
         Args:
             text: Text to extract keywords from
+            analysis: Optional parsed context for ``text``
             
         Returns:
             List of extracted RawKeyword instances
@@ -87,7 +91,9 @@ class BaseExtractor(ABC):
         """
         pass
         
-    def extract(self, text: str) -> List[RawKeyword]:
+    def extract(self,
+                text: str,
+                analysis: Optional[AnalysisContext] = None) -> List[RawKeyword]:
         """Extract keywords from text.
         
         This method handles logging and error management around
@@ -95,6 +101,7 @@ class BaseExtractor(ABC):
         
         Args:
             text: Text to extract keywords from
+            analysis: Optional parsed context; ignored unless built for ``text``
             
         Returns:
             List of RawKeyword instances
@@ -110,7 +117,9 @@ class BaseExtractor(ABC):
                 self.logger.warning(f"Text too short for extraction: {len(text)} chars")
                 return []
                 
-            results = self._extract_implementation(text)
+            if analysis is not None and not analysis.covers(text):
+                analysis = None
+            results = self._extract_implementation(text, analysis)
             
             # Filter results based on configuration
             filtered_results = [
@@ -149,7 +158,9 @@ class RakeExtractor(BaseExtractor):
                           'that', 'the', 'to', 'was', 'were', 'will', 'with'}
         self.punctuation = set('.,;:!?()[]{}\'\"')
         
-    def _extract_implementation(self, text: str) -> List[RawKeyword]:
+    def _extract_implementation(self,
+                                text: str,
+                                analysis: Optional[AnalysisContext] = None) -> List[RawKeyword]:
         try:
             # Normalize text
             normalized_text = self.normalizer.normalize(text)
@@ -261,16 +272,31 @@ class RakeExtractor(BaseExtractor):
 
 
 class TfidfExtractor(BaseExtractor):
-    def __init__(self, config: ExtractorConfig, normalizer: KeywordNormalizer):
+    """Term-frequency keyword extraction weighted by corpus IDF.
+
+    Without a document-frequency store (or while the corpus is still small)
+    terms are scored on in-document frequency only.
+    """
+
+    def __init__(self,
+                 config: ExtractorConfig,
+                 normalizer: KeywordNormalizer,
+                 df_store: Optional[DocumentFrequencyStore] = None):
         super().__init__(config, normalizer)
+        self.df_store = df_store
         
-    def _calculate_term_importance(self, term: str, frequency: int, total_terms: int) -> float:
+    def _calculate_term_importance(self,
+                                   term: str,
+                                   frequency: int,
+                                   total_terms: int,
+                                   idf_weight: float = 1.0) -> float:
         """Calculate importance score for a term based on frequency and length.
         
         Args:
             term: The term to score
             frequency: Number of times the term appears
             total_terms: Total number of terms in document
+            idf_weight: Corpus IDF normalised to 0-1 (1.0 for unseen terms)
             
         Returns:
             Float score between 0 and 1
@@ -286,11 +312,12 @@ class TfidfExtractor(BaseExtractor):
         length_factor = 0.5 + (min(1.0, term_length / 3) * 0.5)  # Ranges from 0.5 to 1.0
         
         # Base score calculation
-        score = tf * length_factor
+        score = tf * length_factor * idf_weight
         scaled_score = min(1.0, score * 100.0)
         
         self.logger.debug(f"Term score calculation for '{term}': tf={tf:.4f}, "
-                        f"length_factor={length_factor:.2f}, final_score={scaled_score:.4f}")
+                        f"length_factor={length_factor:.2f}, idf_weight={idf_weight:.2f}, "
+                        f"final_score={scaled_score:.4f}")
         
         return scaled_score
 
@@ -325,7 +352,9 @@ class TfidfExtractor(BaseExtractor):
 
     
 
-    def _extract_implementation(self, text: str) -> List[RawKeyword]:
+    def _extract_implementation(self,
+                                text: str,
+                                analysis: Optional[AnalysisContext] = None) -> List[RawKeyword]:
         try:
             self.logger.info(f"Extraction: Text length {len(text)}")
             
@@ -342,6 +371,14 @@ class TfidfExtractor(BaseExtractor):
             filtered_terms = {}
             filtered_counts = defaultdict(int)
 
+            # Use corpus IDF once enough documents have been counted
+            df_store = self.df_store
+            if df_store is not None:
+                df_store.refresh()
+                if not df_store.is_active:
+                    df_store = None
+            max_idf = df_store.max_idf() if df_store is not None else 1.0
+
             # Generate keywords
             keywords = []
             for term, freq in term_freqs.items():
@@ -351,7 +388,8 @@ class TfidfExtractor(BaseExtractor):
                     continue
                 
                 # Calculate importance score
-                score = self._calculate_term_importance(term, freq, total_terms)
+                idf_weight = df_store.idf(term) / max_idf if df_store is not None else 1.0
+                score = self._calculate_term_importance(term, freq, total_terms, idf_weight)
                 
                 # Apply filters
                 if score <= self.config.min_keyword_score:
@@ -373,6 +411,7 @@ class TfidfExtractor(BaseExtractor):
                     metadata={
                         'method': 'term_importance',
                         'term_frequency': freq,
+                        'idf_weight': round(idf_weight, 4),
                         'raw_score': score * 10.0
                     }
                 ))
@@ -436,10 +475,12 @@ class NamedEntityExtractor(BaseExtractor):
         super().__init__(config, normalizer)
         self.nlp = nlp
         
-    def _extract_implementation(self, text: str) -> List[RawKeyword]:
+    def _extract_implementation(self,
+                                text: str,
+                                analysis: Optional[AnalysisContext] = None) -> List[RawKeyword]:
         try:
-            # Process text with spaCy
-            doc = self.nlp(text)
+            # Reuse the page's parsed Doc when available
+            doc = analysis.doc if analysis is not None else self.nlp(text)
             
             # Track entity frequencies
             entity_freq = {}
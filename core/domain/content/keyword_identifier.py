@@ -4,7 +4,7 @@ import hashlib
 from datetime import datetime
 from .types import KeywordType
  
-@dataclass
+@dataclass(slots=True)
 class KeywordIdentifier:
     """Identifies and tracks a keyword and its variations.
     
@@ -0,0 +1,166 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+def fold_case(text: str) -> str:
+    """Lowercase text one character at a time, keeping every offset.
+
+    Characters whose lowercase form has a different length (e.g. "İ", which
+    lowercases to "i" plus a combining dot) are kept as they are, so offsets
+    into the folded text are offsets into the original.
+    """
+    return "".join(_fold_char(char) for char in text)
+
+
+def _fold_char(char: str) -> str:
+    lowered = char.lower()
+    return lowered if len(lowered) == 1 else char
+
+
+def _normalize_pattern(text: str) -> str:
+    return " ".join(fold_case(text).split())
+
+
+class AhoCorasickMatcher:
+    """Multi-pattern string matcher (Aho-Corasick automaton).
+
+    All patterns are found in a single left-to-right pass over the text, so
+    locating K keywords in a document of length N costs O(N + matches)
+    instead of K separate scans. Matching is case-insensitive (see
+    ``fold_case``), runs of whitespace in the text match a single space in a
+    pattern, and matches must start and end on word boundaries.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """Build the automaton.
+
+        Args:
+            patterns: Keyword texts to match
+        """
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        seen = set()
+        for pattern in patterns:
+            normalized = _normalize_pattern(pattern)
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                self._add(normalized, len(self.patterns))
+                self.patterns.append(normalized)
+        self._build_failure_links()
+
+    def _add(self, pattern: str, pattern_id: int) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(pattern_id)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                # Inherit matches that end at the same position
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield every word-bounded occurrence of every pattern.
+
+        Args:
+            text: Text to search
+
+        Yields:
+            (start_char, end_char, pattern) tuples in order of end position
+        """
+        if not self.patterns:
+            return
+
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self.patterns
+        # Original offset of each character fed to the automaton, so matches
+        # can be mapped back after whitespace runs have been collapsed
+        offsets: List[int] = []
+        state = 0
+        previous_space = False
+        length = len(text)
+
+        for index, char in enumerate(text):
+            if char.isspace():
+                if previous_space:
+                    continue
+                char = " "
+                previous_space = True
+            else:
+                char = _fold_char(char)
+                previous_space = False
+            offsets.append(index)
+
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for pattern_id in output[state]:
+                pattern = patterns[pattern_id]
+                start = offsets[len(offsets) - len(pattern)]
+                end = index + 1
+                if start > 0 and (text[start - 1].isalnum() or text[start - 1] == "_"):
+                    continue
+                if end < length and (text[end].isalnum() or text[end] == "_"):
+                    continue
+                yield start, end, pattern
+
+
+class KeywordPositionIndex:
+    """Every occurrence offset of a set of keywords in one document."""
+
+    def __init__(self, text: str, keywords: Iterable[str]):
+        """Index keywords in a single pass over the text.
+
+        Args:
+            text: Document text
+            keywords: Keyword texts to locate
+        """
+        matcher = AhoCorasickMatcher(keywords)
+        self._positions: Dict[str, List[Tuple[int, int]]] = {
+            pattern: [] for pattern in matcher.patterns
+        }
+        for start, end, pattern in matcher.iter_matches(text):
+            self._positions[pattern].append((start, end))
+        for spans in self._positions.values():
+            spans.sort()
+
+    def __contains__(self, keyword: str) -> bool:
+        return _normalize_pattern(keyword) in self._positions
+
+    def positions(self, keyword: str) -> List[Tuple[int, int]]:
+        """Character spans of a keyword, in document order.
+
+        Args:
+            keyword: Keyword text (case and whitespace insensitive)
+
+        Returns:
+            List of (start_char, end_char) tuples; empty if not indexed or absent
+        """
+        return self._positions.get(_normalize_pattern(keyword), [])
+
+    def first_position(self, keyword: str) -> int:
+        """Start offset of the first occurrence, or -1."""
+        spans = self.positions(keyword)
+        return spans[0][0] if spans else -1
+
+    def count(self, keyword: str) -> int:
+        return len(self.positions(keyword))
@@ -0,0 +1,274 @@
+import argparse
+import hashlib
+import os
+import pickle
+import threading
+from dataclasses import dataclass, field
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, FrozenSet, Optional
+
+from core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the Lexicon fields or their meaning change
+LEXICON_FORMAT_VERSION = 1
+
+DEFAULT_LEXICON_PATH = "./storage/lexicon.pkl"
+
+# Packages the lexicon is built from; their versions are part of the fingerprint
+SOURCE_PACKAGES = ("pycountry", "us", "nltk")
+
+COMMON_COUNTRY_CODES = frozenset({
+    'uk',   # United Kingdom (technically GB)
+    'eu',   # European Union
+    'uae',  # United Arab Emirates
+    'usa',  # United States of America
+    'drc',  # Democratic Republic of the Congo
+    'roc',  # Republic of China (Taiwan)
+    'prc',  # People's Republic of China
+})
+
+TECH_ABBREVIATIONS = frozenset({
+    # Programming & Computing
+    'ai', 'ml', 'nlp', 'api', 'sdk', 'ide', 'gui', 'cli', 'orm',
+    'cpu', 'gpu', 'ram', 'rom', 'ssd', 'hdd', 'lan', 'wan', 'vpc',
+    'sql', 'nosql', 'json', 'xml', 'yaml', 'html', 'css', 'js',
+
+    # Internet & Web
+    'url', 'uri', 'dns', 'ip', 'http', 'https', 'ftp', 'ssl', 'tls',
+    'www', 'tcp', 'udp', 'smtp', 'imap', 'pop3',
+
+    # Software Development
+    'ci', 'cd', 'vcs', 'git', 'svn', 'ui', 'ux', 'dx',
+    'jwt', 'oauth', 'saml', 'crud', 'rest', 'soap',
+
+    # Cloud & Infrastructure
+    'aws', 'gcp', 'vpc', 'ec2', 's3', 'rds', 'k8s', 'iaas', 'paas',
+    'saas', 'faas', 'cdn',
+
+    # Hardware & Devices
+    'pc', 'usb', 'io', 'lcd', 'led', 'wifi', '5g', '4g', 'lte',
+
+    # Extended Reality
+    'ar', 'vr', 'xr', 'mr'
+})
+
+PRODUCT_NAMES = frozenset({
+    'ios', 'ipod', 'ipad', 'iphone', 'imac',  # Apple products
+    'macos', 'watchos', 'tvos',
+    'aws',   # Cloud platforms
+    'gcp',
+    'asp',   # Microsoft
+    'sql',   # Databases
+    'nosql',
+    'mysql', 'postgresql', 'mongodb',
+    'php',   # Languages
+    'nodejs'
+})
+
+UNIT_ABBREVIATIONS = frozenset({
+    # Time
+    'ms', 'sec', 'min', 'hr', 'wk', 'mo', 'yr',
+
+    # Distance
+    'mm', 'cm', 'km', 'in', 'ft', 'yd', 'mi',
+
+    # Weight/Mass
+    'mg', 'kg', 'oz', 'lb',
+
+    # Data
+    'kb', 'mb', 'gb', 'tb', 'pb',
+
+    # Other Common Units
+    'mph', 'kph', 'dpi', 'ppi', 'fps', 'rpm'
+})
+
+# Stopwords added to NLTK's English list
+EXTRA_STOPWORDS = frozenset({
+    # Common web/UI terms
+    'click', 'tap', 'press', 'select', 'choose', 'menu', 'navigation',
+    'login', 'logout', 'sign', 'register', 'previous', 'next', 'back',
+    'forward', 'loading', 'please', 'wait', 'search', 'close', 'open',
+    'show', 'hide', 'toggle', 'enable', 'disable', 'accept', 'cancel',
+    'submit', 'reset', 'update', 'refresh', 'reload', 'scroll',
+
+    # Common non-keyword verbs
+    'make', 'made', 'making', 'take', 'took', 'taking', 'get', 'got',
+    'getting', 'put', 'putting', 'use', 'used', 'using', 'try', 'tried',
+    'trying', 'call', 'called', 'calling', 'work', 'worked', 'working',
+
+    # Common connecting words
+    'like', 'such', 'via', 'etc', 'ie', 'eg', 'example', 'including',
+    'include', 'included', 'includes', 'might', 'may', 'could', 'would',
+    'should', 'must', 'shall', 'will', 'can', 'cannot', 'cant'
+})
+
+
+@dataclass(frozen=True)
+class Lexicon:
+    """Word lists used by keyword validation and text cleaning.
+
+    All entries are lowercase. Instances are immutable and shared by every
+    service in a process.
+    """
+    country_codes: FrozenSet[str]
+    us_state_codes: FrozenSet[str]
+    tech_abbreviations: FrozenSet[str] = TECH_ABBREVIATIONS
+    units_abbreviations: FrozenSet[str] = UNIT_ABBREVIATIONS
+    product_names: FrozenSet[str] = PRODUCT_NAMES
+    stopwords: FrozenSet[str] = EXTRA_STOPWORDS
+    # Versions of SOURCE_PACKAGES the lexicon was built with
+    sources: Dict[str, Optional[str]] = field(default_factory=dict)
+
+    @property
+    def abbreviations(self) -> FrozenSet[str]:
+        """Union of all abbreviation categories."""
+        return (
+            self.country_codes | self.us_state_codes | self.tech_abbreviations
+            | self.units_abbreviations | self.product_names
+        )
+
+
+def _package_version(name: str) -> Optional[str]:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def lexicon_fingerprint() -> str:
+    """Identify the inputs a lexicon is built from.
+
+    Covers the format version, the built-in word lists and the installed
+    versions of the source packages, without importing those packages. An
+    artifact with a different fingerprint is stale and gets rebuilt.
+    """
+    digest = hashlib.sha256(str(LEXICON_FORMAT_VERSION).encode())
+    for words in (COMMON_COUNTRY_CODES, TECH_ABBREVIATIONS, PRODUCT_NAMES,
+                  UNIT_ABBREVIATIONS, EXTRA_STOPWORDS):
+        digest.update("\0".join(sorted(words)).encode("utf-8"))
+        digest.update(b"\1")
+    for name in SOURCE_PACKAGES:
+        digest.update(f"{name}={_package_version(name)}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def build_lexicon() -> Lexicon:
+    """Build the lexicon from pycountry, us and the NLTK stopword corpus.
+
+    This imports all three packages and walks their data, so it is meant to
+    run once per deployment (see ``python -m core.domain.content.lexicon``),
+    not per process.
+    """
+    import nltk
+    import pycountry
+    import us
+
+    country_codes = set(COMMON_COUNTRY_CODES)
+    for country in pycountry.countries:
+        country_codes.add(country.alpha_2.lower())
+        country_codes.add(country.alpha_3.lower())
+
+    return Lexicon(
+        country_codes=frozenset(country_codes),
+        us_state_codes=frozenset(state.abbr.lower() for state in us.states.STATES),
+        stopwords=frozenset(nltk.corpus.stopwords.words('english')) | EXTRA_STOPWORDS,
+        sources={name: _package_version(name) for name in SOURCE_PACKAGES}
+    )
+
+
+def save_lexicon(lexicon: Lexicon, path: str) -> None:
+    """Write a lexicon artifact atomically, so readers never see a partial file."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "format_version": LEXICON_FORMAT_VERSION,
+        "fingerprint": lexicon_fingerprint(),
+        "lexicon": lexicon
+    }
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, target)
+
+
+def load_lexicon(path: str) -> Optional[Lexicon]:
+    """Read a lexicon artifact.
+
+    The artifact is a pickle written by ``save_lexicon`` and must come from a
+    trusted location.
+
+    Returns:
+        The lexicon, or None if the file is missing, unreadable or stale
+    """
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable lexicon artifact {path}: {str(e)}")
+        return None
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("format_version") != LEXICON_FORMAT_VERSION
+        or payload.get("fingerprint") != lexicon_fingerprint()
+    ):
+        logger.info(f"Lexicon artifact {path} is stale, rebuilding")
+        return None
+    return payload["lexicon"]
+
+
+_lexicons: Dict[str, Lexicon] = {}
+_lexicon_lock = threading.Lock()
+
+
+def get_lexicon(path: Optional[str] = None) -> Lexicon:
+    """Process-wide lexicon, loaded from the artifact on first use.
+
+    A missing or stale artifact is rebuilt and written back, so only the
+    first process after a deploy pays for building it. Writing is best
+    effort; a read-only storage directory only costs a rebuild per process.
+
+    Args:
+        path: Artifact location; defaults to ``LEXICON_PATH`` or
+            ``./storage/lexicon.pkl``
+
+    Returns:
+        The shared, immutable lexicon
+    """
+    path = path or os.getenv("LEXICON_PATH", DEFAULT_LEXICON_PATH)
+    lexicon = _lexicons.get(path)
+    if lexicon is not None:
+        return lexicon
+
+    with _lexicon_lock:
+        lexicon = _lexicons.get(path)
+        if lexicon is None:
+            lexicon = load_lexicon(path)
+            if lexicon is None:
+                lexicon = build_lexicon()
+                try:
+                    save_lexicon(lexicon, path)
+                    logger.info(f"Wrote lexicon artifact to {path}")
+                except OSError as e:
+                    logger.warning(f"Could not write lexicon artifact {path}: {str(e)}")
+            _lexicons[path] = lexicon
+        return lexicon
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Build the keyword lexicon artifact')
+    parser.add_argument('--output', default=os.getenv("LEXICON_PATH", DEFAULT_LEXICON_PATH),
+                        help='Path of the artifact to write')
+    args = parser.parse_args()
+
+    built = build_lexicon()
+    save_lexicon(built, args.output)
+    print(
+        f"Wrote {args.output}: {len(built.abbreviations)} abbreviations, "
+        f"{len(built.stopwords)} stopwords"
+    )
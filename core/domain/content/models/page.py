@@ -13,10 +13,16 @@ from core.domain.content.types import (
     RelationType
 )
 
+logger = get_logger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class Page:
-    """Central data model representing a web page in the system."""
+    """Central data model representing a web page in the system.
+
+    Pages are slotted and share a module-level logger so that batch imports
+    holding thousands of them do not pay for a per-instance ``__dict__``.
+    """
     # Core identification
     url: str
     domain: str
@@ -55,9 +61,11 @@ class Page:
     # Error tracking
     errors: List[str] = field(default_factory=list)
 
+    # Browser context details attached by PageService
+    context_data: Optional[Dict[str, Any]] = None
+
     def __post_init__(self):
         """Validate and initialize the page object."""
-        self.logger = get_logger(__name__)
         if not self.url:
             raise ValueError("URL is required")
         if not self.domain:
@@ -110,10 +118,10 @@ class Page:
     @property
     def browser_contexts(self) -> Set[BrowserContext]:
         """Get the page's browser contexts."""
-        self.logger.debug(f"Accessing browser_contexts for page {self.id}")
+        logger.debug(f"Accessing browser_contexts for page {self.id}")
         
         if not hasattr(self.metadata, 'browser_contexts'):
-            self.logger.warning(f"Metadata missing browser_contexts for page {self.id}")
+            logger.warning(f"Metadata missing browser_contexts for page {self.id}")
             # Initialize it
             self.metadata.browser_contexts = set()
             
@@ -132,7 +140,7 @@ class Page:
             bookmark_id: Optional[str] = None
         ):
             """Add or update a browser context."""
-            self.logger.debug(f"Updating browser contexts for page {self.id}")
+            logger.debug(f"Updating browser contexts for page {self.id}")
             
             # Access the browser_contexts directly from metadata instead of using the property
             if not hasattr(self.metadata, 'browser_contexts'):
@@ -148,7 +156,7 @@ class Page:
                 self.metadata.bookmark_id = bookmark_id
                 
             self.metadata.updated_at = datetime.now()
-            self.logger.debug(f"Browser contexts updated successfully for page {self.id}")
+            logger.debug(f"Browser contexts updated successfully for page {self.id}")
 
 
     def remove_browser_context(self, context: BrowserContext):
@@ -186,9 +194,9 @@ class Page:
             ],
             'errors': self.errors
         }
-        
 
 
+    @staticmethod
     def _parse_datetime(value: Any) -> Optional[datetime]:
         """Helper to parse various datetime formats."""
         if value is None:
@@ -0,0 +1,123 @@
+import json
+import re
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Sequence
+
+from core.domain.content.models.page import Page
+
+# Properties needed to rebuild a Page for listings; everything the graph
+# service reads when reconstructing a page from a node.
+PAGE_SUMMARY_PROPERTIES = (
+    "id", "url", "domain", "title", "status",
+    "discovered_at", "last_accessed", "metadata_quality_score",
+    "tab_id", "window_id", "bookmark_id", "browser_contexts",
+    "word_count", "reading_time_minutes", "language",
+    "source_type", "author", "published_date", "modified_date"
+)
+
+# Large properties that are only fetched when explicitly requested
+PAGE_HEAVY_PROPERTIES = (
+    "content", "keywords_json", "custom_metadata_json",
+    "metadata_embedding", "content_embedding", "summary_embedding"
+)
+
+_PROPERTY_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+PropertyLoader = Callable[[str, Sequence[str]], Awaitable[Dict[str, Any]]]
+
+
+def page_projection(alias: str = "p", properties: Iterable[str] = PAGE_SUMMARY_PROPERTIES) -> str:
+    """Build a Cypher map projection returning only the given properties.
+
+    Args:
+        alias: Variable bound to the Page node
+        properties: Node properties to return
+
+    Returns:
+        Projection such as ``p {.id, .url}``
+
+    Raises:
+        ValueError: If a property name is not a plain identifier
+    """
+    names = list(dict.fromkeys(properties))
+    for name in names:
+        if not _PROPERTY_NAME_RE.match(name):
+            raise ValueError(f"Invalid page property name: {name!r}")
+    return f"{alias} {{{', '.join('.' + name for name in names)}}}"
+
+
+class LazyPage:
+    """Page hydrated from a projected row, loading heavy properties on demand.
+
+    Listing queries only return ``PAGE_SUMMARY_PROPERTIES``; attribute access
+    is delegated to the underlying Page, so a LazyPage can be used wherever a
+    listing Page is read. Heavy properties are fetched with one query on the
+    first ``load`` and cached; ``content``, keywords and custom metadata are
+    also applied to the wrapped Page.
+    """
+
+    __slots__ = ("page", "_loader", "_loaded")
+
+    def __init__(
+        self,
+        page: Page,
+        loader: PropertyLoader,
+        loaded: Optional[Dict[str, Any]] = None
+    ):
+        """Wrap a page built from summary properties.
+
+        Args:
+            page: Page reconstructed from the projected row
+            loader: Coroutine fetching properties by page URL
+            loaded: Heavy properties already present in the row
+        """
+        object.__setattr__(self, "page", page)
+        object.__setattr__(self, "_loader", loader)
+        object.__setattr__(self, "_loaded", {})
+        if loaded:
+            self._apply(loaded)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in LazyPage.__slots__:
+            raise AttributeError(name)
+        return getattr(self.page, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in LazyPage.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.page, name, value)
+
+    def __repr__(self) -> str:
+        return f"LazyPage(url={self.page.url!r}, loaded={sorted(self._loaded)})"
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._loaded
+
+    async def load(self, *properties: str) -> Dict[str, Any]:
+        """Fetch properties that have not been loaded yet.
+
+        Args:
+            properties: Property names; defaults to ``content``
+
+        Returns:
+            Mapping of each requested property to its value (None if unset)
+        """
+        properties = properties or ("content",)
+        missing = [name for name in properties if name not in self._loaded]
+        if missing:
+            values = await self._loader(self.page.url, missing)
+            self._apply({name: values.get(name) for name in missing})
+        return {name: self._loaded[name] for name in properties}
+
+    async def get(self, name: str) -> Any:
+        """Return a single property, loading it if necessary."""
+        return (await self.load(name))[name]
+
+    def _apply(self, values: Dict[str, Any]) -> None:
+        self._loaded.update(values)
+        if "content" in values:
+            self.page.content = values["content"]
+        if values.get("keywords_json"):
+            self.page.keywords = json.loads(values["keywords_json"])
+        if values.get("custom_metadata_json"):
+            self.page.metadata.custom_metadata = json.loads(values["custom_metadata_json"])
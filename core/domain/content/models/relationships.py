@@ -4,6 +4,7 @@ from datetime import datetime
 from collections import defaultdict
 
 from ..types import KeywordType, RelationType
+from ..analysis import AnalysisContext, keyword_doc
 from core.utils.logger import get_logger
 
 
@@ -79,6 +80,27 @@ class Relationship:
         }
 
 
+@dataclass
+class RelationshipState:
+    """Relationship detection state for a single page.
+
+    Each page analysed gets its own state, so pages can be processed
+    concurrently without clearing or overwriting each other's results.
+
+    Attributes:
+        document_id: Page the state belongs to
+        relationships: Detected relationships keyed by (source_id, target_id)
+        keyword_types: Types of keywords registered for this page
+        keyword_metadata: Additional per-keyword context
+        keyword_texts: Original text of keywords registered for this page
+    """
+    document_id: Optional[str] = None
+    relationships: Dict[tuple[str, str], Relationship] = field(default_factory=dict)
+    keyword_types: Dict[str, KeywordType] = field(default_factory=dict)
+    keyword_metadata: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    keyword_texts: Dict[str, str] = field(default_factory=dict)
+
+
 class RelationshipManager:
     """Manages the creation and tracking of relationships between keywords.
     
@@ -90,6 +112,11 @@ class RelationshipManager:
     - Semantic similarity-based relationship detection
     - Contextual proximity relationship creation
     - Hierarchical relationship inference
+
+    Detection is re-entrant: every call works on its own RelationshipState
+    and keeps no data on the manager once the caller drops the state.
+    Methods that accept ``state`` fall back to a default state for callers
+    that manage relationships outside of per-page detection.
     """
     
     def __init__(self, nlp=None):
@@ -99,13 +126,7 @@ class RelationshipManager:
         Args:
             nlp: Optional NLP model for semantic analysis
         """
-        # Existing relationship storage
-        self._relationships: Dict[tuple[str, str], Relationship] = {}
-        self._keyword_types: Dict[str, KeywordType] = {}
-        
-        # New attribute for storing additional keyword context
-        self._keyword_metadata: Dict[str, Dict[str, Any]] = {}
-        self._keyword_texts: Dict[str, str] = {}
+        self._default_state = RelationshipState()
         
         # Logging for relationship manager
         self.logger = get_logger(__name__)
@@ -113,10 +134,15 @@ class RelationshipManager:
         # NLP model for semantic analysis
         self.nlp = nlp
     
+    def new_state(self, document_id: Optional[str] = None) -> RelationshipState:
+        """Create an empty per-page state."""
+        return RelationshipState(document_id=document_id)
+
     def register_keyword(self, 
                         keyword_id: str, 
                         keyword_type: KeywordType, 
-                        original_text: Optional[str] = None) -> None:
+                        original_text: Optional[str] = None,
+                        state: Optional[RelationshipState] = None) -> None:
         """
         Enhanced keyword registration with optional original text.
         
@@ -124,42 +150,44 @@ class RelationshipManager:
             keyword_id: Unique identifier for the keyword
             keyword_type: Type of keyword
             original_text: Original text of the keyword (optional)
+            state: Page state to register into (defaults to the shared default state)
         """
-        # Existing registration logic
-        self._keyword_types[keyword_id] = keyword_type
+        state = state or self._default_state
+        state.keyword_types[keyword_id] = keyword_type
         
         # Store original text if provided
         if original_text:
-            self._keyword_texts[keyword_id] = original_text
+            state.keyword_texts[keyword_id] = original_text
 
     def detect_relationships(
         self, 
         keywords: List[Dict[str, Any]], 
-        context: Dict[str, Any]
-    ) -> None:
+        context: Dict[str, Any],
+        state: Optional[RelationshipState] = None
+    ) -> RelationshipState:
         """
         Comprehensive relationship detection method.
         
         Args:
             keywords: List of keyword dictionaries
             context: Processing context containing content details
-        """
+            state: Page state to fill (a new one is created if not provided)
 
-        # Clear previous relationship data
-        self._relationships.clear()
-        self._keyword_types.clear()
-        self._keyword_metadata.clear()
-        self._keyword_texts.clear()
+        Returns:
+            The page's RelationshipState
+        """
+        # Get document identifier from context
+        document_id = context.get('document_id')
+        if state is None:
+            state = self.new_state(document_id)
 
         # Only proceed if we have multiple keywords
         if len(keywords) < 2:
-            return
+            return state
         
-        # Get document identifier from context
-        document_id = context.get('document_id')
         if not document_id:
             self.logger.warning("No document_id in context, relationships may be incorrect")
-            return
+            return state
         
         # Filter keywords and content to current document only
         doc_keywords = [k for k in keywords if k.get('document_id') == document_id]
@@ -167,12 +195,16 @@ class RelationshipManager:
         self.logger.debug(f"Keywords being processed: {[k.get('canonical_text', '') for k in doc_keywords]}")
         
         doc_content = context.get('cleaned_content', '')
+        analysis: Optional[AnalysisContext] = context.get('analysis')
+        if analysis is not None and not analysis.covers(doc_content):
+            analysis = None
         
         # Create document-specific context
         doc_context = {
             'document_id': document_id,
             'cleaned_content': doc_content,
-            'original_url': context.get('original_url')
+            'original_url': context.get('original_url'),
+            'analysis': analysis
         }
 
         # Logging for debugging
@@ -180,20 +212,27 @@ class RelationshipManager:
         
         # Perform different types of relationship detection
         try:
-            self._detect_semantic_relationships(doc_keywords, document_id)
-            self._detect_contextual_relationships(doc_keywords, doc_context)
-            self._detect_hierarchical_relationships(doc_keywords, document_id)
+            self._detect_semantic_relationships(doc_keywords, document_id, state, analysis)
+            self._detect_contextual_relationships(doc_keywords, doc_context, state)
+            self._detect_hierarchical_relationships(doc_keywords, document_id, state)
         except Exception as e:
             self.logger.error(f"Relationship detection failed: {str(e)}", exc_info=True)
 
+        return state
+
 
     def _detect_semantic_relationships(
         self, 
         keywords: List[Dict[str, Any]],
-        document_id: str
+        document_id: str,
+        state: RelationshipState,
+        analysis: Optional[AnalysisContext] = None
     ) -> None:
         """
         Detect semantic relationships using NLP similarity.
+
+        Keyword vectors come from their spans in the page's shared Doc when
+        an analysis context is available.
         """
         if not self.nlp:
             return
@@ -214,7 +253,7 @@ class RelationshipManager:
         for kw in doc_keywords:
             keyword_id = kw['id']
             text = kw.get('canonical_text', str(kw))
-            keyword_docs[keyword_id] = self.nlp(text)
+            keyword_docs[keyword_id] = keyword_doc(text, self.nlp, analysis)
 
         
         # Compare each keyword with others
@@ -255,7 +294,8 @@ class RelationshipManager:
                         source_id=source_id,
                         target_id=target_id,
                         rel_type=rel_type,
-                        evidence=evidence
+                        evidence=evidence,
+                        state=state
                     )
 
                     # Update relationship counts
@@ -265,12 +305,16 @@ class RelationshipManager:
     def _detect_contextual_relationships(
         self, 
         keywords: List[Dict[str, Any]], 
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        state: RelationshipState
     ) -> None:
         """
         Detect relationships based on contextual proximity.
         
-        Uses sentence-level context instead of entire document.
+        Uses sentence-level context instead of entire document. Keyword
+        occurrences come from the analysis context's position index, so
+        co-occurrences are collected per sentence from a single pass over
+        the content instead of scanning every sentence for every pair.
         """
 
         # Ensure NLP model is available
@@ -284,69 +328,71 @@ class RelationshipManager:
         # Filter keywords to current document
         doc_keywords = [k for k in keywords if k.get('document_id') == document_id]
     
-        # Use spaCy's sentence segmentation
-        doc = self.nlp(cleaned_content)
-        
-        # Break content into sentences
-        sentences = [sent.text.strip() for sent in doc.sents]
-        
-        # Iterate through all unique pairs of keywords
-        for i in range(len(keywords)):
-            for j in range(i + 1, len(keywords)):
-                source_kw = keywords[i]
-                target_kw = keywords[j]
-                
-                source_text = source_kw.get('canonical_text', str(source_kw))
-                target_text = target_kw.get('canonical_text', str(target_kw))
-                
-                # Track matching sentences
-                matching_sentences = []
-                
-                # Check each sentence for keyword co-occurrence
-                for sent in sentences:
-                    if source_text.lower() in sent.lower() and target_text.lower() in sent.lower():
-                        # Calculate proximity score based on keywords' positions in sentence
-                        source_pos = sent.lower().index(source_text.lower())
-                        target_pos = sent.lower().index(target_text.lower())
-                        
-                        # Calculate proximity score
-                        proximity = 1.0 / (abs(source_pos - target_pos) + 1)
-                        
-                        matching_sentences.append({
-                            'sentence': sent,
+        # Use spaCy's sentence segmentation, reusing the page's parsed Doc
+        analysis: Optional[AnalysisContext] = context.get('analysis')
+        if analysis is None:
+            analysis = AnalysisContext.parse(self.nlp, cleaned_content)
+        
+        sentences = analysis.sentence_texts
+        texts = [kw.get('canonical_text', str(kw)) for kw in keywords]
+        index = analysis.keyword_index
+        if index is None or not all(text in index for text in texts):
+            analysis.index_keywords(texts)
+
+        # First occurrence span of each keyword in each sentence it appears in
+        sentence_keywords: Dict[int, Dict[int, tuple[int, int]]] = defaultdict(dict)
+        for kw_index, text in enumerate(texts):
+            for span in analysis.positions(text):
+                present = sentence_keywords[analysis.sentence_index(span[0])]
+                if kw_index not in present:
+                    present[kw_index] = span
+
+        # Keep the closest co-occurrence for every keyword pair
+        best_matches: Dict[tuple[int, int], Dict[str, Any]] = {}
+        for sent_index, present in sentence_keywords.items():
+            if len(present) < 2:
+                continue
+            members = sorted(present)
+            for offset, i in enumerate(members):
+                for j in members[offset + 1:]:
+                    proximity = 1.0 / (abs(present[i][0] - present[j][0]) + 1)
+                    best = best_matches.get((i, j))
+                    if best is None or proximity > best['proximity']:
+                        best_matches[(i, j)] = {
+                            'sentence_id': sent_index,
+                            'source_position': present[i],
+                            'target_position': present[j],
                             'proximity': proximity
-                        })
-                
-                # If matching sentences found, create relationship
-                if matching_sentences:
-                    # Use the sentence with the highest proximity
-                    best_match = max(matching_sentences, key=lambda x: x['proximity'])
-                    
-                    # Create relationship evidence
-                    evidence = RelationshipEvidence(
-                        sentence_text=best_match['sentence'],
-                        sentence_id=0,
-                        source_position=(0, len(source_text)),
-                        target_position=(0, len(target_text)),
-                        confidence=best_match['proximity'],
-                        metadata={
-                            "detection_method": "sentence_proximity",
-                            "distance_score": best_match['proximity']
                         }
-                    )
-                    
-                    # Register relationship
-                    self.add_relationship(
-                        source_id=source_kw['id'],
-                        target_id=target_kw['id'],
-                        rel_type=RelationType.RELATED,
-                        evidence=evidence
-                    )
+
+        for (i, j), best_match in sorted(best_matches.items()):
+            # Create relationship evidence
+            evidence = RelationshipEvidence(
+                sentence_text=sentences[best_match['sentence_id']][0],
+                sentence_id=best_match['sentence_id'],
+                source_position=best_match['source_position'],
+                target_position=best_match['target_position'],
+                confidence=best_match['proximity'],
+                metadata={
+                    "detection_method": "sentence_proximity",
+                    "distance_score": best_match['proximity']
+                }
+            )
+            
+            # Register relationship
+            self.add_relationship(
+                source_id=keywords[i]['id'],
+                target_id=keywords[j]['id'],
+                rel_type=RelationType.RELATED,
+                evidence=evidence,
+                state=state
+            )
     
     def _detect_hierarchical_relationships(
         self, 
         keywords: List[Dict[str, Any]],
-        document_id: str
+        document_id: str,
+        state: RelationshipState
     ) -> None:
         """
         Detect hierarchical relationships between keywords in the same document.
@@ -394,7 +440,8 @@ class RelationshipManager:
                         source_id=source_kw['id'],
                         target_id=target_kw['id'],
                         rel_type=rel_type,
-                        evidence=evidence
+                        evidence=evidence,
+                        state=state
                     )
 
     
@@ -402,17 +449,19 @@ class RelationshipManager:
                         source_id: str,
                         target_id: str,
                         rel_type: RelationType,
-                        evidence: RelationshipEvidence) -> None:
+                        evidence: RelationshipEvidence,
+                        state: Optional[RelationshipState] = None) -> None:
         """Add or update a relationship with new evidence."""
+        state = state or self._default_state
 
         # Register keywords if not already registered
-        if source_id not in self._keyword_types:
+        if source_id not in state.keyword_types:
             # Default to TERM type if not specified
-            self._keyword_types[source_id] = KeywordType.TERM
+            state.keyword_types[source_id] = KeywordType.TERM
 
-        if target_id not in self._keyword_types:
+        if target_id not in state.keyword_types:
             # Default to TERM type if not specified
-            self._keyword_types[target_id] = KeywordType.TERM
+            state.keyword_types[target_id] = KeywordType.TERM
 
         
         # Ensure consistent ordering for undirected relationships
@@ -425,28 +474,32 @@ class RelationshipManager:
                 )
         
         # Get or create relationship
+        relationships = state.relationships
         key = (source_id, target_id)
-        if key not in self._relationships:
-            self._relationships[key] = Relationship(
+        if key not in relationships:
+            relationships[key] = Relationship(
                 source_id=source_id,
                 target_id=target_id,
                 relationship_type=rel_type
             )
         
         # Add new evidence
-        self._relationships[key].add_evidence(evidence)
+        relationships[key].add_evidence(evidence)
     
     def get_relationship(self,
                         source_id: str,
-                        target_id: str) -> Optional[Relationship]:
+                        target_id: str,
+                        state: Optional[RelationshipState] = None) -> Optional[Relationship]:
         """Get relationship between two keywords if it exists."""
+        relationships = (state or self._default_state).relationships
+
         # Check both directions for undirected relationships
         key = (source_id, target_id)
-        if key in self._relationships:
-            return self._relationships[key]
+        if key in relationships:
+            return relationships[key]
             
         key = (target_id, source_id)
-        rel = self._relationships.get(key)
+        rel = relationships.get(key)
         if rel and rel.relationship_type in {RelationType.SYNONYM, RelationType.RELATED}:
             return rel
             
@@ -454,13 +507,14 @@ class RelationshipManager:
     
     def get_relationships_for_keyword(self,
                                     keyword_id: str,
-                                    min_confidence: float = 0.0
+                                    min_confidence: float = 0.0,
+                                    state: Optional[RelationshipState] = None
                                     ) -> List[Relationship]:
         """Get all relationships involving a keyword."""
         relationships = []
         
         # Check relationships where keyword is source
-        for (source, target), rel in self._relationships.items():
+        for (source, target), rel in (state or self._default_state).relationships.items():
             if rel.confidence < min_confidence:
                 continue
                 
@@ -476,12 +530,13 @@ class RelationshipManager:
     def get_related_keywords(self,
                            keyword_id: str,
                            rel_type: Optional[RelationType] = None,
-                           min_confidence: float = 0.0
+                           min_confidence: float = 0.0,
+                           state: Optional[RelationshipState] = None
                            ) -> List[tuple[str, RelationType, float]]:
         """Get keywords related to the given keyword."""
         related = []
         
-        for rel in self.get_relationships_for_keyword(keyword_id, min_confidence):
+        for rel in self.get_relationships_for_keyword(keyword_id, min_confidence, state):
             if rel_type and rel.relationship_type != rel_type:
                 continue
                 
@@ -490,20 +545,23 @@ class RelationshipManager:
         
         return sorted(related, key=lambda x: x[2], reverse=True)
     
-    def get_keyword_type(self, keyword_id: str) -> Optional[KeywordType]:
-            """Get the type of a registered keyword."""
-            return self._keyword_types.get(keyword_id)
+    def get_keyword_type(self,
+                         keyword_id: str,
+                         state: Optional[RelationshipState] = None) -> Optional[KeywordType]:
+            """Get the type of a keyword registered in a page state."""
+            return (state or self._default_state).keyword_types.get(keyword_id)
         
     def prepare_neo4j_relationships(
         self, 
-        min_confidence: float = 0.5  # Moderate confidence threshold
+        min_confidence: float = 0.5,  # Moderate confidence threshold
+        state: Optional[RelationshipState] = None
     ) -> List[Dict[str, Any]]:
         """
         Prepare relationships for Neo4j storage with moderate confidence threshold.
         """
         neo4j_rels = []
         
-        for rel in self._relationships.values():
+        for rel in (state or self._default_state).relationships.values():
             # More moderate confidence threshold
             if rel.confidence < min_confidence:
                 continue
@@ -1,5 +1,5 @@
 import asyncio
-import spacy
+import logging
 from datetime import datetime
 from dataclasses import dataclass
 
@@ -21,6 +21,8 @@ from .extractors import (
     BaseExtractor
 )
 from .validation import KeywordValidator
+from .analysis import AnalysisContext, KeywordAnnotator
+from .document_frequency import DOCUMENT_TERMS_KEY, DocumentFrequencyStore, document_terms
 from core.utils.logger import get_logger
 from core.domain.content.pipeline import (
     PipelineComponent,
@@ -31,7 +33,7 @@ from core.domain.content.pipeline import (
 from core.domain.content.config import ContentProcessorConfig
 from core.domain.content.models.page import Page
 from core.common.errors import ProcessingError
-from core.utils.logger import get_logger
+from core.utils.logger import Fields, Lazy
 
 
 logger = get_logger(__name__)
@@ -87,12 +89,14 @@ class KeywordProcessor:
         self.logger = get_logger(__name__)
 
     def process_keywords(self,
-                        raw_results: List[List[RawKeyword]]
+                        raw_results: List[List[RawKeyword]],
+                        analysis: Optional[AnalysisContext] = None
                         ) -> List[KeywordIdentifier]:
         """Process raw keywords into normalized form.
         
         Args:
             raw_results: Raw keywords from multiple extractors
+            analysis: Optional parsed page content used by validation rules
             
         Returns:
             List of processed KeywordIdentifier instances
@@ -105,7 +109,7 @@ class KeywordProcessor:
             grouped_keywords = self._group_by_normalized_text(raw_results)
             
             # Process each group into a KeywordIdentifier
-            processed_keywords = []
+            candidates = []
             seen_canonical_forms = set()
             
             for norm_text, keywords in grouped_keywords.items():
@@ -134,12 +138,17 @@ class KeywordProcessor:
                     score=round(score, 2)
                 )
                 
-                if self.validator.is_valid(identifier):
-                    processed_keywords.append(identifier)
-                else:
-                    self.logger.debug(
-                        f"Keyword '{identifier.canonical_text}' failed validation"
-                    )
+                candidates.append(identifier)
+
+            # Validate all candidates in one batch
+            processed_keywords = self.validator.filter_valid(candidates, analysis)
+            if len(processed_keywords) < len(candidates):
+                valid_ids = {id(kw) for kw in processed_keywords}
+                for identifier in candidates:
+                    if id(identifier) not in valid_ids:
+                        self.logger.debug(
+                            f"Keyword '{identifier.canonical_text}' failed validation"
+                        )
             
             self.logger.info(
                 f"Processed {sum(len(r) for r in raw_results)} raw keywords "
@@ -182,27 +191,31 @@ class KeywordProcessor:
         total_weight = 0
         total_score = 0
         
-        # Add debug logging
-        self.logger.debug(f"Starting score calculation for {len(keywords)} keywords")
+        # Called once per keyword group, so per-keyword tracing is guarded
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Starting score calculation for %d keywords", len(keywords))
         
         # Sort keywords by score to prioritize high-confidence entries
         sorted_keywords = sorted(keywords, key=lambda kw: kw.score, reverse=True)
         
         for kw in sorted_keywords:
-            # Debug log for each keyword
-            self.logger.debug(f"Processing keyword: {kw.text}")
-            self.logger.debug(f"  Original score: {kw.score}")
-            self.logger.debug(f"  Frequency: {kw.frequency}")
-            self.logger.debug(f"  Source: {kw.source}")
+            if debug:
+                self.logger.debug(
+                    "Processing keyword %s",
+                    Fields(text=kw.text, score=kw.score, frequency=kw.frequency, source=kw.source)
+                )
             
             # Skip extremely low-confidence keywords
             if kw.score < CONFIDENCE_THRESHOLD:
-                self.logger.debug(f"  Skipping - below confidence threshold")
+                if debug:
+                    self.logger.debug("  Skipping - below confidence threshold")
                 continue
             
             # Limit sources, but be more lenient
             if len(source_scores) >= MAX_SOURCES:
-                self.logger.debug(f"  Reached max sources limit")
+                if debug:
+                    self.logger.debug("  Reached max sources limit")
                 break
             
             # Softer decay for source repetition
@@ -221,17 +234,20 @@ class KeywordProcessor:
             # Track source
             source_scores[kw.source] = combined_score
             
-            # Debug log for this iteration's calculations
-            self.logger.debug(f"  Combined score: {combined_score}")
-            self.logger.debug(f"  Source weight: {source_weight}")
-            self.logger.debug(f"  Current total score: {total_score}")
-            self.logger.debug(f"  Current total weight: {total_weight}")
+            if debug:
+                self.logger.debug(
+                    "  %s",
+                    Fields(
+                        combined_score=combined_score, source_weight=source_weight,
+                        total_score=total_score, total_weight=total_weight
+                    )
+                )
         
         # Normalize score with a slightly higher baseline
         normalized_score = min(1.0, max(0.0, total_score / total_weight)) if total_weight > 0 else 0.0
         
-        # Final debug logging
-        self.logger.debug(f"Final normalized score: {normalized_score}")
+        if debug:
+            self.logger.debug("Final normalized score: %s", normalized_score)
         
         return normalized_score if normalized_score > 0.3 else 0.0
 
@@ -266,7 +282,8 @@ class ContentProcessor(PipelineComponent):
         relationship_manager: Optional[RelationshipManager] = None,
         normalizer: Optional[KeywordNormalizer] = None,
         validator: Optional[KeywordValidator] = None,
-        debug_mode: bool = False
+        debug_mode: bool = False,
+        df_store: Optional[DocumentFrequencyStore] = None
     ):
         """Initialize with required dependencies."""
         self.config = config
@@ -275,6 +292,7 @@ class ContentProcessor(PipelineComponent):
         
         # Initialize text processing
         self.nlp = nlp
+        self.annotator = KeywordAnnotator(nlp, batch_size=config.nlp_batch_size)
         self.text_cleaner = TextCleaner()
         self.html_processor = HTMLProcessor(self.text_cleaner)
         
@@ -291,7 +309,7 @@ class ContentProcessor(PipelineComponent):
         # Initialize extractors
         self.extractors: List[BaseExtractor] = [
             RakeExtractor(config.extractor_config, self.keyword_processor.normalizer),
-            TfidfExtractor(config.extractor_config, self.keyword_processor.normalizer),
+            TfidfExtractor(config.extractor_config, self.keyword_processor.normalizer, df_store=df_store),
             NamedEntityExtractor(config.extractor_config, self.keyword_processor.normalizer, nlp=nlp)
         ]
 
@@ -359,27 +377,43 @@ class ContentProcessor(PipelineComponent):
             raise ValidationError(f"Content validation failed: {str(e)}") from e
 
 
-    def _consolidate_raw_keywords(self, raw_results: List[List[RawKeyword]]) -> List[RawKeyword]:
+    def _consolidate_raw_keywords(self,
+                                  raw_results: List[List[RawKeyword]],
+                                  analysis: Optional[AnalysisContext] = None
+                                  ) -> List[RawKeyword]:
         """Consolidate raw keywords from multiple extractors.
         
         Args:
             raw_results: List of keyword lists from different extractors
+            analysis: Optional parsed page content; lemmas are read from the
+                keyword's span in it before falling back to parsing the keyword
             
         Returns:
             List of consolidated RawKeyword instances
         """
         # First flatten all results
         all_keywords = [kw for extractor_results in raw_results for kw in extractor_results]
-        self.logger.debug(f"Pre-consolidation keywords: {[kw.text for kw in all_keywords]}")
+        self.logger.debug("Pre-consolidation keywords: %s", Lazy(lambda: [kw.text for kw in all_keywords]))
         
+        # Resolve lemmatized forms, preserving multi-word phrases: from the
+        # page Doc where possible, then one batched pass for the remainder
+        lemma_keys: Dict[str, str] = {}
+        missing = []
+        for keyword in all_keywords:
+            if keyword.text in lemma_keys:
+                continue
+            lemma_key = analysis.lemma_key(keyword.text) if analysis is not None else None
+            if lemma_key is None:
+                missing.append(keyword.text)
+            else:
+                lemma_keys[keyword.text] = lemma_key
+        for text, annotation in self.annotator.annotate(missing).items():
+            lemma_keys[text] = annotation.lemma_key
+
         # Group by lemmatized form
         consolidated = {}
         for keyword in all_keywords:
-            # Process with spaCy to get lemma
-            doc = self.nlp(keyword.text)
-            # Get lemmatized form, preserving multi-word phrases
-            lemma_parts = [token.lemma_ for token in doc]
-            lemma_key = ' '.join(lemma_parts)
+            lemma_key = lemma_keys[keyword.text]
             
             if lemma_key not in consolidated:
                 consolidated[lemma_key] = keyword
@@ -394,7 +428,21 @@ class ContentProcessor(PipelineComponent):
                 existing.metadata.update(keyword.metadata)
         
         result = list(consolidated.values())
-        self.logger.debug(f"Post-consolidation keywords: {[kw.text for kw in result]}")
+
+        # Locate all variants of all keywords in one pass over the content
+        if analysis is not None:
+            analysis.index_keywords(
+                variant for keyword in result for variant in keyword.variants
+            )
+            for keyword in result:
+                positions = {
+                    span
+                    for variant in keyword.variants
+                    for span in analysis.positions(variant)
+                }
+                if positions:
+                    keyword.positions = sorted(positions)
+        self.logger.debug("Post-consolidation keywords: %s", Lazy(lambda: [kw.text for kw in result]))
         return result
 
 
@@ -455,33 +503,34 @@ class ContentProcessor(PipelineComponent):
             
             self.logger.debug(f"Cleaned content length: {len(cleaned_content)}")
 
-            
-            
-            # Store cleaned content in page metadata for future use
-            page.metadata.custom_metadata['cleaned_content'] = cleaned_content
+            # Record metrics only; the cleaned text is not copied into metadata
             page.metadata.custom_metadata['content_metrics'] = {
                 'original_length': len(raw_content),
                 'cleaned_length': len(cleaned_content),
                 'is_html': is_html
             }
             
+            # Parse the cleaned content once; every later step reads this Doc
+            analysis = AnalysisContext.parse(self.nlp, cleaned_content)
+
             # Extract keywords using all extractors
-            raw_results = await self._extract_keywords(cleaned_content)
+            raw_results = await self._extract_keywords(cleaned_content, analysis)
             self.logger.debug(f"Raw keyword results: {len(raw_results)} extractor results")
 
             # Consolidate keyword variants
-            consolidated_results = self._consolidate_raw_keywords(raw_results)
+            consolidated_results = self._consolidate_raw_keywords(raw_results, analysis)
             self.logger.debug(f"Consolidated results: {len(consolidated_results)} unique keywords")
     
             # Process keywords
-            keywords = self.keyword_processor.process_keywords([consolidated_results])
+            keywords = self.keyword_processor.process_keywords([consolidated_results], analysis)
             self.logger.debug(f"Processed keywords: {len(keywords)} keywords")
             
             # Store cleaned content in context for relationship detection
             context = {
                 'cleaned_content': cleaned_content,
                 'original_url': page.url,
-                'document_id': str(page.id)
+                'document_id': str(page.id),
+                'analysis': analysis
             }
 
             # Prepare keywords for relationship detection
@@ -493,25 +542,29 @@ class ContentProcessor(PipelineComponent):
                     'document_id': str(page.id)
                 } for kw in keywords
             ]
+            # Relationship state is per page so pages can be analysed concurrently
+            relationship_state = self.relationship_manager.new_state(str(page.id))
+
             # Register keywords with original text for relationship tracking
             for kw in keywords:
                 self.relationship_manager.register_keyword(
                     keyword_id=kw.id, 
                     keyword_type=kw.keyword_type,
-                    original_text=kw.canonical_text
+                    original_text=kw.canonical_text,
+                    state=relationship_state
                 )
             
-            # Detect relationships
-            self.relationship_manager.detect_relationships(keyword_dicts, context)
+            # Detect relationships within this page
+            self.relationship_manager.detect_relationships(
+                keyword_dicts, context, state=relationship_state
+            )
             
             # Prepare relationships for storage
             relationships = self.relationship_manager.prepare_neo4j_relationships(
-                min_confidence=self.config.relationship_confidence_threshold
+                min_confidence=self.config.relationship_confidence_threshold,
+                state=relationship_state
             )
             relationships = []
-            # Process relationships
-            for kw in keywords:
-                self.relationship_manager.register_keyword(kw.id, kw.keyword_type)
             
             # Update page with results
             page.update_keywords({
@@ -521,6 +574,11 @@ class ContentProcessor(PipelineComponent):
             
             # Store relationships in page metadata
             page.metadata.custom_metadata['relationships'] = relationships
+
+            # Corpus frequencies must count the same text TF-IDF scored
+            page.metadata.custom_metadata[DOCUMENT_TERMS_KEY] = sorted(
+                document_terms(cleaned_content, page.keywords.keys())
+            )
             
             # Add processing time to page metrics
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -538,11 +596,15 @@ class ContentProcessor(PipelineComponent):
             self.logger.error(f"Content processing failed: {str(e)}", exc_info=True)
             raise ComponentError(f"Failed to process content: {str(e)}") from e
 
-    async def _extract_keywords(self, content: str) -> List[List[RawKeyword]]:
+    async def _extract_keywords(self,
+                                content: str,
+                                analysis: Optional[AnalysisContext] = None
+                                ) -> List[List[RawKeyword]]:
         """Extract keywords using all available extractors.
         
         Args:
             content: Text to extract keywords from
+            analysis: Optional parsed context for ``content``
             
         Returns:
             List of keyword lists, one from each extractor
@@ -556,7 +618,7 @@ class ContentProcessor(PipelineComponent):
         async def run_extractor(extractor: BaseExtractor) -> Optional[List[RawKeyword]]:
             try:
                 # Note: extract() is synchronous, but we run it in a task
-                return extractor.extract(content)
+                return extractor.extract(content, analysis)
             except Exception as e:
                 self.logger.error(
                     f"Extractor {extractor.__class__.__name__} failed: {e}",
@@ -1,11 +1,10 @@
 import re
-import nltk
-from readability import Document
 from bs4 import BeautifulSoup
-from typing import List, Set
+from typing import FrozenSet, List, Set
 
 from api.utils.helpers import get_domain_from_url
 from core.domain.content.config import ContentProcessorConfig
+from core.domain.content.lexicon import get_lexicon
 from core.utils.logger import get_logger
 
 
@@ -71,34 +70,13 @@ class TextCleaner:
 
     
     
-    def _get_stopwords(self) -> Set[str]:
-        """Get enhanced stopwords including common non-keyword terms"""
-        stopwords = set(nltk.corpus.stopwords.words('english'))
-        
-        # Add common web/UI terms
-        ui_stopwords = {
-            'click', 'tap', 'press', 'select', 'choose', 'menu', 'navigation',
-            'login', 'logout', 'sign', 'register', 'previous', 'next', 'back',
-            'forward', 'loading', 'please', 'wait', 'search', 'close', 'open',
-            'show', 'hide', 'toggle', 'enable', 'disable', 'accept', 'cancel',
-            'submit', 'reset', 'update', 'refresh', 'reload', 'scroll'
-        }
-        
-        # Add common non-keyword verbs
-        common_verbs = {
-            'make', 'made', 'making', 'take', 'took', 'taking', 'get', 'got',
-            'getting', 'put', 'putting', 'use', 'used', 'using', 'try', 'tried',
-            'trying', 'call', 'called', 'calling', 'work', 'worked', 'working'
-        }
-        
-        # Add common connecting words
-        connectors = {
-            'like', 'such', 'via', 'etc', 'ie', 'eg', 'example', 'including',
-            'include', 'included', 'includes', 'might', 'may', 'could', 'would',
-            'should', 'must', 'shall', 'will', 'can', 'cannot', 'cant'
-        }
-        
-        return stopwords.union(ui_stopwords, common_verbs, connectors)
+    def _get_stopwords(self) -> FrozenSet[str]:
+        """Get enhanced stopwords including common non-keyword terms.
+
+        NLTK's English list plus web/UI terms, common verbs and connectors,
+        taken from the shared lexicon rather than loading the corpus per instance.
+        """
+        return get_lexicon().stopwords
      
     def _get_punctuations(self) -> Set[str]:
         """Get punctuation marks to be treated as word separators"""
@@ -174,6 +152,9 @@ class HTMLProcessor:
             return html_text
             
         try:
+            # Imported on first use; readability pulls in lxml
+            from readability import Document
+
             # First use readability to get main content
             doc = Document(html_text)
             content_html = doc.summary()
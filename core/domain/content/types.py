@@ -13,12 +13,16 @@ class KeywordType(str, Enum):
     CUSTOM = "custom"
 
 class RelationType(Enum):
-    """Types of relationships between pages."""
+    """Types of relationships between pages and between keywords."""
     LINKS_TO = "links_to"         # Direct link
     SIMILAR_TO = "similar_to"     # Content similarity
     PRECEDES = "precedes"         # Temporal relationship
     REFERENCES = "references"     # Citation/reference
     PART_OF = "part_of"          # Hierarchical relationship
+    # Relationships between keywords of a page
+    RELATED = "related"           # Co-occurring or overlapping keywords
+    SYNONYM = "synonym"           # Near-identical meaning
+    HIERARCHICAL = "hierarchical" # Concept containing a narrower term
 
 class BrowserContext(Enum):
     """Represents the browser context of a page."""
@@ -46,7 +50,7 @@ class PageRelationship:
     strength: float = 1.0
     metadata: Dict = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class PageMetrics:
     """Tracks various metrics about the page."""
     quality_score: float = 0.0
@@ -245,7 +249,7 @@ class BatchMetadata:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PageMetadata:
     """Metadata associated with a webpage.
     
@@ -277,6 +281,11 @@ class PageMetadata:
     author: Optional[str] = None
     published_date: Optional[datetime] = None
     modified_date: Optional[datetime] = None
+
+    # Lifecycle timestamps maintained by Page
+    last_active: Optional[datetime] = None
+    processed_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
     
     # Collections that need their own instances
     custom_metadata: Dict[str, Any] = field(default_factory=dict)
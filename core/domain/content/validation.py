@@ -1,15 +1,31 @@
 from dataclasses import dataclass, field
-from typing import Set
+import functools
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 import re
 from abc import ABC, abstractmethod
-import spacy
 from core.utils.logger import get_logger
 from .keyword_identifier import KeywordIdentifier
 from .abbreviations import AbbreviationService
+from .analysis import (
+    AnalysisContext,
+    KeywordAnnotator,
+    DEFAULT_PIPE_BATCH_SIZE,
+    keyword_doc
+)
 from core.common.errors import ProcessingError
 
+if TYPE_CHECKING:
+    import spacy
+
 logger = get_logger(__name__)
 
+
+@functools.lru_cache(maxsize=None)
+def _compile_patterns(patterns: Tuple[str, ...], flags: int = 0) -> Tuple[re.Pattern, ...]:
+    """Compile rule patterns once per process; rule instances share the result."""
+    return tuple(re.compile(pattern, flags) for pattern in patterns)
+
+
 @dataclass
 class ValidationConfig:
     """Configuration for keyword validation.
@@ -19,6 +35,7 @@ class ValidationConfig:
         forbidden_starts: Words that cannot start a keyword
         min_word_length: Minimum length for non-abbreviation words
         allow_numbers: Whether to allow numbers in keywords
+        pipe_batch_size: Keywords per nlp.pipe batch when pre-parsing candidates
     """
     max_words: int = 4
     forbidden_starts: Set[str] = field(default_factory=lambda: {
@@ -27,6 +44,7 @@ class ValidationConfig:
     })
     min_word_length: int = 3
     allow_numbers: bool = False
+    pipe_batch_size: int = DEFAULT_PIPE_BATCH_SIZE
 
 
 class ValidationRule(ABC):
@@ -36,6 +54,10 @@ class ValidationRule(ABC):
     1. Accept a KeywordIdentifier in their is_valid method
     2. Handle variants appropriately
     3. Document specific validation criteria
+
+    Rules that need linguistic annotations get them through ``_doc``, which
+    serves the keyword's span from the page's AnalysisContext when one is
+    given and only parses the keyword on its own as a fallback.
     """
     
     def __init__(self, nlp: 'spacy.language.Language'):
@@ -43,10 +65,16 @@ class ValidationRule(ABC):
         self.nlp = nlp
     
     @abstractmethod
-    def is_valid(self, keyword: KeywordIdentifier) -> bool:
+    def is_valid(self,
+                 keyword: KeywordIdentifier,
+                 analysis: Optional[AnalysisContext] = None) -> bool:
         """Validate if a keyword meets the rule's criteria."""
         pass
 
+    def _doc(self, text: str, analysis: Optional[AnalysisContext] = None):
+        """Get spaCy tokens for a keyword, preferring the shared page Doc."""
+        return keyword_doc(text, self.nlp, analysis)
+
 
 class BasicTextRule(ValidationRule):
     """Validates basic text characteristics."""
@@ -60,9 +88,13 @@ class BasicTextRule(ValidationRule):
         self.abbreviation_service = abbreviation_service
         
         # Compile patterns for invalid characters
-        self.invalid_chars = re.compile(r'[^\w\s-]' if config.allow_numbers else r'[^a-zA-Z\s-]')
+        self.invalid_chars = _compile_patterns(
+            (r'[^\w\s-]' if config.allow_numbers else r'[^a-zA-Z\s-]',)
+        )[0]
     
-    def is_valid(self, keyword: KeywordIdentifier) -> bool:
+    def is_valid(self,
+                 keyword: KeywordIdentifier,
+                 analysis: Optional[AnalysisContext] = None) -> bool:
         """Check basic text validity."""
         # Check all variants
         for text in keyword.variants:
@@ -130,13 +162,10 @@ class SemanticFilterRule(ValidationRule):
         }
 
         # Compile patterns
-        self.compiled_patterns = [
-            (re.compile(pattern, re.IGNORECASE), category)
-            for pattern, category in (
-                [(p, 'temporal') for p in self.temporal_patterns] +
-                [(p, 'quantity') for p in self.quantity_patterns]
-            )
-        ]
+        self.compiled_patterns = (
+            [(p, 'temporal') for p in _compile_patterns(tuple(self.temporal_patterns), re.IGNORECASE)] +
+            [(p, 'quantity') for p in _compile_patterns(tuple(self.quantity_patterns), re.IGNORECASE)]
+        )
 
     def _is_meaningful_compound(self, doc: 'spacy.tokens.Doc') -> bool:
         """Check if a multi-word term forms a meaningful compound."""
@@ -165,15 +194,17 @@ class SemanticFilterRule(ValidationRule):
         ]
         return pos_sequence in meaningful_patterns
 
-    def is_valid(self, keyword: KeywordIdentifier) -> bool:
+    def is_valid(self,
+                 keyword: KeywordIdentifier,
+                 analysis: Optional[AnalysisContext] = None) -> bool:
         """Check if keyword should be included based on semantic rules."""
         # Check all variants
         for variant in keyword.variants:
             text = variant.lower()
             words = text.split()
             
-            # Process with spaCy
-            doc = self.nlp(text)
+            # Get spaCy annotations (shared page Doc when available)
+            doc = self._doc(text, analysis)
             
             # If it's a single word
             if len(words) == 1:
@@ -227,16 +258,19 @@ class CodePatternRule(ValidationRule):
             
             # Compile patterns with appropriate flags
             self.compiled_patterns = (
-                [re.compile(p) for p in self.case_sensitive_patterns] +
-                [re.compile(p, re.I) for p in self.case_insensitive_patterns]
+                _compile_patterns(tuple(self.case_sensitive_patterns)) +
+                _compile_patterns(tuple(self.case_insensitive_patterns), re.I)
             )
 
 
-    def is_valid(self, keyword: KeywordIdentifier) -> bool:
+    def is_valid(self,
+                 keyword: KeywordIdentifier,
+                 analysis: Optional[AnalysisContext] = None) -> bool:
             """Check if keyword contains code-like patterns.
             
             Args:
                 keyword: KeywordIdentifier to validate
+                analysis: Optional analysis context for the page
                 
             Returns:
                 bool: True if no code patterns are found
@@ -247,8 +281,8 @@ class CodePatternRule(ValidationRule):
                 if self.abbreviation_service.is_abbreviation(variant):
                     continue
                     
-                # Create spaCy doc for linguistic analysis
-                doc = self.nlp(variant)
+                # Get spaCy tokens for linguistic analysis
+                doc = self._doc(variant, analysis)
                 
                 # Check for code keywords
                 if any(token.text.lower() in self.code_keywords for token in doc):
@@ -272,10 +306,13 @@ class CodePatternRule(ValidationRule):
 class GrammaticalRule(ValidationRule):
     """Validates phrase grammatical structure.
     
-    Requires spaCy Doc with tokenization, POS tagging, and dependency parsing.
+    Only POS and fine-grained tags are read, so keywords that do not occur
+    in the page are annotated through the shared KeywordAnnotator cache
+    (parser and NER disabled) instead of a full parse.
     """
-    def __init__(self, nlp: spacy.language.Language):
+    def __init__(self, nlp: 'spacy.language.Language', batch_size: int = DEFAULT_PIPE_BATCH_SIZE):
         super().__init__(nlp)
+        self.annotator = KeywordAnnotator(nlp, batch_size=batch_size)
         self.valid_patterns = [
             ['NOUN'], ['PROPN'],
             ['ADJ', 'NOUN'], ['ADJ', 'PROPN'],
@@ -291,32 +328,38 @@ class GrammaticalRule(ValidationRule):
             ['PROPN', 'PROPN', 'PROPN', 'PROPN']
         ]
 
-    def is_valid(self, keyword: KeywordIdentifier) -> bool:
+    def is_valid(self,
+                 keyword: KeywordIdentifier,
+                 analysis: Optional[AnalysisContext] = None) -> bool:
         """Check if phrase has valid grammatical structure.
         
         Args:
-            phrase: Text to check
-            doc: spaCy Doc with POS tags and dependency parse
+            keyword: KeywordIdentifier to validate
+            analysis: Optional analysis context for the page
             
         Returns:
             bool: True if phrase has valid grammar structure
         """
 
-        # Process canonical form
-        doc = self.nlp(keyword.canonical_text)
-
-        # Get POS sequence
-        pos_sequence = [token.pos_ for token in doc]
+        # Process canonical form, in context when it occurs in the page
+        span = analysis.span_for(keyword.canonical_text) if analysis is not None else None
+        if span is not None:
+            pos_sequence = [token.pos_ for token in span]
+            tags = [token.tag_ for token in span]
+        else:
+            annotation = self.annotator.annotate_one(keyword.canonical_text)
+            pos_sequence = list(annotation.pos)
+            tags = list(annotation.tags)
 
         # Must have at least one noun or gerund
         if not any(pos in {'NOUN', 'PROPN'} for pos in pos_sequence) and \
-           not any(token.pos_ == 'VERB' and token.tag_ == 'VBG' for token in doc):
+           not any(pos == 'VERB' and tag == 'VBG' for pos, tag in zip(pos_sequence, tags)):
             return False
 
         # Handle gerunds by treating them as nouns
         pos_sequence = [
-            'NOUN' if (pos == 'VERB' and token.tag_ == 'VBG') else pos
-            for pos, token in zip(pos_sequence, doc)
+            'NOUN' if (pos == 'VERB' and tag == 'VBG') else pos
+            for pos, tag in zip(pos_sequence, tags)
         ]
 
         # Check against valid patterns
@@ -363,7 +406,7 @@ class TextPatternRule(ValidationRule):
             r'(https?|ftp):\/\/',  # URLs
             r'[^a-zA-Z\s-]' if not self.config.allow_numbers else r'[^a-zA-Z0-9\s-]',  # Non-letter characters
         ]
-        self.compiled_patterns = [re.compile(p) for p in self.invalid_patterns]
+        self.compiled_patterns = _compile_patterns(tuple(self.invalid_patterns))
         
         # Linguistic patterns
         self.invalid_deps = {
@@ -383,12 +426,17 @@ class TextPatternRule(ValidationRule):
             'X',        # Other
         }
 
-    def is_valid(self, keyword: KeywordIdentifier) -> bool:
+    def is_valid(self,
+                 keyword: KeywordIdentifier,
+                 analysis: Optional[AnalysisContext] = None) -> bool:
         """Check if keyword matches valid text patterns."""
+        # Already imported by the time a model exists
+        from spacy.tokens import Span
+
         # Process each variant
         for variant in keyword.variants:
-            # Create spaCy doc for linguistic analysis
-            doc = self.nlp(variant)
+            # Get spaCy tokens for linguistic analysis
+            doc = self._doc(variant, analysis)
             
             # Basic text checks from former BasicTextRule
             words = variant.split()
@@ -425,9 +473,13 @@ class TextPatternRule(ValidationRule):
             if doc[0].pos_ in {'ADP', 'CCONJ', 'SCONJ'}:
                 return False
                 
-            # Check dependency structure
+            # Check dependency structure; a span cut from the page Doc
+            # has no ROOT of its own, so use its syntactic head instead
             if len(doc) > 1:
-                root = [token for token in doc if token.dep_ == 'ROOT']
+                if isinstance(doc, Span):
+                    root = [doc.root]
+                else:
+                    root = [token for token in doc if token.dep_ == 'ROOT']
                 if not root or root[0].pos_ not in {'NOUN', 'PROPN', 'ADJ'}:
                     return False
 
@@ -441,6 +493,7 @@ class KeywordValidator:
                  config: ValidationConfig,
                  abbreviation_service: AbbreviationService):
         """Initialize validator with spaCy model and config."""
+        self.nlp = nlp
         self.config = config
         self.abbreviation_service = abbreviation_service
         self.logger = get_logger(__name__)
@@ -456,7 +509,7 @@ class KeywordValidator:
         # Initialize validation rules with required dependencies
         self.rules = [
             CodePatternRule(nlp, abbreviation_service),
-            GrammaticalRule(nlp),
+            GrammaticalRule(nlp, batch_size=config.pipe_batch_size),
             TextPatternRule(nlp, text_pattern_config),
             SemanticFilterRule(nlp)
         ]
@@ -465,11 +518,14 @@ class KeywordValidator:
             logger.info(f"Loaded rule: {rule.__class__.__name__}")
             
     
-    def is_valid(self, keyword: KeywordIdentifier) -> bool:
+    def is_valid(self,
+                 keyword: KeywordIdentifier,
+                 analysis: Optional[AnalysisContext] = None) -> bool:
         """Validate a keyword against all rules.
         
         Args:
             keyword: Keyword to validate
+            analysis: Optional analysis context for the keyword's page
             
         Returns:
             True if keyword passes all validation rules
@@ -477,7 +533,7 @@ class KeywordValidator:
         try:
             # Apply each rule
             for rule in self.rules:
-                if not rule.is_valid(keyword):
+                if not rule.is_valid(keyword, analysis):
                     self.logger.debug(
                         f"Keyword '{keyword.canonical_text}' failed "
                         f"{rule.__class__.__name__}"
@@ -490,5 +546,34 @@ class KeywordValidator:
             self.logger.error(f"Validation error: {e}", exc_info=True)
             raise ProcessingError(f"Validation failed: {str(e)}")
 
+    def filter_valid(self,
+                     keywords: List[KeywordIdentifier],
+                     analysis: Optional[AnalysisContext] = None
+                     ) -> List[KeywordIdentifier]:
+        """Validate a batch of keywords.
+
+        With an analysis context, every canonical form and variant that does
+        not occur in the page is parsed up front in one ``nlp.pipe`` pass, so
+        the rules never parse keywords one at a time.
+
+        Args:
+            keywords: Keywords to validate
+            analysis: Optional analysis context for the keywords' page
+
+        Returns:
+            Keywords that pass all validation rules, in input order
+        """
+        if analysis is not None and keywords and self.nlp is not None:
+            texts = []
+            for keyword in keywords:
+                texts.append(keyword.canonical_text)
+                for variant in keyword.variants:
+                    # SemanticFilterRule looks variants up lowercased
+                    texts.extend((variant, variant.lower()))
+            parsed = analysis.preparse(texts, self.nlp, batch_size=self.config.pipe_batch_size)
+            self.logger.debug(f"Pre-parsed {parsed} keyword strings not found in page content")
+
+        return [keyword for keyword in keywords if self.is_valid(keyword, analysis)]
+
 
 
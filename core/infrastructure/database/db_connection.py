@@ -1,8 +1,10 @@
 import neo4j
 import asyncio
+import time
 
-from typing import Dict, List, Optional, AsyncIterator
+from typing import Any, Dict, List, Optional, AsyncIterator, Set
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession
 from neo4j.exceptions import (
     Neo4jError,
@@ -11,7 +13,13 @@ from neo4j.exceptions import (
 )
 from core.common.errors import DatabaseError, QueryTimeoutError, QueryExecutionError
 from core.utils.logger import get_logger
-from core.infrastructure.database.metrics import DatabaseMetrics
+from core.infrastructure.database.metrics import (
+    DatabaseMetrics,
+    QueryMetrics,
+    QueryMetricsConfig,
+    compact_plan,
+    is_read_query
+)
 from core.infrastructure.database.transactions import (
     Transaction, 
     TransactionManager, 
@@ -28,7 +36,8 @@ class ConnectionConfig:
         auth_enabled: bool = True,
         max_connection_pool_size: int = 50,
         connection_timeout: int = 30,
-        transaction_config: Optional[TransactionConfig] = None
+        transaction_config: Optional[TransactionConfig] = None,
+        query_metrics_config: Optional[QueryMetricsConfig] = None
     ):
         self.uri = uri
         self.username = username
@@ -37,6 +46,57 @@ class ConnectionConfig:
         self.max_connection_pool_size = max_connection_pool_size
         self.connection_timeout = connection_timeout
         self.transaction_config = transaction_config or TransactionConfig()
+        self.query_metrics_config = query_metrics_config or QueryMetricsConfig()
+
+_request_sessions: ContextVar[Optional["RequestSessions"]] = ContextVar("db_request_sessions", default=None)
+
+
+class RequestSessions:
+    """Sessions shared by the queries of one request, one per access mode.
+
+    A Neo4j session runs one transaction at a time, so a query that arrives
+    while the shared session is busy (e.g. from ``asyncio.gather``), or from
+    a task that outlived the request, gets a session of its own instead.
+    """
+
+    def __init__(self, connection: "DatabaseConnection"):
+        self.connection = connection
+        self.closed = False
+        self._sessions: Dict[bool, AsyncSession] = {}
+        self._locks = {True: asyncio.Lock(), False: asyncio.Lock()}
+
+    @asynccontextmanager
+    async def acquire(self, read_only: bool) -> AsyncIterator[AsyncSession]:
+        lock = self._locks[read_only]
+        if self.closed or lock.locked():
+            async with self.connection.session(read_only=read_only) as session:
+                yield session
+            return
+
+        async with lock:
+            session = self._sessions.get(read_only)
+            if session is None:
+                session = self._sessions[read_only] = self.connection._new_session(read_only)
+            try:
+                yield session
+            except BaseException:
+                # A failed or cancelled query may leave the connection unusable
+                self._sessions.pop(read_only, None)
+                await self._close_session(session)
+                raise
+
+    async def close(self) -> None:
+        self.closed = True
+        sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            await self._close_session(session)
+
+    async def _close_session(self, session: AsyncSession) -> None:
+        try:
+            await session.close()
+        except Exception as e:
+            self.connection.logger.warning(f"Error closing request session: {str(e)}")
+
 
 class DatabaseConnection:
     """Low-level database connection management.
@@ -55,6 +115,10 @@ class DatabaseConnection:
         self._tx_manager = TransactionManager(config.transaction_config)
         self.logger = get_logger(__name__)
         self.metrics_collector = DatabaseMetrics()
+        self.query_metrics = QueryMetrics(config.query_metrics_config)
+        # Shared by all sessions, so every read sees the writes that preceded it
+        self._bookmark_manager = AsyncGraphDatabase.bookmark_manager()
+        self._profile_tasks: Set[asyncio.Task] = set()
         
     async def initialize(self) -> None:
         """Initialize and verify database connection."""
@@ -154,6 +218,8 @@ class DatabaseConnection:
             
     async def shutdown(self) -> None:
         """Clean up database connections."""
+        for task in list(self._profile_tasks):
+            task.cancel()
         if self._driver:
             try:
                 self.logger.debug("Shutting down database connection")
@@ -170,23 +236,74 @@ class DatabaseConnection:
                     cause=e
                 )
     
+    def _new_session(self, read_only: bool = False) -> AsyncSession:
+        """Open a session routed by access mode and chained by bookmarks."""
+        return self._driver.session(
+            default_access_mode=neo4j.READ_ACCESS if read_only else neo4j.WRITE_ACCESS,
+            bookmark_manager=self._bookmark_manager
+        )
+
     @asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
-        """Get a database session."""
+    async def session(self, read_only: bool = False) -> AsyncIterator[AsyncSession]:
+        """Get a database session.
+
+        Args:
+            read_only: Open a read session, which a cluster routes to a
+                read replica
+        """
         if not self._driver:
             await self.initialize()
         
         session = None
         try:
-            session = self._driver.session()
+            session = self._new_session(read_only)
             yield session
         finally:
             if session:
                 await session.close()
     
     @asynccontextmanager
-    async def transaction(self) -> AsyncIterator[Transaction]:
-        """Get a managed database transaction with enhanced error logging."""
+    async def request_scope(self) -> AsyncIterator[None]:
+        """Reuse sessions for the queries run inside the block.
+
+        Without a caller transaction, queries normally open and close a
+        session each; inside a request scope they share one session per
+        access mode, which is closed when the block exits. Nested scopes
+        reuse the outer one.
+        """
+        current = _request_sessions.get()
+        if current is not None and current.connection is self and not current.closed:
+            yield
+            return
+
+        sessions = RequestSessions(self)
+        token = _request_sessions.set(sessions)
+        try:
+            yield
+        finally:
+            _request_sessions.reset(token)
+            await sessions.close()
+
+    @asynccontextmanager
+    async def _query_session(self, read_only: bool) -> AsyncIterator[AsyncSession]:
+        """Session for a standalone query: the request's shared one, or a new one."""
+        if not self._driver:
+            await self.initialize()
+        sessions = _request_sessions.get()
+        if sessions is not None and sessions.connection is self:
+            async with sessions.acquire(read_only) as session:
+                yield session
+        else:
+            async with self.session(read_only=read_only) as session:
+                yield session
+
+    @asynccontextmanager
+    async def transaction(self, read_only: bool = False) -> AsyncIterator[Transaction]:
+        """Get a managed database transaction with enhanced error logging.
+
+        Args:
+            read_only: Run the transaction in a read session
+        """
         session = None
         tx = Transaction()
         neo4j_tx = None
@@ -198,7 +315,7 @@ class DatabaseConnection:
                 self.logger.debug("Initializing driver before transaction")
                 await self.initialize()
                 
-            session = self._driver.session()
+            session = self._new_session(read_only)
             self.logger.debug(f"Created session: {id(session)}")
             
             try:
@@ -254,14 +371,33 @@ class DatabaseConnection:
         query: str,
         parameters: Optional[Dict] = None,
         transaction: Optional[Transaction] = None,
-        read_only: bool = False,
+        read_only: Optional[bool] = None,
         transaction_id: Optional[str] = None,
         timeout: int = 15
     ) -> List[Dict]:
-        """Execute a database query with timeout and enhanced logging."""
+        """Execute a database query with timeout and enhanced logging.
+
+        Without a caller transaction the query runs as a managed transaction
+        (``execute_read``/``execute_write``), which the driver retries on
+        transient errors and routes by access mode. Retried attempts are
+        counted in the query metrics.
+
+        Args:
+            query: Cypher query
+            parameters: Query parameters
+            transaction: Caller transaction to run the query in
+            read_only: Whether the query only reads; if None it is inferred
+                from the query, treating procedure calls as writes
+            transaction_id: Unused, kept for compatibility
+            timeout: Seconds before the query is abandoned
+
+        Returns:
+            Result records as dictionaries
+        """
         self.logger.debug(f"Executing query (timeout: {timeout}s): {query[:100]}...")
         
         async def run_query(tx: Transaction) -> List[Dict]:
+            start = time.perf_counter()
             try:
                 # Verify we have a valid transaction
                 if not isinstance(tx, Transaction):
@@ -273,7 +409,7 @@ class DatabaseConnection:
                 if tx.db_transaction is None:
                     # Create a new session and initialize the transaction
                     self.logger.debug("Transaction has no database transaction, initializing")
-                    session = self._driver.session()
+                    session = self._new_session()
                     await tx.initialize_db_transaction(session)
                 
                 self.logger.debug(f"Executing query in transaction: {query[:100]}...")
@@ -297,9 +433,11 @@ class DatabaseConnection:
                 )
                 
                 self.logger.debug(f"Query completed successfully, returning {len(data)} records")
+                self._record_query(query, parameters, time.perf_counter() - start, len(data), read_only)
                 return data
                 
             except asyncio.TimeoutError:
+                self.query_metrics.record(query, time.perf_counter() - start, timed_out=True)
                 self.logger.error(f"Query execution timed out after {timeout}s")
                 raise DatabaseError(
                     message=f"Query execution timed out after {timeout}s",
@@ -307,6 +445,7 @@ class DatabaseConnection:
                     parameters=parameters
                 )
             except Exception as e:
+                self.query_metrics.record(query, time.perf_counter() - start, failed=True)
                 self.logger.error(
                     f"Query execution error: {str(e)}",
                     extra={
@@ -322,14 +461,14 @@ class DatabaseConnection:
                     cause=e
                 )
         
+        if read_only is None:
+            read_only = is_read_query(query)
+
         try:
             if transaction:
                 # Use existing transaction
                 return await run_query(transaction)
-            else:
-                # Create a new transaction through our method
-                async with self.transaction() as tx:
-                    return await run_query(tx)
+            return await self._run_managed(query, parameters, read_only, timeout)
                         
         except Exception as e:
             if isinstance(e, DatabaseError):
@@ -350,7 +489,104 @@ class DatabaseConnection:
                 cause=e
             )
 
-            
+
+    async def _run_managed(
+        self,
+        query: str,
+        parameters: Optional[Dict],
+        read_only: bool,
+        timeout: int
+    ) -> List[Dict]:
+        """Run a standalone query as a managed read or write transaction."""
+        attempts = 0
+
+        @neo4j.unit_of_work(timeout=timeout)
+        async def work(tx: neo4j.AsyncManagedTransaction) -> List[Dict]:
+            nonlocal attempts
+            attempts += 1
+            if attempts > 1:
+                self.query_metrics.record_retry(query)
+            result = await tx.run(query, parameters or {})
+            data = await result.data()
+            await result.consume()
+            return data
+
+        start = time.perf_counter()
+        try:
+            async with self._query_session(read_only) as session:
+                execute = session.execute_read if read_only else session.execute_write
+                data = await asyncio.wait_for(execute(work), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.query_metrics.record(query, time.perf_counter() - start, timed_out=True)
+            self.logger.error(f"Query execution timed out after {timeout}s")
+            raise DatabaseError(
+                message=f"Query execution timed out after {timeout}s",
+                query=query,
+                parameters=parameters
+            )
+        except Exception as e:
+            self.query_metrics.record(query, time.perf_counter() - start, failed=True)
+            self.logger.error(
+                f"Query execution error: {str(e)}",
+                extra={
+                    "query": query,
+                    "parameters": parameters,
+                    "read_only": read_only,
+                    "attempts": attempts
+                }
+            )
+            raise self._handle_database_error(e, query, parameters)
+
+        self._record_query(query, parameters, time.perf_counter() - start, len(data), read_only)
+        return data
+
+    def _record_query(
+        self,
+        query: str,
+        parameters: Optional[Dict],
+        duration: float,
+        rows: int,
+        read_only: bool
+    ) -> None:
+        """Record a successful query; profile it in the background if slow."""
+        slow_entry = self.query_metrics.record(query, duration, rows=rows)
+        if slow_entry is None or not (read_only or is_read_query(query)):
+            # PROFILE executes the query again, so writes are never profiled
+            return
+        if self.query_metrics.should_profile(query):
+            task = asyncio.create_task(self._profile_query(query, parameters, slow_entry))
+            self._profile_tasks.add(task)
+            task.add_done_callback(self._profile_tasks.discard)
+
+    async def _profile_query(self, query: str, parameters: Optional[Dict], entry: Dict[str, Any]) -> None:
+        """Re-run a slow read query with PROFILE and attach the plan to its log entry."""
+        if query.lstrip()[:7].upper() in ("PROFILE", "EXPLAIN"):
+            return
+        try:
+            async with self.session(read_only=True) as session:
+                result = await session.run(f"PROFILE {query}", parameters or {})
+                summary = await result.consume()
+            entry["profile"] = compact_plan(summary.profile)
+        except Exception as e:
+            self.logger.warning(f"Could not profile slow query: {str(e)}")
+
+    def get_query_metrics(self, sort_by: str = "total_ms", limit: int = 50) -> Dict[str, Any]:
+        """Per-fingerprint query metrics, slow-query log and transaction retries.
+
+        Args:
+            sort_by: Metric to rank fingerprints by (see ``QueryMetrics.SORT_KEYS``)
+            limit: Maximum fingerprints returned
+
+        Returns:
+            Summary, top queries, slow queries and retry state
+        """
+        return {
+            "summary": self.query_metrics.summary(),
+            "queries": self.query_metrics.snapshot(sort_by=sort_by, limit=limit),
+            "slow_queries": self.query_metrics.slow_queries(),
+            "transaction_retries": self._tx_manager.retry_summary()
+        }
+
     async def check_connection_pool(self) -> Dict:
         """Check connection pool status."""
         if not self._driver:
@@ -1,5 +1,18 @@
+import functools
+import hashlib
+import logging
+import re
 import time
-from core.utils.logger import get_logger
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from core.utils.logger import LogSampler, get_logger
+
+logger = get_logger(__name__)
+# One slow-query line per fingerprint per interval, after a short burst
+_slow_log = LogSampler(logger, interval=60.0, burst=3)
 
 
 class DatabaseMetrics:
@@ -42,4 +55,266 @@ class DatabaseMetrics:
                 "duration": duration,
                 "error": error
             }
-        )
\ No newline at end of file
+        )
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_COMMENT = re.compile(r"//[^\n]*|/\*.*?\*/", re.S)
+_NUMBER_LITERAL = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_LITERAL_LIST = re.compile(r"\[\s*\?(?:\s*,\s*\?)*\s*\]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=2048)
+def fingerprint_query(query: str) -> str:
+    """Normalise a Cypher query so variants of the same statement group together.
+
+    String and number literals become ``?``, literal lists collapse to
+    ``[?]``, comments are dropped and whitespace is collapsed. Parameters
+    (``$name``), labels and property names are kept.
+
+    Args:
+        query: Cypher text as sent to the database
+
+    Returns:
+        The normalised query text
+    """
+    text = _STRING_LITERAL.sub("?", query)
+    text = _COMMENT.sub(" ", text)
+    text = _NUMBER_LITERAL.sub("?", text)
+    text = _LITERAL_LIST.sub("[?]", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+@dataclass
+class QueryMetricsConfig:
+    """Configuration for per-query instrumentation.
+
+    Attributes:
+        sample_size: Most recent latencies kept per fingerprint for percentiles
+        max_fingerprints: Fingerprints tracked before the least recently used are dropped
+        slow_query_threshold: Seconds above which a query goes to the slow-query log
+        slow_query_log_size: Slow queries kept
+        profile_slow_queries: Re-run slow read queries with PROFILE and keep the plan
+        profile_interval: Minimum seconds between profiles of the same fingerprint
+    """
+    sample_size: int = 512
+    max_fingerprints: int = 1000
+    slow_query_threshold: float = 1.0
+    slow_query_log_size: int = 100
+    profile_slow_queries: bool = False
+    profile_interval: float = 300.0
+
+
+class QueryStats:
+    """Counters and recent latencies for one query fingerprint."""
+
+    __slots__ = (
+        "fingerprint", "count", "errors", "timeouts", "retries",
+        "rows", "total_time", "max_time", "samples", "last_seen"
+    )
+
+    def __init__(self, fingerprint: str, sample_size: int):
+        self.fingerprint = fingerprint
+        self.count = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.retries = 0
+        self.rows = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.samples: Deque[float] = deque(maxlen=sample_size)
+        self.last_seen = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            "id": hashlib.sha1(self.fingerprint.encode("utf-8")).hexdigest()[:12],
+            "query": self.fingerprint,
+            "count": self.count,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+            "rows": self.rows,
+            "rows_per_call": self.rows / self.count if self.count else 0.0,
+            "total_ms": self.total_time * 1000,
+            "mean_ms": self.total_time / self.count * 1000 if self.count else 0.0,
+            "p50_ms": _percentile(ordered, 0.50) * 1000,
+            "p95_ms": _percentile(ordered, 0.95) * 1000,
+            "p99_ms": _percentile(ordered, 0.99) * 1000,
+            "max_ms": self.max_time * 1000
+        }
+
+
+class QueryMetrics:
+    """Aggregated query metrics keyed by Cypher fingerprint.
+
+    Recording is a dict lookup and a few counter updates; percentiles are
+    only computed when a snapshot is taken. Queries slower than
+    ``slow_query_threshold`` are also kept in a bounded slow-query log,
+    to which a PROFILE plan can be attached afterwards.
+    """
+
+    SORT_KEYS = ("total_ms", "count", "p95_ms", "p99_ms", "rows", "errors", "retries")
+
+    def __init__(self, config: Optional[QueryMetricsConfig] = None, clock: Callable[[], float] = time.time):
+        self.config = config or QueryMetricsConfig()
+        self._clock = clock
+        self._stats: "OrderedDict[str, QueryStats]" = OrderedDict()
+        self._slow: Deque[Dict[str, Any]] = deque(maxlen=self.config.slow_query_log_size)
+        self._profiled: Dict[str, float] = {}
+        self.started_at = clock()
+
+    def _stats_for(self, query: str) -> QueryStats:
+        fingerprint = fingerprint_query(query)
+        stats = self._stats.get(fingerprint)
+        if stats is None:
+            stats = self._stats[fingerprint] = QueryStats(fingerprint, self.config.sample_size)
+            if len(self._stats) > self.config.max_fingerprints:
+                self._stats.popitem(last=False)
+        else:
+            self._stats.move_to_end(fingerprint)
+        stats.last_seen = self._clock()
+        return stats
+
+    def record(
+        self,
+        query: str,
+        duration: float,
+        rows: int = 0,
+        failed: bool = False,
+        timed_out: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Record one execution of a query.
+
+        Args:
+            query: Cypher text
+            duration: Seconds the query took
+            rows: Records returned
+            failed: Whether the query raised
+            timed_out: Whether the query hit its timeout
+
+        Returns:
+            The slow-query log entry if the query was slow, else None
+        """
+        stats = self._stats_for(query)
+        stats.count += 1
+        stats.rows += rows
+        stats.total_time += duration
+        if duration > stats.max_time:
+            stats.max_time = duration
+        stats.samples.append(duration)
+        if timed_out:
+            stats.timeouts += 1
+        elif failed:
+            stats.errors += 1
+
+        if duration < self.config.slow_query_threshold:
+            return None
+        entry = {
+            "query": stats.fingerprint,
+            "duration_ms": duration * 1000,
+            "rows": rows,
+            "failed": failed or timed_out,
+            "timestamp": datetime.fromtimestamp(self._clock()).isoformat(),
+            "profile": None
+        }
+        self._slow.append(entry)
+        _slow_log.log(
+            logging.WARNING,
+            stats.fingerprint,
+            "Slow query (%.0f ms, %d rows): %s",
+            duration * 1000,
+            rows,
+            stats.fingerprint[:200]
+        )
+        return entry
+
+    def record_retry(self, query: str) -> None:
+        """Count a retried attempt of a query's transaction."""
+        self._stats_for(query).retries += 1
+
+    def should_profile(self, query: str) -> bool:
+        """Whether a slow query is due for a PROFILE capture; marks it as profiled."""
+        if not self.config.profile_slow_queries:
+            return False
+        fingerprint = fingerprint_query(query)
+        now = self._clock()
+        if now - self._profiled.get(fingerprint, float("-inf")) < self.config.profile_interval:
+            return False
+        self._profiled[fingerprint] = now
+        return True
+
+    def snapshot(self, sort_by: str = "total_ms", limit: int = 50) -> List[Dict[str, Any]]:
+        """Per-fingerprint metrics, heaviest first.
+
+        Args:
+            sort_by: One of ``SORT_KEYS``
+            limit: Maximum entries returned
+
+        Returns:
+            Metrics dicts sorted descending by ``sort_by``
+        """
+        if sort_by not in self.SORT_KEYS:
+            raise ValueError(f"sort_by must be one of {', '.join(self.SORT_KEYS)}")
+        entries = [stats.to_dict() for stats in list(self._stats.values())]
+        entries.sort(key=lambda entry: entry[sort_by], reverse=True)
+        return entries[:limit]
+
+    def slow_queries(self) -> List[Dict[str, Any]]:
+        """Slow-query log, most recent first."""
+        return list(reversed(self._slow))
+
+    def summary(self) -> Dict[str, Any]:
+        stats = list(self._stats.values())
+        return {
+            "since": datetime.fromtimestamp(self.started_at).isoformat(),
+            "fingerprints": len(stats),
+            "queries": sum(s.count for s in stats),
+            "errors": sum(s.errors for s in stats),
+            "timeouts": sum(s.timeouts for s in stats),
+            "retries": sum(s.retries for s in stats),
+            "total_ms": sum(s.total_time for s in stats) * 1000,
+            "slow_queries": len(self._slow)
+        }
+
+    def reset(self) -> None:
+        self._stats.clear()
+        self._slow.clear()
+        self._profiled.clear()
+        self.started_at = self._clock()
+
+
+_WRITE_CLAUSE = re.compile(r"\b(CREATE|MERGE|SET|DELETE|REMOVE|DROP|FOREACH|LOAD\s+CSV|CALL)\b", re.I)
+
+
+def is_read_query(query: str) -> bool:
+    """Whether a query has no clause that could write (procedure calls count as writes)."""
+    return not _WRITE_CLAUSE.search(fingerprint_query(query))
+
+
+def compact_plan(plan: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Reduce a PROFILE plan to operator, rows and db hits per step.
+
+    Args:
+        plan: ``ResultSummary.profile`` from the driver
+
+    Returns:
+        Nested dict of operators with their children, or None without a plan
+    """
+    if not plan:
+        return None
+    args = plan.get("args") or {}
+    children = [compact_plan(child) for child in plan.get("children") or []]
+    return {
+        "operator": plan.get("operatorType"),
+        "rows": plan.get("rows", args.get("Rows")),
+        "db_hits": plan.get("dbHits", args.get("DbHits")),
+        "details": args.get("Details"),
+        "children": [child for child in children if child]
+    }
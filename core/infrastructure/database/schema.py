@@ -71,10 +71,21 @@ class SchemaManager:
             # Performance indexes
             """CREATE INDEX page_metadata IF NOT EXISTS 
                FOR (p:Page) ON (p.metadata_quality_score)""",
+            # Latest-change lookups for the graph overview version key
+            """CREATE INDEX page_last_accessed IF NOT EXISTS
+               FOR (p:Page) ON (p.last_accessed)""",
+            """CREATE INDEX page_updated_at IF NOT EXISTS
+               FOR (p:Page) ON (p.updated_at)""",
             """CREATE INDEX keyword_normalized_text IF NOT EXISTS
                FOR (k:Keyword) ON (k.normalized_text)""",
             """CREATE INDEX keyword_type IF NOT EXISTS
-               FOR (k:Keyword) ON (k.keyword_type)"""
+               FOR (k:Keyword) ON (k.keyword_type)""",
+            # Task lookups when enqueuing URLs in chunks and reporting status
+            """CREATE INDEX task_id IF NOT EXISTS
+               FOR (t:Task) ON (t.id)""",
+            # BM25 full-text index used by hybrid retrieval
+            """CREATE FULLTEXT INDEX page_fulltext IF NOT EXISTS
+               FOR (p:Page) ON EACH [p.title, p.content]"""
         ]
 
         relationship_indexes = [
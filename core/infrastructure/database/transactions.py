@@ -220,6 +220,18 @@ class TransactionManager:
 
         raise last_error
 
+    def retry_summary(self) -> Dict:
+        """Transactions currently being retried and the error codes they hit."""
+        error_codes: Dict[str, int] = {}
+        for stats in self._retry_stats.values():
+            for code in stats["error_codes"]:
+                error_codes[code] = error_codes.get(code, 0) + 1
+        return {
+            "retrying_transactions": len(self._retry_stats),
+            "attempts": sum(stats["attempts"] for stats in self._retry_stats.values()),
+            "error_codes": error_codes
+        }
+
     def _log_retry_exhaustion(
         self,
         tx_id: str,
@@ -1,14 +1,33 @@
+import asyncio
+from typing import Callable, List, Optional, Sequence
+
+from core.domain.content.document_frequency import DOCUMENT_TERMS_KEY, DocumentFrequencyStore
 from core.domain.content.pipeline import PipelineComponent, ComponentType
 from core.infrastructure.database.db_connection import DatabaseConnection
 from core.utils.logger import get_logger
 from core.domain.content.models.page import Page
 
 
+# Called with a newly created page and the number of its keywords stored
+PageStoredHook = Callable[[Page, int], None]
+
+
 class Neo4jStorageComponent(PipelineComponent):
-    """Component for storing page information in Neo4j."""
+    """Component for storing page information in Neo4j.
+
+    Services that track stored pages (statistics, keyword co-occurrence) register
+    ``on_page_stored`` hooks, so storage does not depend on them.
+    """
     
-    def __init__(self, db_connection: DatabaseConnection):
+    def __init__(
+        self,
+        db_connection: DatabaseConnection,
+        df_store: Optional[DocumentFrequencyStore] = None,
+        on_page_stored: Sequence[PageStoredHook] = ()
+    ):
         self.db_connection = db_connection
+        self.on_page_stored = list(on_page_stored)
+        self.df_store = df_store
         self.logger = get_logger(__name__)
         
     async def process(self, page: Page) -> None:
@@ -23,7 +42,8 @@ class Neo4jStorageComponent(PipelineComponent):
             check_query = "MATCH (p:Page {url: $url}) RETURN p.id as id"
             check_result = await self.db_connection.execute_query(check_query, {"url": page.url})
             
-            if check_result and check_result[0]["id"]:
+            is_existing = bool(check_result and check_result[0]["id"])
+            if is_existing:
                 # Page exists - update it with the new ID and other properties
                 existing_id = check_result[0]["id"]
                 self.logger.info(f"Page with URL {page.url} already exists with ID {existing_id}, updating")
@@ -72,19 +92,55 @@ class Neo4jStorageComponent(PipelineComponent):
                 self.logger.info(f"Created new page for URL {page.url}")
             
             # If keywords were extracted, store them too
+            stored = 0
             if hasattr(page, 'keywords') and page.keywords:
-                await self._store_keywords(page, page_id)
+                stored = await self._store_keywords(page, page_id)
+
+            # Count each page once in the corpus document frequencies
+            terms = page.metadata.custom_metadata.pop(DOCUMENT_TERMS_KEY, None)
+            if self.df_store and terms and not is_existing:
+                await self._update_document_frequencies(page, terms)
+
+            # Keywords of an existing page may already be linked (MERGE), so
+            # hooks only see new pages; drift is left to reconciliation
+            if not is_existing:
+                self._notify_page_stored(page, stored)
             
         except Exception as e:
             self.logger.error(f"Error storing page in Neo4j: {str(e)}", exc_info=True)
             raise
     
-    async def _store_keywords(self, page: Page, page_id: str) -> None:
+    def _notify_page_stored(self, page: Page, keywords_stored: int) -> None:
+        """Run the page-stored hooks; a failing hook never fails storage."""
+        for hook in self.on_page_stored:
+            try:
+                hook(page, keywords_stored)
+            except Exception as e:
+                self.logger.warning(f"Page stored hook failed for {page.url}: {str(e)}")
+
+    async def _update_document_frequencies(self, page: Page, terms: List[str]) -> None:
+        """Add a newly stored page's terms to the document-frequency store.
+
+        Args:
+            page: The stored page
+            terms: Terms of the cleaned text the analysis stage scored
+        """
+        try:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self.df_store.add_document, terms)
+        except Exception as e:
+            # Frequencies only tune scoring; never fail storage over them
+            self.logger.warning(f"Failed to update document frequencies for {page.url}: {str(e)}")
+
+    async def _store_keywords(self, page: Page, page_id: str) -> int:
         """Store page keywords in Neo4j.
         
         Args:
             page: The page containing keywords
             page_id: String ID of the page for Neo4j
+            
+        Returns:
+            Number of keywords stored successfully
         """
         self.logger.info(f"Storing keywords for page: {page.url}")
         
@@ -93,6 +149,7 @@ class Neo4jStorageComponent(PipelineComponent):
         if hasattr(page.metadata, 'language') and page.metadata.language:
             default_language = page.metadata.language
         
+        stored = 0
         for keyword, score in page.keywords.items():
             query = """
             MATCH (p:Page {id: $page_id})
@@ -110,12 +167,14 @@ class Neo4jStorageComponent(PipelineComponent):
             
             try:
                 await self.db_connection.execute_query(query, params)
+                stored += 1
                 self.logger.debug(f"Stored keyword '{keyword}' with score {score}")
             except Exception as e:
                 self.logger.error(f"Error storing keyword '{keyword}': {str(e)}")
                 # Continue with other keywords even if one fails
         
         self.logger.info(f"Finished storing {len(page.keywords)} keywords for page: {page.url}")
+        return stored
     
     async def validate(self, page: Page) -> bool:
         """Validate that this component can process the page."""
@@ -0,0 +1,250 @@
+import hashlib
+import json
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from core.utils.logger import get_logger
+
+
+@dataclass
+class ResponseCacheConfig:
+    """Configuration for the LLM response cache.
+
+    Attributes:
+        max_entries: Maximum cached responses before LRU eviction
+        ttl_seconds: Lifetime of a cached response
+        similarity_threshold: Minimum cosine similarity for a semantic hit
+        enable_semantic: Whether embedding-similarity lookups are allowed
+    """
+    max_entries: int = 512
+    ttl_seconds: float = 3600.0
+    similarity_threshold: float = 0.95
+    enable_semantic: bool = False
+
+
+@dataclass
+class CacheEntry:
+    """A cached response with the context it was generated for."""
+    key: str
+    value: Any
+    scope: str
+    created_at: float
+    sources: Set[str] = field(default_factory=set)
+    embedding: Optional[List[float]] = None
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalise a question so trivially different phrasings share a key.
+
+    Case and trailing punctuation are dropped, so this is only meant for
+    natural-language questions, not raw completion prompts.
+    """
+    return _WHITESPACE_RE.sub(" ", prompt.strip().lower()).rstrip(" ?.!")
+
+
+def source_fingerprint(source_id: str, content: Optional[str]) -> str:
+    """Fingerprint a retrieved source by id and content hash."""
+    digest = hashlib.sha1((content or "").encode("utf-8")).hexdigest()[:12]
+    return f"{source_id}:{digest}"
+
+
+class ResponseCache:
+    """In-memory LRU/TTL cache for LLM completions and agent answers.
+
+    Entries are keyed on (provider, model, prompt, parameters, retrieved-source
+    fingerprints); agent questions are normalised, raw prompts only trimmed.
+    The provider/model/source part forms a *scope*: semantic lookups only
+    compare query embeddings within the same scope, so a near-identical
+    question is never answered from different sources. Entries are indexed
+    by source id so they can be invalidated when a page is re-captured.
+    """
+
+    def __init__(self, config: Optional[ResponseCacheConfig] = None):
+        self.config = config or ResponseCacheConfig()
+        self.logger = get_logger(__name__)
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._by_source: Dict[str, Set[str]] = {}
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_scope(provider: str, model: str, sources: Iterable[str] = ()) -> str:
+        """Build the scope string shared by exact and semantic lookups."""
+        return json.dumps([provider, model, sorted(sources)])
+
+    @staticmethod
+    def make_key(
+        scope: str,
+        prompt: str,
+        params: Optional[Dict[str, Any]] = None,
+        normalize: bool = False
+    ) -> str:
+        """Build an exact-match cache key.
+
+        Args:
+            scope: Scope from make_scope
+            prompt: Prompt text; surrounding whitespace is always trimmed
+            params: Generation parameters that affect the output
+            normalize: Apply normalize_prompt, for natural-language questions
+                where case and trailing punctuation do not change the answer
+
+        Returns:
+            Hex digest cache key
+        """
+        prompt = normalize_prompt(prompt) if normalize else prompt.strip()
+        payload = json.dumps(
+            [scope, prompt, params or {}],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a response by exact key."""
+        entry = self._entries.get(key)
+        if entry is None or self._expired(entry):
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def get_similar(self, scope: str, embedding: List[float]) -> Optional[Any]:
+        """Look up a response whose query embedding is close enough.
+
+        Args:
+            scope: Scope from make_scope; only entries in this scope match
+            embedding: Embedding of the current query
+
+        Returns:
+            Cached value or None
+        """
+        if not self.config.enable_semantic or not embedding:
+            return None
+
+        best_key, best_score = None, self.config.similarity_threshold
+        for key, entry in list(self._entries.items()):
+            if entry.scope != scope or entry.embedding is None:
+                continue
+            if self._expired(entry):
+                self._remove(key)
+                continue
+            score = self._cosine(embedding, entry.embedding)
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        self.semantic_hits += 1
+        return self._entries[best_key].value
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        scope: str = "",
+        sources: Iterable[str] = (),
+        embedding: Optional[List[float]] = None
+    ) -> None:
+        """Store a response.
+
+        Args:
+            key: Exact-match key from make_key
+            value: Response to cache
+            scope: Scope from make_scope
+            sources: Source ids (page ids or URLs) the response depends on
+            embedding: Optional query embedding for semantic lookups
+        """
+        if key in self._entries:
+            self._remove(key)
+
+        entry = CacheEntry(
+            key=key,
+            value=value,
+            scope=scope,
+            created_at=time.monotonic(),
+            sources=set(sources),
+            embedding=embedding if self.config.enable_semantic else None
+        )
+        self._entries[key] = entry
+        for source in entry.sources:
+            self._by_source.setdefault(source, set()).add(key)
+
+        while len(self._entries) > self.config.max_entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def invalidate_source(self, source: str) -> int:
+        """Drop every cached response that used the given source.
+
+        Args:
+            source: Page id or URL
+
+        Returns:
+            Number of entries removed
+        """
+        keys = self._by_source.pop(source, set())
+        for key in keys:
+            self._remove(key)
+        if keys:
+            self.invalidations += len(keys)
+            self.logger.debug(f"Invalidated {len(keys)} cached responses for {source}")
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_source.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit-rate and size metrics.
+
+        Semantic lookups only follow an exact miss, so every request is
+        counted once in hits + misses and semantic hits are a subset of misses.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "exact_hit_rate": self.hits / lookups if lookups else 0.0,
+            "hit_rate": (self.hits + self.semantic_hits) / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
+
+    def _expired(self, entry: CacheEntry) -> bool:
+        return time.monotonic() - entry.created_at > self.config.ttl_seconds
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for source in entry.sources:
+            keys = self._by_source.get(source)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_source[source]
+
+    @staticmethod
+    def _cosine(a: List[float], b: List[float]) -> float:
+        if len(a) != len(b):
+            return 0.0
+        dot = sum(x * y for x, y in zip(a, b))
+        norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        return dot / norm if norm else 0.0
@@ -0,0 +1,106 @@
+import asyncio
+import json
+from typing import AsyncIterator, List, Optional
+
+DEFAULT_COALESCE_INTERVAL = 0.03
+DEFAULT_MAX_FRAME_BYTES = 4096
+
+
+def escape_text(text: str) -> bytes:
+    """Encode text as the inside of a JSON string literal (no quotes)."""
+    return json.dumps(text, ensure_ascii=False)[1:-1].encode("utf-8")
+
+
+def decode_text(escaped: bytes) -> str:
+    """Decode the inside of a JSON string literal back to text."""
+    return json.loads(b'"' + escaped + b'"')
+
+
+def sse_text_frame(escaped: bytes, done: bool = False, event: Optional[str] = None) -> bytes:
+    """Build an SSE frame ``{"text": ..., "done": ...}`` from escaped text.
+
+    The text is already JSON-escaped, so the frame is assembled by byte
+    concatenation instead of building and serialising a dict.
+
+    Args:
+        escaped: Text as returned by escape_text or a provider's raw deltas
+        done: Whether this is the final frame
+        event: Optional SSE event name
+    """
+    prefix = b"event: " + event.encode("ascii") + b"\n" if event else b""
+    return (
+        prefix + b'data: {"text":"' + escaped
+        + (b'","done":true}\n\n' if done else b'","done":false}\n\n')
+    )
+
+
+async def coalesce_deltas(
+    deltas: AsyncIterator[bytes],
+    interval: float = DEFAULT_COALESCE_INTERVAL,
+    max_bytes: int = DEFAULT_MAX_FRAME_BYTES
+) -> AsyncIterator[bytes]:
+    """Merge escaped text deltas into time-based frames.
+
+    The first delta is emitted immediately to keep time-to-first-token low.
+    Later deltas are buffered until ``interval`` seconds have passed since
+    the first buffered delta, or ``max_bytes`` have accumulated, so a fast
+    model produces a handful of frames per second instead of one per token.
+    A buffered delta is never held back waiting for the next one.
+
+    Args:
+        deltas: Escaped text fragments (JSON string contents)
+        interval: Maximum seconds a delta is buffered
+        max_bytes: Frame size that forces a flush
+
+    Yields:
+        Concatenated escaped text, still valid JSON string contents
+    """
+    loop = asyncio.get_running_loop()
+    iterator = deltas.__aiter__()
+    buffer: List[bytes] = []
+    size = 0
+    deadline = 0.0
+    first = True
+    pending: Optional[asyncio.Future] = None
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            timeout = max(0.0, deadline - loop.time()) if buffer else None
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+
+            if not done:
+                # Interval elapsed while waiting for the next delta
+                yield b"".join(buffer)
+                buffer.clear()
+                size = 0
+                continue
+
+            future, pending = pending, None
+            try:
+                delta = future.result()
+            except StopAsyncIteration:
+                break
+            if not delta:
+                continue
+
+            if first:
+                first = False
+                yield delta
+                continue
+
+            if not buffer:
+                deadline = loop.time() + interval
+            buffer.append(delta)
+            size += len(delta)
+            if size >= max_bytes or loop.time() >= deadline:
+                yield b"".join(buffer)
+                buffer.clear()
+                size = 0
+
+        if buffer:
+            yield b"".join(buffer)
+    finally:
+        if pending is not None:
+            pending.cancel()
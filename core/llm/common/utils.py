@@ -0,0 +1,39 @@
+from typing import Optional
+
+from core.llm.providers.anthropic.models.metadata import (
+    DEFAULT_ANTHROPIC_CONTEXT_LENGTH,
+    get_model_info as get_anthropic_model_info
+)
+from core.llm.providers.ollama.models.metadata import get_context_length as get_ollama_context_length
+
+# Rough average for English text with BPE tokenizers
+CHARS_PER_TOKEN = 4
+
+DEFAULT_CONTEXT_LENGTH = 4096
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text without a provider tokenizer."""
+    if not text:
+        return 0
+    return max(1, (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN)
+
+
+def get_model_context_length(provider_type: str, model_id: Optional[str]) -> int:
+    """Look up the context window for a provider model from provider metadata.
+    
+    Args:
+        provider_type: Provider type value (e.g. "anthropic", "ollama")
+        model_id: Model identifier
+        
+    Returns:
+        Context window size in tokens
+    """
+    if provider_type == "anthropic":
+        info = get_anthropic_model_info(model_id) if model_id else None
+        if info and info.context_length:
+            return info.context_length
+        return DEFAULT_ANTHROPIC_CONTEXT_LENGTH
+    if provider_type == "ollama" and model_id:
+        return get_ollama_context_length(model_id)
+    return DEFAULT_CONTEXT_LENGTH
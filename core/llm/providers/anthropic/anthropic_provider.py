@@ -1,8 +1,8 @@
 import aiohttp
 import time
 import asyncio
-import json
 import os
+from contextlib import asynccontextmanager
 from typing import Dict, Any, List, AsyncIterator
 from datetime import datetime
 
@@ -11,6 +11,8 @@ from core.llm.providers.base.provider import (QueryRequest, QueryResponse,
 )
 from core.llm.providers.anthropic.models.response import GenerateResponse, ListModelsResponse, ModelInfo
 from core.llm.providers.anthropic.models.request import GenerateRequest
+from core.llm.providers.anthropic.streaming import AnthropicStreamParser
+from core.llm.common.streaming import decode_text
 from core.llm.providers.base.provider_base import BaseLLMProvider
 from core.infrastructure.auth.providers.dev_auth_provider import DevAuthProvider
 from core.llm.providers.base.config import ProviderConfig, ProviderType
@@ -91,79 +93,48 @@ class AnthropicProvider(BaseLLMProvider):
             
     async def generate(self, request: GenerateRequest) -> AsyncIterator[GenerateResponse]:
         """Generate text using Claude API with streaming"""
-        if self._status != ProviderStatus.READY or not self.session:
-            raise ProviderNotInitializedError("Provider not initialized")
-            
-        # Use provided model or default to the one in config
-        if not request.model:
-            request.model = self.config.model_name
-            
-        # Prepare the payload
-        payload = request.to_json()
-        
         start_time = time.time()
         
         try:
-            url = f"{self.api_base}/messages"
-            
-            async with self.session.post(
-                url=url,
-                json=payload,
-                timeout=self.config.timeout_seconds
-            ) as response:
-                if response.status != 200:
-                    error_data = await response.text()
-                    raise ProviderAPIError(
-                        f"Anthropic API error: {response.status}",
-                        status_code=response.status,
-                        response=error_data
-                    )
-                
+            async with self._post_messages(request) as response:
                 # Process streaming response if requested
                 if request.stream:
-                    # Parse SSE format from Anthropic
+                    parser = AnthropicStreamParser()
+                    created_at = datetime.now()
+                    completion_chars = 0
+                    
                     async for line in response.content:
-                        line = line.strip()
-                        if not line or line == b'[DONE]':
-                            continue
-                            
-                        try:
-                            # Handle SSE format (data: {json})
-                            if line.startswith(b'data: '):
-                                line = line[6:]  # Remove the 'data: ' prefix
-                            
-                            chunk = json.loads(line)
-                            
-                            # Add model information which may not be in the chunk
-                            if "model" not in chunk:
-                                chunk["model"] = request.model
-                                
-                            # Add created_at if not in the chunk
-                            if "created_at" not in chunk:
-                                chunk["created_at"] = datetime.now().isoformat()
-                                
-                            # Determine if this is the final chunk
-                            is_done = chunk.get("type") == "message_stop"
-                            chunk["done"] = is_done
-                            
-                            # Parse the chunk into a response
-                            response_obj = GenerateResponse.from_json(chunk)
-                            
-                            # Update metrics on final chunk
-                            if is_done:
-                                # Estimate token count as a rough approximation
-                                tokens = len(request.prompt) // 4 + len(response_obj.response) // 4
-                                
-                                self._update_metrics(
-                                    success=True,
-                                    latency_ms=(time.time() - start_time) * 1000,
-                                    tokens=tokens
-                                )
-                            
-                            yield response_obj
-                            
-                        except json.JSONDecodeError:
-                            continue
+                        delta = parser.feed(line)
+                        if delta is not None:
+                            text = decode_text(delta)
+                            completion_chars += len(text)
+                            yield GenerateResponse(
+                                model=request.model,
+                                created_at=created_at,
+                                done=False,
+                                response=text,
+                                delta={"type": "text_delta", "text": text},
+                                delta_type="content_block_delta"
+                            )
+                        elif parser.done:
+                            self._update_metrics(
+                                success=True,
+                                latency_ms=(time.time() - start_time) * 1000,
+                                tokens=parser.total_tokens or (len(request.prompt) + completion_chars) // 4
+                            )
+                            yield GenerateResponse(
+                                model=request.model,
+                                created_at=created_at,
+                                done=True,
+                                stop_reason=parser.stop_reason,
+                                prompt_tokens=parser.input_tokens,
+                                completion_tokens=parser.output_tokens,
+                                total_tokens=parser.total_tokens
+                            )
+                            break
+                    
+                    if not parser.done:
+                        raise ProviderAPIError("Anthropic stream ended before message_stop")
                 else:
                     # Non-streaming response
                     data = await response.json()
@@ -186,23 +157,96 @@ class AnthropicProvider(BaseLLMProvider):
                     yield response_obj
         
         except Exception as e:
-            # Update metrics for failure
-            self._update_metrics(
-                success=False, 
-                latency_ms=(time.time() - start_time) * 1000, 
-                tokens=0
-            )
+            self._handle_generate_error(e, start_time)
             
-            # Record error
-            self._last_error = str(e)
+    async def stream_text_deltas(self, request: GenerateRequest) -> AsyncIterator[bytes]:
+        """Stream generated text as raw JSON-escaped deltas.
+        
+        Fast path for SSE passthrough: deltas are sliced out of the upstream
+        event lines without building per-token dicts or response objects,
+        and can be written into a JSON string as-is (see
+        core.llm.common.streaming).
+        
+        Args:
+            request: Generation request; it is always sent with streaming on
             
-            # Re-raise appropriate exception
-            if isinstance(e, asyncio.TimeoutError):
-                raise ProviderTimeoutError(f"Anthropic request timed out: {str(e)}")
-            elif isinstance(e, aiohttp.ClientError):
-                raise ProviderConnectionError(f"Anthropic connection error: {str(e)}")
-            else:
-                raise
+        Yields:
+            Escaped text fragments, in generation order
+            
+        Raises:
+            ProviderAPIError: If the stream reports an error or ends before
+                ``message_stop``
+        """
+        request.stream = True
+        start_time = time.time()
+        
+        try:
+            async with self._post_messages(request) as response:
+                parser = AnthropicStreamParser()
+                completion_bytes = 0
+                async for line in response.content:
+                    delta = parser.feed(line)
+                    if delta is not None:
+                        completion_bytes += len(delta)
+                        yield delta
+                    elif parser.done:
+                        break
+                
+                if not parser.done:
+                    raise ProviderAPIError("Anthropic stream ended before message_stop")
+                
+                self._update_metrics(
+                    success=True,
+                    latency_ms=(time.time() - start_time) * 1000,
+                    tokens=parser.total_tokens or (len(request.prompt) + completion_bytes) // 4
+                )
+        
+        except Exception as e:
+            self._handle_generate_error(e, start_time)
+    
+    @asynccontextmanager
+    async def _post_messages(self, request: GenerateRequest) -> AsyncIterator[aiohttp.ClientResponse]:
+        """POST a generation request to the Messages API and check the status."""
+        if self._status != ProviderStatus.READY or not self.session:
+            raise ProviderNotInitializedError("Provider not initialized")
+            
+        # Use provided model or default to the one in config
+        if not request.model:
+            request.model = self.config.model_name
+        
+        async with self.session.post(
+            url=f"{self.api_base}/messages",
+            json=request.to_json(),
+            timeout=self.config.timeout_seconds
+        ) as response:
+            if response.status != 200:
+                error_data = await response.text()
+                raise ProviderAPIError(
+                    f"Anthropic API error: {response.status}",
+                    status_code=response.status,
+                    response=error_data
+                )
+            yield response
+    
+    def _handle_generate_error(self, e: Exception, start_time: float) -> None:
+        """Record a failed generation and re-raise it as a provider error."""
+        # Update metrics for failure
+        self._update_metrics(
+            success=False, 
+            latency_ms=(time.time() - start_time) * 1000, 
+            tokens=0
+        )
+        
+        # Record error
+        self._last_error = str(e)
+        
+        # Re-raise appropriate exception
+        if isinstance(e, asyncio.TimeoutError):
+            raise ProviderTimeoutError(f"Anthropic request timed out: {str(e)}")
+        elif isinstance(e, aiohttp.ClientError):
+            raise ProviderConnectionError(f"Anthropic connection error: {str(e)}")
+        else:
+            raise e
             
     async def query(self, request: QueryRequest) -> QueryResponse:
         """Execute a query against Claude."""
@@ -0,0 +1,32 @@
+from typing import Dict, Optional
+
+from core.llm.common.types import BaseModelInfo
+
+
+# Known Anthropic models and their context windows (tokens)
+ANTHROPIC_MODELS: Dict[str, BaseModelInfo] = {
+    "claude-3-haiku-20240307": BaseModelInfo(
+        model_type="chat", model_family="claude-3", context_length=200000
+    ),
+    "claude-3-sonnet-20240229": BaseModelInfo(
+        model_type="chat", model_family="claude-3", context_length=200000
+    ),
+    "claude-3-opus-20240229": BaseModelInfo(
+        model_type="chat", model_family="claude-3", context_length=200000
+    ),
+    "claude-3-5-sonnet-20240620": BaseModelInfo(
+        model_type="chat", model_family="claude-3.5", context_length=200000
+    ),
+}
+
+DEFAULT_ANTHROPIC_CONTEXT_LENGTH = 200000
+
+
+def get_model_info(model_id: str) -> Optional[BaseModelInfo]:
+    """Get static metadata for an Anthropic model, matching by prefix for dated ids."""
+    if model_id in ANTHROPIC_MODELS:
+        return ANTHROPIC_MODELS[model_id]
+    for known_id, info in ANTHROPIC_MODELS.items():
+        if model_id.startswith(known_id.rsplit("-", 1)[0]):
+            return info
+    return None
@@ -0,0 +1,98 @@
+import json
+from typing import Optional
+
+from core.llm.common.streaming import escape_text
+from core.llm.providers.base.exceptions import ProviderAPIError
+
+# Anthropic sends compact JSON, so a text delta always contains this run
+_TEXT_DELTA_MARKER = b'"type":"text_delta","text":"'
+
+
+def _string_end(data: bytes, start: int) -> int:
+    """Offset of the closing quote of a JSON string whose content starts at ``start``."""
+    position = data.find(b'"', start)
+    while position != -1:
+        backslashes = 0
+        check = position - 1
+        while check >= start and data[check] == 0x5C:  # backslash
+            backslashes += 1
+            check -= 1
+        if backslashes % 2 == 0:
+            return position
+        position = data.find(b'"', position + 1)
+    return -1
+
+
+class AnthropicStreamParser:
+    """Incremental parser for the Messages API SSE stream.
+
+    Only the fields the streaming path needs are read. Text deltas are
+    located by byte search and sliced out still JSON-escaped, so they can be
+    forwarded to clients without decoding and re-encoding. The few
+    non-delta events per message (start, usage, stop, error) are parsed
+    with ``json.loads``. A stream is only complete once ``done`` is set by
+    ``message_stop``; callers must treat a stream that ends earlier as failed.
+    """
+
+    def __init__(self):
+        self.input_tokens: Optional[int] = None
+        self.output_tokens: Optional[int] = None
+        self.stop_reason: Optional[str] = None
+        self.done = False
+
+    def feed(self, line: bytes) -> Optional[bytes]:
+        """Consume one line of the stream.
+
+        Args:
+            line: Raw line, with or without trailing newline
+
+        Returns:
+            JSON-escaped delta text, or None for lines without text
+
+        Raises:
+            ProviderAPIError: If the stream reports an error event
+        """
+        if not line.startswith(b"data:"):
+            # "event:" lines, keep-alive comments and blank separators
+            return None
+
+        start = line.find(_TEXT_DELTA_MARKER)
+        if start != -1:
+            start += len(_TEXT_DELTA_MARKER)
+            end = _string_end(line, start)
+            if end != -1:
+                return line[start:end]
+
+        try:
+            event = json.loads(line[5:])
+        except ValueError:
+            return None
+        if not isinstance(event, dict):
+            return None
+
+        event_type = event.get("type")
+        if event_type == "content_block_delta":
+            text = (event.get("delta") or {}).get("text")
+            return escape_text(text) if text else None
+        if event_type == "message_start":
+            usage = (event.get("message") or {}).get("usage") or {}
+            self.input_tokens = usage.get("input_tokens", self.input_tokens)
+        elif event_type == "message_delta":
+            usage = event.get("usage") or {}
+            self.output_tokens = usage.get("output_tokens", self.output_tokens)
+            self.stop_reason = (event.get("delta") or {}).get("stop_reason", self.stop_reason)
+        elif event_type == "message_stop":
+            self.done = True
+        elif event_type == "error":
+            error = event.get("error") or {}
+            raise ProviderAPIError(
+                f"Anthropic stream error: {error.get('type', 'unknown')}: {error.get('message', '')}",
+                response=line[5:].decode("utf-8", "replace").strip()
+            )
+        return None
+
+    @property
+    def total_tokens(self) -> Optional[int]:
+        if self.input_tokens is None and self.output_tokens is None:
+            return None
+        return (self.input_tokens or 0) + (self.output_tokens or 0)
@@ -105,4 +105,23 @@ class DurationMetrics:
     prompt_eval_duration: Optional[int] = None  # nanoseconds
     eval_count: Optional[int] = None
     sample_count: Optional[int] = None
-    sample_duration: Optional[int] = None
\ No newline at end of file
+    sample_duration: Optional[int] = None
+
+# Default context lengths for common Ollama models, used when the server's
+# model info (ModelInfo.context_length) has not been fetched
+OLLAMA_CONTEXT_LENGTHS = {
+    "llama3": 8192,
+    "llama3.1": 131072,
+    "llama2": 4096,
+    "mistral": 32768,
+    "mixtral": 32768,
+    "phi3": 4096,
+}
+
+DEFAULT_OLLAMA_CONTEXT_LENGTH = 2048
+
+
+def get_context_length(model_id: str) -> int:
+    """Get the context length for an Ollama model name (tags are ignored)."""
+    name = ModelName.parse(model_id).name
+    return OLLAMA_CONTEXT_LENGTHS.get(name, DEFAULT_OLLAMA_CONTEXT_LENGTH)
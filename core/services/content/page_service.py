@@ -2,8 +2,13 @@ import time
 from uuid import UUID
 
 from core.domain.content.types import PageRelationship
-from typing import Dict, Optional, Any, Set, List
+from typing import Dict, Optional, Any, Set, List, Sequence
 from core.domain.content.models.page import Page, BrowserContext, PageStatus
+from core.domain.content.models.page_view import (
+    LazyPage,
+    PAGE_SUMMARY_PROPERTIES,
+    page_projection
+)
 from core.utils.url import extract_domain
 from core.utils.logger import get_logger
 from core.services.graph.graph_service import GraphService
@@ -227,7 +232,7 @@ class PageService(BaseService):
         
         # Save old state for rollback
         old_contexts = page.browser_contexts.copy()
-        old_context_data = page.context_data.copy() if hasattr(page, 'context_data') else {}
+        old_context_data = dict(page.context_data or {})
         tx.add_rollback_handler(lambda: setattr(page, 'browser_contexts', old_contexts))
         tx.add_rollback_handler(lambda: setattr(page, 'context_data', old_context_data))
         
@@ -255,14 +260,19 @@ class PageService(BaseService):
         limit: int = 100,
         offset: int = 0,
         include_relationships: bool = False,
-        sort_by: Optional[str] = None
-    ) -> List[Page]:
+        sort_by: Optional[str] = None,
+        properties: Optional[Sequence[str]] = None
+    ) -> List[LazyPage]:
         """
         Query pages with flexible filtering options.
         
+        Only the properties needed for a listing are returned from Neo4j;
+        content, embeddings and JSON blobs stay in the database until
+        ``LazyPage.load`` asks for them.
+        
         Args:
             tx: Transaction for database operations
-            query: Text search across url, title, and keywords
+            query: Text search across url and title
             context: Browser context filter
             status: Page status filter
             domain: Domain filter
@@ -271,9 +281,11 @@ class PageService(BaseService):
             offset: Result offset for pagination
             include_relationships: Whether to include relationships
             sort_by: Field to sort by
+            properties: Extra page properties (e.g. ``content``) to return
+                eagerly instead of loading them on first access
             
         Returns:
-            List of Page objects matching the query
+            List of LazyPage views matching the query
         """
         start_time = time.time()
         
@@ -322,7 +334,9 @@ class PageService(BaseService):
                 cypher_query += "WHERE " + " AND ".join(where_clauses) + " "
             
             # First RETURN, then ORDER BY, then SKIP and LIMIT (correct Cypher order)
-            cypher_query += "RETURN p "
+            eager = [name for name in (properties or ()) if name not in PAGE_SUMMARY_PROPERTIES]
+            projection = page_projection("p", PAGE_SUMMARY_PROPERTIES + tuple(eager))
+            cypher_query += f"RETURN {projection} AS p "
             
             # Add sorting
             if sort_by:
@@ -349,34 +363,20 @@ class PageService(BaseService):
             result = await self.graph_service.graph_operations.connection.execute_query(
                 cypher_query,
                 parameters=params,
-                transaction=tx._neo4j_tx
+                read_only=True
             )
             
             # Convert to Page objects
             pages = []
             for record in result:
-                page_node = record["p"]
-                page = self._create_page_from_node(page_node)
-                
-                # Manual filtering for keywords if query parameter is provided
-                # This is a workaround for the complex Cypher keyword search
-                if query and page.keywords:
-                    # Only include page if no query, or if a keyword matches
-                    query_lower = query.lower()
-                    keyword_match = False
-                    
-                    # Check if any keyword contains the query string
-                    for keyword in page.keywords.keys():
-                        if query_lower in keyword.lower():
-                            keyword_match = True
-                            break
-                    
-                    # If querying by keyword and no match, skip this page
-                    if not keyword_match and not (
-                        query_lower in page.url.lower() or 
-                        (page.title and query_lower in page.title.lower())
-                    ):
-                        continue
+                # Map projections return missing properties as null; drop them so
+                # pages stored with only a few properties get the Page defaults
+                row = {name: value for name, value in record["p"].items() if value is not None}
+                page = LazyPage(
+                    self._create_page_from_node(row),
+                    self._load_page_properties,
+                    loaded={name: row.get(name) for name in eager}
+                )
                 
                 # Get relationships if requested
                 if include_relationships:
@@ -409,6 +409,24 @@ class PageService(BaseService):
             raise
     
 
+    async def _load_page_properties(self, url: str, properties: Sequence[str]) -> Dict[str, Any]:
+        """Fetch selected properties of a page for LazyPage.
+        
+        Args:
+            url: URL of the page
+            properties: Property names to return
+            
+        Returns:
+            Mapping of property name to value; empty if the page is gone
+        """
+        query = f"MATCH (p:Page {{url: $url}}) RETURN {page_projection('p', properties)} AS p"
+        result = await self.graph_service.graph_operations.connection.execute_query(
+            query,
+            parameters={"url": url},
+            read_only=True
+        )
+        return result[0]["p"] if result else {}
+
     async def _get_page_relationships(self, tx: Transaction, page_id: str) -> List[PageRelationship]:
         """
         Get all relationships for a page.
@@ -440,7 +458,7 @@ class PageService(BaseService):
             result = await self.graph_operations.connection.execute_query(
                 query,
                 parameters=params,
-                transaction=tx._neo4j_tx
+                read_only=True
             )
             
             # Convert to PageRelationship objects
@@ -2,7 +2,7 @@ import asyncio
 import time
 from uuid import uuid4
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from core.domain.content.pipeline import (
     DefaultPipelineOrchestrator,
     PipelineContext,
@@ -19,23 +19,35 @@ from core.domain.content.keyword_identifier import KeywordNormalizer
 from core.domain.content.validation import KeywordValidator, ValidationConfig
 from core.domain.content.processor import ContentProcessor, ContentProcessorConfig
 from core.domain.content.abbreviations import AbbreviationService
+from core.domain.content.document_frequency import DocumentFrequencyStore
 from core.infrastructure.database.transactions import Transaction
 from core.infrastructure.database.db_connection import DatabaseConnection
 from core.services.base import BaseService
+from core.services.content.task_status import TaskStatusStore
+from core.services.events.event_bus import TaskEventBus
 from core.infrastructure.storage.storage_components import Neo4jStorageComponent
+from core.services.stats.stats_service import StatsService
+from core.services.graph.cooccurrence_service import KeywordCooccurrenceService
 from core.utils.logger import get_logger
 from core.utils.nlp import initialize_spacy_model
 
 logger = get_logger(__name__)
 
 class PipelineService(BaseService):
+    # URL nodes created per UNWIND statement when enqueuing
+    ENQUEUE_BATCH_SIZE = 1000
+
     def __init__(
         self,
         state_manager: DefaultStateManager,
         component_coordinator: DefaultComponentCoordinator,
         event_system: DefaultEventSystem,
         config: PipelineConfig,
-        db_connection: DatabaseConnection
+        db_connection: DatabaseConnection,
+        stats_service: Optional[StatsService] = None,
+        df_store: Optional[DocumentFrequencyStore] = None,
+        cooccurrence_service: Optional[KeywordCooccurrenceService] = None,
+        event_bus: Optional[TaskEventBus] = None
     ):
         super().__init__()
         self.config = config
@@ -48,10 +60,19 @@ class PipelineService(BaseService):
         self.pipeline = DefaultPipelineOrchestrator(self.context)
         self.url_queue = asyncio.Queue()
         self.active_tasks: Dict[str, asyncio.Task] = {}
-        self.processed_urls: Dict[str, Dict[str, Any]] = {}
+        self.event_bus = event_bus
+        self.task_status = TaskStatusStore(
+            on_change=self._publish_task_status if event_bus else None
+        )
         self.worker_task: Optional[asyncio.Task] = None
         self.max_concurrent = self.config.max_concurrent_pages
         self.db_connection = db_connection
+        self.stats_service = stats_service
+        self.df_store = df_store
+        self.cooccurrence_service = cooccurrence_service
+        self.nlp = None
+        # Set once warm_up has run; the worker only dequeues after it
+        self.warmed_up = asyncio.Event()
 
     async def initialize(self) -> None:
         """Initialize pipeline service resources with robust worker management."""
@@ -59,60 +80,24 @@ class PipelineService(BaseService):
             self.logger.info("Initializing pipeline service")
             await super().initialize()
             
-            # Initialize spaCy once
-            self.nlp = initialize_spacy_model()
-            if not self.nlp:
-                self.logger.warning("Failed to initialize spaCy model, keyword extraction will be limited")
-            else:
-                self.logger.info("Successfully initialized spaCy model")
-
             # Register event handler for status updates
             self.pipeline.register_event_handler(self._handle_pipeline_event)
 
             # Create and register the storage component
-            storage_component = Neo4jStorageComponent(self.db_connection)
+            storage_component = Neo4jStorageComponent(
+                self.db_connection,
+                df_store=self.df_store,
+                on_page_stored=[
+                    service.record_page_stored
+                    for service in (self.stats_service, self.cooccurrence_service)
+                    if service
+                ]
+            )
             self.context.component_coordinator.register_component(
                 storage_component, 
                 ProcessingStage.STORAGE
             )
             
-            # Create and register content processor for ANALYSIS stage if spaCy is available
-            if self.nlp:
-                try:
-                    # Create necessary dependencies
-                    normalizer = KeywordNormalizer()
-
-                    validation_config = ValidationConfig()
-                    abbreviation_service = AbbreviationService()
-
-                    validator = KeywordValidator(
-                        nlp=self.nlp,
-                        config=validation_config,
-                        abbreviation_service=abbreviation_service
-                    )
-                    relationship_manager = RelationshipManager(nlp=self.nlp)
-                    
-                    # Create content processor
-                    content_processor = ContentProcessor(
-                        config=ContentProcessorConfig(),
-                        keyword_processor=None,  # Will be created internally
-                        relationship_manager=relationship_manager,
-                        normalizer=normalizer,
-                        validator=validator,
-                        nlp=self.nlp,
-                        debug_mode=True
-                    )
-                    
-                    # Register for ANALYSIS stage
-                    self.context.component_coordinator.register_component(
-                        content_processor,
-                        ProcessingStage.ANALYSIS
-                    )
-                    self.logger.info("ContentProcessor registered for ANALYSIS stage")
-                except Exception as e:
-                    self.logger.error(f"Error creating content processor: {str(e)}", exc_info=True)
-                    self.logger.warning("Keyword extraction will be disabled")
-            
             # Start processing worker with monitoring
             self.logger.info("Starting URL processing worker task")
             self.worker_task = asyncio.create_task(self._process_queue())
@@ -126,6 +111,66 @@ class PipelineService(BaseService):
             self.logger.error(f"Error initializing pipeline service: {str(e)}", exc_info=True)
             raise
 
+    async def warm_up(self) -> bool:
+        """Load the spaCy model and register the content processor.
+
+        Model loading and processor construction run in a worker thread so
+        the event loop keeps serving requests meanwhile. URLs can be enqueued
+        before this finishes; the worker starts processing them once it has.
+
+        Returns:
+            True if the content processor was registered
+        """
+        try:
+            self.nlp = await asyncio.to_thread(initialize_spacy_model)
+            if not self.nlp:
+                self.logger.warning("Failed to initialize spaCy model, keyword extraction will be limited")
+                return False
+            self.logger.info("Successfully initialized spaCy model")
+
+            try:
+                content_processor = await asyncio.to_thread(self._create_content_processor)
+
+                # Register for ANALYSIS stage
+                self.context.component_coordinator.register_component(
+                    content_processor,
+                    ProcessingStage.ANALYSIS
+                )
+                self.logger.info("ContentProcessor registered for ANALYSIS stage")
+                return True
+            except Exception as e:
+                self.logger.error(f"Error creating content processor: {str(e)}", exc_info=True)
+                self.logger.warning("Keyword extraction will be disabled")
+                return False
+        finally:
+            self.warmed_up.set()
+
+    def _create_content_processor(self) -> ContentProcessor:
+        """Build the content processor and its dependencies around ``self.nlp``."""
+        normalizer = KeywordNormalizer()
+
+        validation_config = ValidationConfig()
+        # Loads (or on first deploy builds) the shared lexicon artifact
+        abbreviation_service = AbbreviationService()
+
+        validator = KeywordValidator(
+            nlp=self.nlp,
+            config=validation_config,
+            abbreviation_service=abbreviation_service
+        )
+        relationship_manager = RelationshipManager(nlp=self.nlp)
+
+        return ContentProcessor(
+            config=ContentProcessorConfig(),
+            keyword_processor=None,  # Will be created internally
+            relationship_manager=relationship_manager,
+            normalizer=normalizer,
+            validator=validator,
+            nlp=self.nlp,
+            debug_mode=True,
+            df_store=self.df_store
+        )
+
     def _handle_pipeline_event(self, event: ProcessingEvent):
         """Handle pipeline events to update task status."""
         metadata = event.metadata
@@ -135,7 +180,7 @@ class PipelineService(BaseService):
         page: Page = metadata['page_object']
         url = page.url
         
-        if not url in self.processed_urls:
+        if url not in self.task_status:
             return
             
         # Update status tracking with Page object state
@@ -153,18 +198,52 @@ class PipelineService(BaseService):
             if page.errors:
                 status_update["page_errors"] = page.errors
 
-        self.processed_urls[url].update(status_update)
-
         if event.stage == ProcessingStage.COMPLETE:
-            url = page.url
-            if url in self.processed_urls:
-                self.processed_urls[url].update({
-                    "status": "completed",
-                    "progress": 1.0,
-                    "message": "Processing complete"
-                })
-            
+            status_update.update({
+                "status": "completed",
+                "progress": 1.0,
+                "message": "Processing complete"
+            })
+
+        self.task_status.update(url, status_update)
+
+
+    def _publish_task_status(self, task_id: str, url: str) -> None:
+        """Publish a task's aggregate status after one of its URLs changed."""
+        # Publishing is not a client read, so it must not keep the task alive
+        summary = self.task_status.summary(task_id, touch=False)
+        entry = self.task_status.get(url)
+        if summary is None or entry is None:
+            return
+        self.event_bus.publish(
+            "analysis",
+            task_id,
+            summary["status"],
+            progress=summary["progress"],
+            message=summary["message"],
+            data={
+                "url": url,
+                "url_status": entry.get("status"),
+                "url_progress": entry.get("progress", 0.0),
+                "total": summary["total"],
+                "counts": summary["counts"]
+            },
+            final=summary["finished"]
+        )
 
+    def _publish_queue_status(self) -> None:
+        """Publish queue depth for dashboards that used to poll /test/queue."""
+        if self.event_bus:
+            self.event_bus.publish(
+                "queue",
+                "pipeline",
+                "running" if self.url_queue.qsize() or self.active_tasks else "idle",
+                data={
+                    "queue_size": self.url_queue.qsize(),
+                    "active_tasks": len(self.active_tasks),
+                    "max_concurrent": self.max_concurrent
+                }
+            )
 
     def _map_stage_to_status(self, stage: ProcessingStage) -> str:
         """Map pipeline stages to task statuses."""
@@ -258,7 +337,7 @@ class PipelineService(BaseService):
                         }
                         
                         # Store in memory
-                        self.processed_urls[url] = status_entry
+                        self.task_status.set(url, status_entry)
                         
                         # Queue for processing
                         await self.url_queue.put({
@@ -284,51 +363,22 @@ class PipelineService(BaseService):
             self.logger.info(f"[get_status] Getting status for task: {task_id}")
             start_time = time.time()
             
-            # Step 1: Check if task exists in memory first (fast path)
-            task_urls = {
-                url: status for url, status in self.processed_urls.items()
-                if status.get("task_id") == task_id
-            }
+            # Step 1: Read the task's aggregate counters (fast path)
+            summary = self.task_status.summary(task_id)
             
-            if task_urls:
-                # Calculate overall task status from URLs
-                url_statuses = [info["status"] for info in task_urls.values()]
-                
-                # Determine overall status
-                if "error" in url_statuses:
-                    task_status = "error"
-                    error_msg = next((info.get("error", "Unknown error") 
-                                for info in task_urls.values() 
-                                if info["status"] == "error"), 
-                                "Task failed")
-                    message = f"Task failed: {error_msg}"
-                elif all(s == "completed" for s in url_statuses):
-                    task_status = "completed"
-                    message = "Task completed successfully"
-                elif any(s == "processing" for s in url_statuses):
-                    task_status = "processing"
-                    message = "Task is being processed"
-                else:
-                    task_status = "queued"
-                    message = "Task is queued for processing"
-                
-                # Calculate progress
-                progress = sum(
-                    info.get("progress", 0.0) for info in task_urls.values()
-                ) / len(task_urls)
-                
+            if summary:
                 status_data = {
-                    "status": task_status,
-                    "progress": progress,
-                    "message": message,
+                    "status": summary["status"],
+                    "progress": summary["progress"],
+                    "message": summary["message"],
                     "checked_at": datetime.now().isoformat()
                 }
                 
                 # Include error if status is error
-                if task_status == "error":
-                    status_data["error"] = error_msg
+                if summary["status"] == "error":
+                    status_data["error"] = summary["error"]
                 
-                self.logger.info(f"[get_status] Found task {task_id} in memory, status: {task_status}")
+                self.logger.info(f"[get_status] Found task {task_id} in memory, status: {summary['status']}")
                 return status_data
             
             # Step 2: Task not in memory, try database with explicit timeout
@@ -387,85 +437,82 @@ class PipelineService(BaseService):
             
             # Get the underlying Neo4j transaction
             neo4j_tx = tx.db_transaction
+            queued_at = datetime.now().isoformat()
             
-            # Create task record
-            await neo4j_tx.run(
-                """
-                CREATE (t:Task {
-                    id: $task_id,
-                    created_at: datetime(),
-                    status: 'enqueued'
-                })
-                """,
-                {"task_id": task_id}
-            )
-            
-            self.logger.debug(f"Created Task node with ID: {task_id}")
-
-            for item in urls:
-                url = str(item.get("url"))
-                queued_at = datetime.now().isoformat()
-                # Create status entry for processed_urls tracking
-                status_entry = {
-                    "url": url,
-                    "status": "queued",
-                    "task_id": task_id,
-                    "progress": 0.0,
-                    "queued_at": queued_at,
+            rows = [
+                {
+                    "url": str(item.get("url")),
                     "browser_context": item.get("context").value if item.get("context") else None,
                     "tab_id": item.get("tab_id"),
                     "window_id": item.get("window_id"),
                     "bookmark_id": item.get("bookmark_id")
                 }
-
-                # Create URL node in database
+                for item in urls
+            ]
+            
+            # Create the Task and its URL nodes with one UNWIND per chunk;
+            # the first chunk also creates the Task node
+            for offset in range(0, max(len(rows), 1), self.ENQUEUE_BATCH_SIZE):
+                match_task = (
+                    "CREATE (t:Task {id: $task_id, created_at: datetime(), status: 'enqueued'})"
+                    if offset == 0 else
+                    "MATCH (t:Task {id: $task_id})"
+                )
                 await neo4j_tx.run(
-                    """
-                    MATCH (t:Task {id: $task_id})
+                    match_task + """
+                    WITH t
+                    UNWIND $rows AS row
                     CREATE (u:URL {
-                        url: $url,
-                        status: $status,
+                        url: row.url,
+                        status: 'queued',
                         task_id: $task_id,
-                        progress: $progress,
+                        progress: 0.0,
                         queued_at: $queued_at,
-                        browser_context: $browser_context,
-                        tab_id: $tab_id,
-                        window_id: $window_id,
-                        bookmark_id: $bookmark_id
+                        browser_context: row.browser_context,
+                        tab_id: row.tab_id,
+                        window_id: row.window_id,
+                        bookmark_id: row.bookmark_id
                     })-[:PART_OF]->(t)
                     """,
                     {
                         "task_id": task_id,
-                        "url": url,
-                        "status": "queued",
-                        "progress": 0.0,
-                        "queued_at": datetime.now().isoformat(),
-                        "browser_context": item.get("context").value if item.get("context") else None,
-                        "tab_id": item.get("tab_id"),
-                        "window_id": item.get("window_id"),
-                        "bookmark_id": item.get("bookmark_id")
+                        "queued_at": queued_at,
+                        "rows": rows[offset:offset + self.ENQUEUE_BATCH_SIZE]
                     }
                 )
+            
+            self.logger.debug(f"Created Task {task_id} with {len(rows)} URL nodes")
+            
+            # Undo every URL of this task with a single handler
+            enqueued_urls = {row["url"] for row in rows}
+            tx.add_rollback_handler(
+                lambda: self._handle_enqueue_rollback(task_id, enqueued_urls)
+            )
+            
+            for row, item in zip(rows, urls):
+                url = row["url"]
+                # Create status entry for task status tracking
+                self.task_status.set(url, {
+                    "url": url,
+                    "status": "queued",
+                    "task_id": task_id,
+                    "progress": 0.0,
+                    "queued_at": queued_at,
+                    "browser_context": row["browser_context"],
+                    "tab_id": row["tab_id"],
+                    "window_id": row["window_id"],
+                    "bookmark_id": row["bookmark_id"]
+                })
                 
-                self.logger.debug(f"Created URL node for {url} in task {task_id}")
-                            
                 # Add to processing queue
-                await self.url_queue.put({
+                self.url_queue.put_nowait({
                     "url": url,
                     "metadata": item,
                     "task_id": task_id
                 })
-                
-                # Store in memory
-                self.processed_urls[url] = status_entry
-                
-                # Add rollback handler
-                tx.add_rollback_handler(
-                    lambda u=url: self._handle_enqueue_rollback(u)
-                )
                     
             self.logger.info(f"Enqueued {len(urls)} URLs for processing under task {task_id}")
-            self.logger.debug(f"Current processed_urls has {len(self.processed_urls)} entries after enqueueing")
+            self.logger.debug(f"Task status now tracks {len(self.task_status)} URLs after enqueueing")
             
             # Make sure the transaction is committed if it's not part of a larger transaction
             if getattr(tx, 'auto_commit', False) and not tx.is_nested:
@@ -485,18 +532,24 @@ class PipelineService(BaseService):
             raise
 
 
-    async def _handle_enqueue_rollback(self, url: str):
-        """Handle rollback for enqueued URL."""
-        if url in self.processed_urls:
-            del self.processed_urls[url]
-        # Attempt to remove from queue if possible
+    async def _handle_enqueue_rollback(self, task_id: str, urls: Set[str]):
+        """Handle rollback for all URLs enqueued under a task."""
+        for url in urls:
+            entry = self.task_status.get(url)
+            if entry is not None and entry.get("task_id") == task_id:
+                self.task_status.remove(url)
+        
+        # Drain the queue once and put back items of other tasks
+        remaining = []
         try:
-            while not self.url_queue.empty():
-                item = self.url_queue.get_nowait()
-                if item["url"] != url:
-                    await self.url_queue.put(item)
+            while True:
+                remaining.append(self.url_queue.get_nowait())
+                self.url_queue.task_done()
         except asyncio.QueueEmpty:
             pass
+        for item in remaining:
+            if item.get("task_id") != task_id:
+                self.url_queue.put_nowait(item)
 
     async def _update_task_status_operation(
         self,
@@ -571,25 +624,23 @@ class PipelineService(BaseService):
         start_time: datetime
     ) -> None:
         """Internal transaction-aware URL processing."""
-        self.logger.warning(f"<<<< _process_url_operation CALLED for URL {url} >>>>")
-
         try:
-            self.logger.info(f"Starting processing of URL {url} for task {task_id}")
-            self.logger.debug(f"Processing metadata: {metadata}")
+            self.logger.info("Starting processing of URL %s for task %s", url, task_id)
+            self.logger.debug("Processing metadata: %s", metadata)
             
-            # Check if URL exists in processed_urls
-            if url not in self.processed_urls:
-                self.logger.warning(f"URL {url} not found in processed_urls, adding it now")
-                self.processed_urls[url] = {
+            # Check if URL is tracked in task status
+            if url not in self.task_status:
+                self.logger.warning(f"URL {url} not tracked in task status, adding it now")
+                self.task_status.set(url, {
                     "url": url,
                     "status": "processing",
                     "task_id": task_id,
                     "progress": 0.0,
                     "started_at": start_time.isoformat()
-                }
+                })
             else:
                 # Update status to processing within transaction
-                self.processed_urls[url].update({
+                self.task_status.update(url, {
                     "status": "processing",
                     "started_at": start_time.isoformat()
                 })
@@ -602,10 +653,10 @@ class PipelineService(BaseService):
             
             # Add rollback handler for status update
             tx.add_rollback_handler(
-                lambda: self.processed_urls[url].update({
+                lambda: self.task_status.update(url, {
                     "status": "error",
                     "error": "Transaction rolled back"
-                }) if url in self.processed_urls else None
+                }) if url in self.task_status else None
             )
             
             # Process through pipeline
@@ -626,14 +677,14 @@ class PipelineService(BaseService):
             if context in [BrowserContext.ACTIVE_TAB, BrowserContext.OPEN_TAB]:
                 result.record_visit(tab_id=tab_id, window_id=window_id)
             
-            if url not in self.processed_urls:
-                self.logger.warning(f"URL {url} not found in processed_urls, re-adding it")
-                self.processed_urls[url] = {
+            if url not in self.task_status:
+                self.logger.warning(f"URL {url} not tracked in task status, re-adding it")
+                self.task_status.set(url, {
                     "url": url,
                     "status": "processing",
                     "task_id": task_id,
                     "progress": 0.8,  # We're at storage stage
-                }
+                })
 
             url_update_tx = Transaction()
             await url_update_tx.initialize_db_transaction(self.db_connection._driver.session())
@@ -674,8 +725,8 @@ class PipelineService(BaseService):
                     }
                 }
                 
-                if url in self.processed_urls:
-                    self.processed_urls[url].update(status_update)
+                if url in self.task_status:
+                    self.task_status.update(url, status_update)
                 
             except Exception as tx_error:
                 # Rollback if something goes wrong
@@ -707,7 +758,7 @@ class PipelineService(BaseService):
             )
         except Exception as e:
             # Handle error and update status outside transaction
-            self.processed_urls[url].update({
+            self.task_status.update(url, {
                 "status": "error",
                 "error": str(e),
                 "completed_at": datetime.now().isoformat(),
@@ -720,6 +771,9 @@ class PipelineService(BaseService):
         """Background worker that processes URLs from the queue with improved error handling and logging."""
         try:
             self.logger.info("URL processing worker started")
+            if not self.warmed_up.is_set():
+                self.logger.info("Waiting for NLP warm-up before processing queued URLs")
+                await self.warmed_up.wait()
             last_queue_size = 0
             last_log_time = time.time()
             
@@ -737,6 +791,8 @@ class PipelineService(BaseService):
                     current_time = time.time()
                     
                     # Only log when queue size changes or every 60 seconds
+                    if queue_size != last_queue_size:
+                        self._publish_queue_status()
                     if queue_size != last_queue_size or (current_time - last_log_time > 60):
                         if queue_size > 0:
                             self.logger.info(f"Queue status: {queue_size} items pending, {active_tasks_count} active tasks")
@@ -775,8 +831,8 @@ class PipelineService(BaseService):
                         # Process the URL
                         try:
                             # Update status to processing
-                            if url in self.processed_urls:
-                                self.processed_urls[url].update({
+                            if url in self.task_status:
+                                self.task_status.update(url, {
                                     "status": "processing",
                                     "started_at": datetime.now().isoformat()
                                 })
@@ -793,8 +849,8 @@ class PipelineService(BaseService):
                             self.logger.error(f"Failed to create task for URL {url}: {str(process_error)}", exc_info=True)
                             
                             # Update status to error
-                            if url in self.processed_urls:
-                                self.processed_urls[url].update({
+                            if url in self.task_status:
+                                self.task_status.update(url, {
                                     "status": "error",
                                     "error": f"Failed to start processing: {str(process_error)}",
                                     "completed_at": datetime.now().isoformat()
@@ -822,11 +878,11 @@ class PipelineService(BaseService):
             self.logger.info(f"Processing URL {url} for task {task_id} (recovered: {is_recovered})")
             
             # Debug current status
-            if url in self.processed_urls:
-                current_status = self.processed_urls[url].get("status", "unknown")
+            if url in self.task_status:
+                current_status = self.task_status.get(url).get("status", "unknown")
                 self.logger.info(f"Current status before processing: {current_status}")
             else:
-                self.logger.warning(f"URL {url} not in processed_urls at start of _direct_process_url")
+                self.logger.warning(f"URL {url} not tracked in task status at start of _direct_process_url")
             
             # Create a transaction and process
             tx = Transaction()
@@ -851,8 +907,8 @@ class PipelineService(BaseService):
             self.logger.error(f"Error processing URL {url}: {str(e)}", exc_info=True)
             
             # Ensure status is updated to error if we have the URL
-            if url in self.processed_urls:
-                self.processed_urls[url].update({
+            if url in self.task_status:
+                self.task_status.update(url, {
                     "status": "error",
                     "error": str(e),
                     "completed_at": datetime.now().isoformat()
@@ -896,15 +952,12 @@ class PipelineService(BaseService):
             tx.add_rollback_handler(lambda: self.logger.warning(f"Rolling back status check for task {task_id}"))
             
             # Add detailed logging
-            self.logger.debug(f"Status check for task {task_id} - processed_urls has {len(self.processed_urls)} entries")
+            self.logger.debug(f"Status check for task {task_id} - task status tracks {len(self.task_status)} URLs")
             
             # First check in-memory status
-            task_urls = {
-                url: status for url, status in self.processed_urls.items()
-                if status.get("task_id") == task_id
-            }
+            summary = self.task_status.summary(task_id)
             
-            if not task_urls:
+            if not summary:
                 # Check in database using read-only queries
                 task_exists_result = await self.db_connection.execute_read_query(
                     "MATCH (t:Task {id: $task_id}) RETURN t",
@@ -956,14 +1009,14 @@ class PipelineService(BaseService):
                 for url_data in url_result:
                     url = url_data["url"]
                     status = url_data["status"]
-                    if url not in self.processed_urls:
-                        self.processed_urls[url] = {
+                    if url not in self.task_status:
+                        self.task_status.set(url, {
                             "url": url,
                             "status": status,
                             "task_id": task_id,
                             "progress": float(url_data["progress"]) if url_data["progress"] is not None else 0.0,
                             "recovered_from_db": True  # Flag to indicate this was recovered from DB
-                        }
+                        })
                         self.logger.debug(f"Recovered URL {url} for task {task_id} from database")
 
                         # If status is "queued", add to queue as well
@@ -984,12 +1037,9 @@ class PipelineService(BaseService):
                 await self.debug_queue_state()
                                 
                 # Now retry the memory check with the recovered URLs
-                task_urls = {
-                    url: status for url, status in self.processed_urls.items()
-                    if status.get("task_id") == task_id
-                }
+                summary = self.task_status.summary(task_id)
                 
-                if not task_urls:
+                if not summary:
                     self.logger.warning(f"Still no URLs found for task {task_id} after DB recovery")
                     return {
                         "status": "error",
@@ -997,54 +1047,23 @@ class PipelineService(BaseService):
                         "message": "Task found but URL processing failed"
                     }
             
-            # Calculate overall task status (this part remains the same)
-            url_statuses = [info["status"] for info in task_urls.values()]
-            
-            # Determine overall status (same as before)
-            if "error" in url_statuses:
-                task_status = "error"
-                message = next((info.get("error", "Unknown error") 
-                            for info in task_urls.values() 
-                            if info["status"] == "error"), 
-                            "Task failed")
-            elif all(s == "completed" for s in url_statuses):
-                task_status = "completed"
-                message = "Task completed successfully"
-            elif any(s == "processing" for s in url_statuses):
-                task_status = "processing"
-                message = "Task is being processed"
-            else:
-                task_status = "queued"
-                message = "Task is queued for processing"
-                
-            # Calculate progress
-            progress = sum(
-                info.get("progress", 0.0) for info in task_urls.values()
-            ) / len(task_urls)
-
-            # Record the status check
-            status_data = {
-                "status": task_status,
-                "progress": progress,
-                "message": message,
-                "checked_at": datetime.now().isoformat()
-            }
+            task_status = summary["status"]
+            message = summary["error"] if task_status == "error" else summary["message"]
 
-            all_progress_complete = all(info.get("progress", 0.0) >= 0.99 for info in task_urls.values())
-            if all_progress_complete and task_status != "error":
+            if summary["all_progress_complete"] and task_status != "error":
                 task_status = "completed"  
                 message = "Task completed successfully"
                 
-                # Update the status in processed_urls to match
-                for url, info in task_urls.items():
-                    if info.get("status") != "completed":
+                # Update the URL statuses to match
+                for url in self.task_status.task_urls(task_id):
+                    info = self.task_status.get(url)
+                    if info is not None and info.get("status") != "completed":
                         self.logger.info(f"Updating status for URL {url} from {info.get('status')} to completed based on 100% progress")
-                        self.processed_urls[url]["status"] = "completed"
+                        self.task_status.update(url, {"status": "completed"})
             
-            # Record the status check (same as before)
             status_data = {
                 "status": task_status,
-                "progress": progress,
+                "progress": summary["progress"],
                 "message": message,
                 "checked_at": datetime.now().isoformat()
             }
@@ -1076,7 +1095,7 @@ class PipelineService(BaseService):
                     pass
 
             self.active_tasks.clear()
-            self.processed_urls.clear()
+            self.task_status.clear()
             
             # Clear queue
             while not self.url_queue.empty():
@@ -1128,7 +1147,7 @@ class PipelineService(BaseService):
     #                 active_tasks = len(self.active_tasks)
                     
     #                 # Get URLs that are in queued state in processed_urls
-    #                 queued_urls = [url for url, info in self.processed_urls.items() 
+    #                 queued_urls = [url for url, info in self.task_status.items() 
     #                             if info.get("status") == "queued"]
                     
     #                 # self.logger.debug(f"Worker monitor: queue_size={queue_size}, active_tasks={active_tasks}, queued_urls={len(queued_urls)}")
@@ -1157,7 +1176,7 @@ class PipelineService(BaseService):
         self.logger.info(f"Queue diagnostics:")
         self.logger.info(f"Queue size: {self.url_queue.qsize()}")
         self.logger.info(f"Active tasks: {len(self.active_tasks)}")
-        self.logger.info(f"Processed URLs: {len(self.processed_urls)}")
+        self.logger.info(f"Processed URLs: {len(self.task_status)}")
         
         # Try to inspect the queue's internal counter
         try:
@@ -1167,8 +1186,8 @@ class PipelineService(BaseService):
         except:
             self.logger.info("Could not access queue internals")
         
-        # Check processed_urls that should be in the queue
-        queued_urls = [url for url, info in self.processed_urls.items() 
+        # Check tracked URLs that should be in the queue
+        queued_urls = [url for url, info in self.task_status.items() 
                     if info.get("status") == "queued"]
         self.logger.info(f"URLs in 'queued' state: {len(queued_urls)}")
         
@@ -1200,7 +1219,7 @@ class PipelineService(BaseService):
         new_queue = asyncio.Queue()
         
         # Find all URLs in queued state
-        queued_urls = [(url, info) for url, info in self.processed_urls.items() 
+        queued_urls = [(url, info) for url, info in self.task_status.items() 
                     if info.get("status") == "queued"]
         
         self.logger.info(f"Found {len(queued_urls)} URLs to requeue (old queue size was {old_queue_size})")
@@ -1208,7 +1227,7 @@ class PipelineService(BaseService):
         # Add them to the new queue
         for url, info in queued_urls:
             task_id = info.get("task_id")
-            # Reconstruct metadata from the processed_urls entry
+            # Reconstruct metadata from the task status entry
             metadata = {
                 "context": info.get("browser_context"),
                 "tab_id": info.get("tab_id"),
@@ -1243,9 +1262,9 @@ class PipelineService(BaseService):
         """Handle a failed task."""
         self.logger.error(f"Task for URL {url} failed with error: {str(exception)}")
         
-        # Update status in processed_urls
-        if url in self.processed_urls:
-            self.processed_urls[url].update({
+        # Update task status
+        if url in self.task_status:
+            self.task_status.update(url, {
                 "status": "error",
                 "error": str(exception),
                 "completed_at": datetime.now().isoformat()
@@ -0,0 +1,255 @@
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Set, Tuple
+
+FINISHED_STATUSES = frozenset({"completed", "error"})
+
+# Progress at which a URL counts as done even if its status lags behind
+COMPLETE_PROGRESS = 0.99
+
+
+@dataclass
+class TaskStatusConfig:
+    """Configuration for in-memory task status tracking.
+
+    Attributes:
+        finished_ttl: Seconds a finished task is kept after it was last read or updated
+        max_finished_urls: URL entries kept across finished tasks before the
+            least recently used tasks are evicted
+    """
+    finished_ttl: float = 3600.0
+    max_finished_urls: int = 10_000
+
+
+@dataclass(slots=True)
+class _TaskCounters:
+    """Aggregates for one task, maintained on every URL transition."""
+    urls: Set[str] = field(default_factory=set)
+    statuses: Counter = field(default_factory=Counter)
+    progress_sum: float = 0.0
+    progress_done: int = 0
+    # Insertion-ordered set of URLs in error, for the first error message
+    errors: Dict[str, None] = field(default_factory=dict)
+
+    @property
+    def finished(self) -> bool:
+        return sum(self.statuses[s] for s in FINISHED_STATUSES) == len(self.urls)
+
+
+class TaskStatusStore:
+    """Per-URL processing status indexed by task.
+
+    Entries are kept by URL with a task → URLs index and per-task counters
+    that are adjusted on each transition, so a task's status is read in
+    constant time instead of by scanning every tracked URL. Tasks whose URLs
+    have all completed or failed are evicted after ``finished_ttl`` seconds
+    without access, and least recently used first once more than
+    ``max_finished_urls`` finished entries are held. Evicted tasks are
+    answered from the database again.
+
+    Entries are returned read-only; all changes go through ``set`` and
+    ``update`` so the counters stay consistent. ``on_change`` is called with
+    the task id and URL after each of them.
+    """
+
+    def __init__(
+        self,
+        config: Optional[TaskStatusConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+        on_change: Optional[Callable[[str, str], None]] = None
+    ):
+        self.config = config or TaskStatusConfig()
+        self._clock = clock
+        self.on_change = on_change
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._tasks: Dict[str, _TaskCounters] = {}
+        # Finished task ids in least recently used order, with last access time
+        self._finished: "OrderedDict[str, float]" = OrderedDict()
+        self._finished_urls = 0
+
+    def __contains__(self, url: object) -> bool:
+        return url in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, url: str) -> Optional[Mapping[str, Any]]:
+        entry = self._entries.get(url)
+        return MappingProxyType(entry) if entry is not None else None
+
+    def items(self) -> Iterator[Tuple[str, Mapping[str, Any]]]:
+        for url, entry in list(self._entries.items()):
+            yield url, MappingProxyType(entry)
+
+    def task_urls(self, task_id: str) -> Set[str]:
+        counters = self._tasks.get(task_id)
+        return set(counters.urls) if counters else set()
+
+    def set(self, url: str, entry: Dict[str, Any]) -> None:
+        """Track a URL, replacing any previous entry.
+
+        Args:
+            url: URL being processed
+            entry: Status fields; ``task_id`` and ``status`` are indexed
+        """
+        if url in self._entries:
+            self.remove(url)
+        entry = dict(entry)
+        task_id = entry.get("task_id")
+        self._entries[url] = entry
+        counters = self._tasks.get(task_id)
+        if counters is None:
+            counters = self._tasks[task_id] = _TaskCounters()
+        elif task_id in self._finished:
+            self._unfinish(task_id, counters)
+        counters.urls.add(url)
+        self._count(counters, url, entry, 1)
+        self._refresh(task_id, counters)
+        if self.on_change:
+            self.on_change(task_id, url)
+
+    def update(self, url: str, changes: Dict[str, Any]) -> bool:
+        """Apply changes to a tracked URL.
+
+        Args:
+            url: Tracked URL
+            changes: Fields to set
+
+        Returns:
+            False if the URL is not tracked
+        """
+        entry = self._entries.get(url)
+        if entry is None:
+            return False
+        task_id = entry.get("task_id")
+        counters = self._tasks[task_id]
+        was_finished = task_id in self._finished
+        self._count(counters, url, entry, -1)
+        entry.update(changes)
+        self._count(counters, url, entry, 1)
+        if was_finished and not counters.finished:
+            self._unfinish(task_id, counters)
+        self._refresh(task_id, counters)
+        if self.on_change:
+            self.on_change(task_id, url)
+        return True
+
+    def remove(self, url: str) -> None:
+        entry = self._entries.pop(url, None)
+        if entry is None:
+            return
+        task_id = entry.get("task_id")
+        counters = self._tasks[task_id]
+        if task_id in self._finished:
+            self._unfinish(task_id, counters)
+        self._count(counters, url, entry, -1)
+        counters.urls.discard(url)
+        if counters.urls:
+            self._refresh(task_id, counters)
+        else:
+            del self._tasks[task_id]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tasks.clear()
+        self._finished.clear()
+        self._finished_urls = 0
+
+    def summary(self, task_id: str, touch: bool = True) -> Optional[Dict[str, Any]]:
+        """Aggregate status of a task from its counters.
+
+        Args:
+            task_id: Task to look up
+            touch: Count this as an access, keeping a finished task for
+                another ``finished_ttl`` and marking it recently used; pass
+                False for internal reads such as publishing updates
+
+        Returns:
+            Status, progress and message (plus ``error`` for failed tasks),
+            and whether every URL has finished, or None if the task is not
+            tracked in memory
+        """
+        if touch:
+            self.evict()
+        counters = self._tasks.get(task_id)
+        if counters is None:
+            return None
+        if touch and task_id in self._finished:
+            self._finished[task_id] = self._clock()
+            self._finished.move_to_end(task_id)
+
+        total = len(counters.urls)
+        statuses = counters.statuses
+        summary: Dict[str, Any] = {
+            "total": total,
+            "progress": counters.progress_sum / total,
+            "counts": dict(statuses),
+            "all_progress_complete": counters.progress_done == total,
+            # An error is reported as soon as one URL fails, before the rest finish
+            "finished": counters.finished
+        }
+        if counters.errors:
+            first_error = next(iter(counters.errors))
+            summary["status"] = "error"
+            summary["error"] = self._entries[first_error].get("error", "Unknown error")
+            summary["message"] = f"Task failed: {summary['error']}"
+        elif statuses["completed"] == total:
+            summary["status"] = "completed"
+            summary["message"] = "Task completed successfully"
+        elif statuses["processing"]:
+            summary["status"] = "processing"
+            summary["message"] = "Task is being processed"
+        else:
+            summary["status"] = "queued"
+            summary["message"] = "Task is queued for processing"
+        return summary
+
+    def evict(self) -> int:
+        """Drop finished tasks that expired or exceed the size bound.
+
+        Returns:
+            Number of URL entries evicted
+        """
+        evicted = 0
+        expiry = self._clock() - self.config.finished_ttl
+        while self._finished:
+            task_id, touched = next(iter(self._finished.items()))
+            if touched > expiry and self._finished_urls <= self.config.max_finished_urls:
+                break
+            counters = self._tasks.pop(task_id)
+            del self._finished[task_id]
+            self._finished_urls -= len(counters.urls)
+            for url in counters.urls:
+                del self._entries[url]
+            evicted += len(counters.urls)
+        return evicted
+
+    def _count(self, counters: _TaskCounters, url: str, entry: Dict[str, Any], sign: int) -> None:
+        status = entry.get("status")
+        progress = entry.get("progress") or 0.0
+        counters.statuses[status] += sign
+        if counters.statuses[status] <= 0:
+            del counters.statuses[status]
+        counters.progress_sum += sign * progress
+        if progress >= COMPLETE_PROGRESS:
+            counters.progress_done += sign
+        if status == "error":
+            if sign > 0:
+                counters.errors[url] = None
+            else:
+                counters.errors.pop(url, None)
+
+    def _refresh(self, task_id: str, counters: _TaskCounters) -> None:
+        """Move a task into the finished set once all its URLs are done."""
+        if counters.finished:
+            if task_id not in self._finished:
+                self._finished_urls += len(counters.urls)
+            self._finished[task_id] = self._clock()
+            self._finished.move_to_end(task_id)
+            self.evict()
+
+    def _unfinish(self, task_id: str, counters: _TaskCounters) -> None:
+        del self._finished[task_id]
+        self._finished_urls -= len(counters.urls)
@@ -0,0 +1,283 @@
+import asyncio
+import itertools
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+TERMINAL_STATUSES = frozenset({"completed", "error"})
+
+
+@dataclass
+class EventBusConfig:
+    """Configuration for the task event bus.
+
+    Attributes:
+        max_pending: Distinct tasks buffered per subscriber before the oldest
+            undelivered one is dropped
+        max_snapshots: Tasks whose latest event is kept for new subscribers
+    """
+    max_pending: int = 256
+    max_snapshots: int = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class TaskEvent:
+    """A status transition of a pipeline or agent task.
+
+    ``final`` marks the task's last event when the publisher knows it; a
+    task can report ``error`` while parts of it are still running. Without
+    it, completed and error statuses are terminal.
+    """
+    topic: str
+    task_id: str
+    status: str
+    progress: float = 0.0
+    message: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+    sequence: int = 0
+    timestamp: float = 0.0
+    final: Optional[bool] = None
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.topic, self.task_id
+
+    @property
+    def terminal(self) -> bool:
+        if self.final is not None:
+            return self.final
+        return self.status in TERMINAL_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "topic": self.topic,
+            "task_id": self.task_id,
+            "status": self.status,
+            "progress": self.progress,
+            "message": self.message,
+            "data": self.data,
+            "sequence": self.sequence,
+            "timestamp": self.timestamp,
+            "terminal": self.terminal
+        }
+
+
+class EventSubscription:
+    """Filtered, coalescing view of the event bus for one consumer.
+
+    Undelivered events are kept per (topic, task) and a newer event replaces
+    the pending one, so a slow consumer receives the latest state of each
+    task instead of a growing backlog. If more than ``max_pending`` tasks are
+    waiting, the oldest is dropped and ``lagged`` is set; the consumer should
+    then re-read status from the polling endpoints.
+    """
+
+    def __init__(
+        self,
+        bus: "TaskEventBus",
+        topics: Optional[Set[str]],
+        task_ids: Optional[Set[str]],
+        max_pending: int
+    ):
+        self._bus = bus
+        self.topics = topics
+        self.task_ids = task_ids
+        self.max_pending = max_pending
+        self.coalesced = 0
+        self.dropped = 0
+        self.lagged = False
+        self.closed = False
+        self._pending: "OrderedDict[Tuple[str, str], TaskEvent]" = OrderedDict()
+        self._wakeup = asyncio.Event()
+
+    def matches(self, event: TaskEvent) -> bool:
+        return (
+            (self.topics is None or event.topic in self.topics)
+            and (self.task_ids is None or event.task_id in self.task_ids)
+        )
+
+    def offer(self, event: TaskEvent) -> None:
+        if self.closed:
+            return
+        if event.key in self._pending:
+            # Keep the task's place in line, deliver only its newest state
+            self._pending[event.key] = event
+            self.coalesced += 1
+        else:
+            if len(self._pending) >= self.max_pending:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+                self.lagged = True
+            self._pending[event.key] = event
+        self._wakeup.set()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[TaskEvent]:
+        """Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            The next event, or None on timeout or when closed
+        """
+        while not self._pending:
+            if self.closed:
+                return None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._pending.popitem(last=False)[1]
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._bus.unsubscribe(self)
+            self._wakeup.set()
+
+    def __enter__(self) -> "EventSubscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class TaskEventBus:
+    """In-process publish/subscribe bus for task status transitions.
+
+    Publishers (the pipeline's task status store and the API task managers)
+    call ``publish`` synchronously on the event loop; it only hands the
+    event to matching subscriptions, which buffer and coalesce it. Subscribers
+    filtered by task id are indexed by task, so publishing costs scale with
+    the number of interested consumers rather than all open streams. The
+    latest event per task is kept so a new subscriber starts from the
+    current state instead of waiting for the next transition.
+    """
+
+    def __init__(self, config: Optional[EventBusConfig] = None):
+        self.config = config or EventBusConfig()
+        self.logger = logger
+        self._sequence = itertools.count(1)
+        self._by_task: Dict[str, Set[EventSubscription]] = {}
+        self._unfiltered: Set[EventSubscription] = set()
+        self._snapshots: "OrderedDict[Tuple[str, str], TaskEvent]" = OrderedDict()
+        self.published = 0
+
+    def publish(
+        self,
+        topic: str,
+        task_id: str,
+        status: str,
+        progress: float = 0.0,
+        message: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
+        final: Optional[bool] = None
+    ) -> TaskEvent:
+        """Publish a task transition to matching subscribers.
+
+        Args:
+            topic: Event source, e.g. ``analysis`` or ``agent``
+            task_id: Task the event belongs to
+            status: Task status after the transition
+            progress: Task progress between 0 and 1
+            message: Human-readable status message
+            data: Additional JSON-serialisable fields
+            final: Whether this is the task's last event; None to derive
+                it from the status
+
+        Returns:
+            The published event
+        """
+        event = TaskEvent(
+            topic=topic,
+            task_id=task_id,
+            status=status,
+            progress=progress,
+            message=message,
+            data=data or {},
+            sequence=next(self._sequence),
+            timestamp=time.time(),
+            final=final
+        )
+        self.published += 1
+
+        self._snapshots[event.key] = event
+        self._snapshots.move_to_end(event.key)
+        if len(self._snapshots) > self.config.max_snapshots:
+            self._snapshots.popitem(last=False)
+
+        for subscription in self._unfiltered:
+            if subscription.matches(event):
+                subscription.offer(event)
+        for subscription in self._by_task.get(task_id, ()):
+            if subscription.matches(event):
+                subscription.offer(event)
+        return event
+
+    def subscribe(
+        self,
+        topics: Optional[Iterable[str]] = None,
+        task_ids: Optional[Iterable[str]] = None,
+        max_pending: Optional[int] = None,
+        replay: bool = True
+    ) -> EventSubscription:
+        """Open a subscription.
+
+        Args:
+            topics: Topics to receive, or None for all
+            task_ids: Tasks to receive, or None for all
+            max_pending: Per-subscriber buffer size (defaults to config)
+            replay: Queue the latest known event of each requested task
+
+        Returns:
+            Subscription to read events from; close it when done
+        """
+        subscription = EventSubscription(
+            self,
+            set(topics) if topics else None,
+            set(task_ids) if task_ids else None,
+            max_pending or self.config.max_pending
+        )
+        if subscription.task_ids is None:
+            self._unfiltered.add(subscription)
+        else:
+            for task_id in subscription.task_ids:
+                self._by_task.setdefault(task_id, set()).add(subscription)
+
+        if replay and subscription.task_ids is not None:
+            if subscription.topics is not None:
+                keys = [(t, i) for t in subscription.topics for i in subscription.task_ids]
+                replayed = [self._snapshots[k] for k in keys if k in self._snapshots]
+            else:
+                replayed = [e for e in self._snapshots.values() if subscription.matches(e)]
+            for event in sorted(replayed, key=lambda e: e.sequence):
+                subscription.offer(event)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        self._unfiltered.discard(subscription)
+        for task_id in subscription.task_ids or ():
+            subscribers = self._by_task.get(task_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._by_task[task_id]
+
+    def latest(self, topic: str, task_id: str) -> Optional[TaskEvent]:
+        return self._snapshots.get((topic, task_id))
+
+    def stats(self) -> Dict[str, Any]:
+        subscriptions = self._unfiltered.union(*self._by_task.values())
+        return {
+            "published": self.published,
+            "subscribers": len(subscriptions),
+            "tracked_tasks": len(self._snapshots),
+            "coalesced": sum(s.coalesced for s in subscriptions),
+            "dropped": sum(s.dropped for s in subscriptions)
+        }
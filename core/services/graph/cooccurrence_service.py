@@ -0,0 +1,368 @@
+import asyncio
+import heapq
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from core.domain.content.models.page import Page
+from core.infrastructure.database.db_connection import DatabaseConnection
+from core.services.base import BaseService
+from core.utils.logger import get_logger
+
+
+@dataclass
+class CooccurrenceConfig:
+    """Configuration for cross-page keyword co-occurrence.
+
+    Attributes:
+        top_k: Neighbours written to Neo4j per keyword
+        max_neighbours: Neighbours kept in memory per keyword for queries
+        max_keywords_per_page: Highest-scored keywords of a page that are counted
+        min_pair_count: Pages two keywords must share before they can be related
+        min_npmi: Minimum normalised PMI for a neighbour
+        flush_interval: Seconds between RELATED_TO flushes to Neo4j
+        flush_batch_size: Rows per UNWIND batch
+        seed_on_start: Rebuild counts from stored pages on initialize
+        max_pairs_per_keyword: Partners counted per keyword; the least frequent
+            are dropped beyond this
+        max_keywords: Keywords counted; the least frequent are dropped beyond this
+    """
+    top_k: int = 10
+    max_neighbours: int = 100
+    max_keywords_per_page: int = 25
+    min_pair_count: int = 2
+    min_npmi: float = 0.2
+    flush_interval: float = 30.0
+    flush_batch_size: int = 500
+    seed_on_start: bool = True
+    max_pairs_per_keyword: int = 500
+    max_keywords: int = 50_000
+
+
+@dataclass(frozen=True)
+class KeywordNeighbour:
+    """A co-occurring keyword and its association scores."""
+    keyword: str
+    npmi: float
+    pmi: float
+    count: int
+
+
+class KeywordCooccurrenceService(BaseService):
+    """Incrementally maintained cross-page keyword co-occurrence.
+
+    Each stored page adds its keywords to sparse pair counts (an adjacency
+    map, so only pairs that ever co-occurred take space). Neighbour lists
+    ranked by NPMI are kept for the top-k only and recomputed lazily for
+    keywords touched since the last flush. A background task periodically
+    writes changed neighbourhoods to Neo4j as RELATED_TO edges in UNWIND
+    batches, so neighbourhood queries are served precomputed instead of by
+    multi-hop traversals.
+
+    Scores of untouched keywords are not refreshed when the page count
+    grows; they are recomputed the next time either keyword is seen.
+
+    Keywords are counted case-insensitively; the text a keyword was first
+    stored with is kept to match its Keyword node. Pair and keyword counts
+    are capped, dropping the least frequent entries, so memory stays bounded
+    on a long-running server.
+    """
+
+    RELATIONSHIP_SOURCE = "cooccurrence"
+
+    def __init__(
+        self,
+        db_connection: DatabaseConnection,
+        config: Optional[CooccurrenceConfig] = None
+    ):
+        super().__init__()
+        self.db_connection = db_connection
+        self.config = config or CooccurrenceConfig()
+        self.logger = get_logger(__name__)
+
+        self.page_count = 0
+        self.keyword_counts: Counter = Counter()
+        self._pairs: Dict[str, Dict[str, int]] = {}
+        # Entries across all pair maps, kept in step with _pairs for stats()
+        self._pair_entries = 0
+        # Normalised key -> text of the Keyword node
+        self._texts: Dict[str, str] = {}
+        self._neighbours: Dict[str, Tuple[KeywordNeighbour, ...]] = {}
+        self._flushed: Dict[str, Set[str]] = {}
+        self._dirty: Set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def initialize(self) -> None:
+        """Seed counts from stored pages and start periodic flushing."""
+        await super().initialize()
+        if self.config.seed_on_start:
+            await self.seed()
+        if self.config.flush_interval > 0 and not self._flush_task:
+            self._flush_task = asyncio.create_task(self._run_periodic_flush())
+
+    async def cleanup(self) -> None:
+        """Stop the flush task and write pending neighbourhoods."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+        await super().cleanup()
+
+    def add_page(self, keywords: Union[Mapping[str, float], Iterable[str]]) -> None:
+        """Count the keywords of one newly stored page.
+
+        Args:
+            keywords: Keyword texts, or a mapping of keyword text to score;
+                only the highest-scored ``max_keywords_per_page`` are counted
+        """
+        if isinstance(keywords, Mapping):
+            ranked = sorted(keywords.items(), key=lambda item: item[1], reverse=True)
+            texts = [text for text, _ in ranked]
+        else:
+            texts = list(keywords)
+
+        selected: List[str] = []
+        seen: Set[str] = set()
+        for text in texts:
+            key = self._key(text)
+            if key and key not in seen:
+                seen.add(key)
+                selected.append(key)
+                self._texts.setdefault(key, text)
+            if len(selected) >= self.config.max_keywords_per_page:
+                break
+
+        self.page_count += 1
+        self.keyword_counts.update(selected)
+        for i, source in enumerate(selected):
+            source_pairs = self._pairs.setdefault(source, {})
+            for target in selected[i + 1:]:
+                self._increment_pair(source_pairs, target)
+                self._increment_pair(self._pairs.setdefault(target, {}), source)
+        for keyword in selected:
+            self._prune_pairs(keyword)
+            self._neighbours.pop(keyword, None)
+        self._dirty.update(selected)
+        if len(self.keyword_counts) > self.config.max_keywords:
+            self._evict_keywords()
+
+    def record_page_stored(self, page: Page, keywords_stored: int) -> None:
+        """Storage hook: count the keywords of a newly stored page.
+
+        Args:
+            page: The newly stored page
+            keywords_stored: Number of keywords linked to the page
+        """
+        if page.keywords:
+            self.add_page(page.keywords)
+
+    def get_neighbours(self, keyword: str, limit: Optional[int] = None) -> List[KeywordNeighbour]:
+        """Top co-occurring keywords by NPMI.
+
+        Args:
+            keyword: Keyword text
+            limit: Maximum neighbours (defaults to config.top_k, at most
+                config.max_neighbours)
+
+        Returns:
+            Neighbours, best first
+        """
+        key = self._key(keyword)
+        if key not in self.keyword_counts:
+            # Not cached, so lookups of unknown keywords cannot grow the cache
+            return []
+        neighbours = self._neighbours.get(key)
+        if neighbours is None:
+            neighbours = self._neighbours[key] = self._compute_neighbours(key)
+        return list(neighbours[:limit or self.config.top_k])
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pages": self.page_count,
+            "keywords": len(self.keyword_counts),
+            "pairs": self._pair_entries // 2,
+            "pending_flush": len(self._dirty)
+        }
+
+    async def flush(self) -> int:
+        """Write neighbourhoods of keywords changed since the last flush.
+
+        Returns:
+            Number of RELATED_TO edges written
+        """
+        if not self._dirty:
+            return 0
+        dirty, self._dirty = self._dirty, set()
+
+        upserts: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        removals: Set[Tuple[str, str]] = set()
+        for keyword in dirty:
+            neighbours = self.get_neighbours(keyword)
+            current = {n.keyword for n in neighbours}
+            for neighbour in neighbours:
+                pair = tuple(sorted((keyword, neighbour.keyword)))
+                upserts[pair] = {
+                    "source": self._texts.get(pair[0], pair[0]),
+                    "target": self._texts.get(pair[1], pair[1]),
+                    "npmi": round(neighbour.npmi, 4),
+                    "pmi": round(neighbour.pmi, 4),
+                    "count": neighbour.count
+                }
+            # Drop edges that neither endpoint still ranks in its top-k
+            for dropped in self._flushed.get(keyword, set()) - current:
+                if keyword not in {n.keyword for n in self.get_neighbours(dropped)}:
+                    removals.add(tuple(sorted((keyword, dropped))))
+            self._flushed[keyword] = current
+        removals -= set(upserts)
+
+        try:
+            written = 0
+            rows = list(upserts.values())
+            for batch in self._batches(rows):
+                await self.db_connection.execute_query(
+                    """
+                    UNWIND $rows AS row
+                    MATCH (a:Keyword {text: row.source})
+                    MATCH (b:Keyword {text: row.target})
+                    MERGE (a)-[r:RELATED_TO]->(b)
+                    ON CREATE SET r.created_at = datetime()
+                    SET r.npmi = row.npmi,
+                        r.pmi = row.pmi,
+                        r.count = row.count,
+                        r.source = $source,
+                        r.updated_at = datetime()
+                    """,
+                    {"rows": batch, "source": self.RELATIONSHIP_SOURCE}
+                )
+                written += len(batch)
+
+            removal_rows = [
+                {"source": self._texts.get(a, a), "target": self._texts.get(b, b)}
+                for a, b in removals
+            ]
+            for batch in self._batches(removal_rows):
+                await self.db_connection.execute_query(
+                    """
+                    UNWIND $rows AS row
+                    MATCH (a:Keyword {text: row.source})-[r:RELATED_TO {source: $source}]->(b:Keyword {text: row.target})
+                    DELETE r
+                    """,
+                    {"rows": batch, "source": self.RELATIONSHIP_SOURCE}
+                )
+
+            self.logger.debug(
+                f"Flushed co-occurrence for {len(dirty)} keywords: "
+                f"{written} edges written, {len(removal_rows)} removed"
+            )
+            return written
+        except Exception as e:
+            self.logger.error(f"Co-occurrence flush failed: {str(e)}", exc_info=True)
+            # Retry these keywords on the next flush
+            self._dirty.update(dirty)
+            return 0
+
+    async def seed(self) -> None:
+        """Rebuild counts from the keywords of already stored pages."""
+        try:
+            rows = await self.db_connection.execute_query(
+                """
+                MATCH (p:Page)-[r:HAS_KEYWORD]->(k:Keyword)
+                WITH p, k, r ORDER BY r.score DESC
+                WITH p, collect(k.text)[..$limit] AS keywords
+                RETURN keywords
+                """,
+                {"limit": self.config.max_keywords_per_page},
+                read_only=True
+            )
+            for row in rows or []:
+                self.add_page(row["keywords"])
+            # Seeded neighbourhoods were flushed before the restart
+            self._dirty.clear()
+            self.logger.info(
+                f"Seeded keyword co-occurrence from {self.page_count} pages "
+                f"({len(self.keyword_counts)} keywords)"
+            )
+        except Exception as e:
+            self.logger.error(f"Co-occurrence seeding failed: {str(e)}", exc_info=True)
+
+    def _compute_neighbours(self, keyword: str) -> Tuple[KeywordNeighbour, ...]:
+        pairs = self._pairs.get(keyword)
+        if not pairs or self.page_count == 0:
+            return ()
+
+        total = self.page_count
+        p_keyword = self.keyword_counts[keyword] / total
+        candidates = []
+        for other, count in pairs.items():
+            # Evicted partners can linger in a pruned pair map
+            other_count = self.keyword_counts[other]
+            if count < self.config.min_pair_count or not other_count:
+                continue
+            p_pair = count / total
+            p_other = other_count / total
+            pmi = math.log(p_pair / (p_keyword * p_other))
+            # NPMI is 1 for keywords that always co-occur
+            npmi = pmi / -math.log(p_pair) if p_pair < 1 else 1.0
+            if npmi >= self.config.min_npmi:
+                candidates.append(KeywordNeighbour(other, npmi, pmi, count))
+
+        keep = max(self.config.top_k, self.config.max_neighbours)
+        top = heapq.nlargest(keep, candidates, key=lambda n: (n.npmi, n.count))
+        return tuple(top)
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    def _increment_pair(self, pairs: Dict[str, int], other: str) -> None:
+        if other not in pairs:
+            self._pair_entries += 1
+        pairs[other] = pairs.get(other, 0) + 1
+
+    def _prune_pairs(self, keyword: str) -> None:
+        """Keep the most frequent partners once a keyword exceeds its pair cap."""
+        pairs = self._pairs.get(keyword)
+        cap = self.config.max_pairs_per_keyword
+        if pairs is None or len(pairs) <= cap:
+            return
+        # Prune to three quarters of the cap so this runs rarely
+        kept = heapq.nlargest(max(1, cap * 3 // 4), pairs.items(), key=lambda item: item[1])
+        self._pairs[keyword] = dict(kept)
+        self._pair_entries -= len(pairs) - len(kept)
+
+    def _evict_keywords(self) -> None:
+        """Drop the least frequent keywords down to 90% of max_keywords."""
+        excess = len(self.keyword_counts) - int(self.config.max_keywords * 0.9)
+        victims = heapq.nsmallest(excess, self.keyword_counts.items(), key=lambda item: item[1])
+        for keyword, _ in victims:
+            del self.keyword_counts[keyword]
+            pairs = self._pairs.pop(keyword, {})
+            self._pair_entries -= len(pairs)
+            for other in pairs:
+                other_pairs = self._pairs.get(other)
+                if other_pairs is not None and other_pairs.pop(keyword, None) is not None:
+                    self._pair_entries -= 1
+                self._neighbours.pop(other, None)
+            self._texts.pop(keyword, None)
+            self._neighbours.pop(keyword, None)
+            self._flushed.pop(keyword, None)
+            self._dirty.discard(keyword)
+
+    def _batches(self, rows: List[Dict[str, Any]]) -> Iterable[List[Dict[str, Any]]]:
+        size = max(1, self.config.flush_batch_size)
+        for start in range(0, len(rows), size):
+            yield rows[start:start + size]
+
+    async def _run_periodic_flush(self) -> None:
+        """Flush changed neighbourhoods on a fixed interval."""
+        try:
+            while True:
+                await asyncio.sleep(self.config.flush_interval)
+                await self.flush()
+        except asyncio.CancelledError:
+            self.logger.debug("Co-occurrence flush task cancelled")
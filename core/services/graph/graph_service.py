@@ -1,5 +1,7 @@
-import time
 import json
+import logging
+import math
+import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from urllib.parse import urlparse
@@ -12,9 +14,12 @@ from core.domain.content.models.site import Site
 from core.infrastructure.database.graph_operations import GraphOperationManager
 from core.infrastructure.database.transactions import Transaction
 from core.common.errors import ValidationError, ServiceError
-from core.utils.logger import get_logger
+from core.utils.logger import Fields, LogSampler, get_logger
 from core.services.base import BaseService
 
+# Per-chunk confirmations are sampled; a page can have hundreds of chunks
+_chunk_log = LogSampler(get_logger(__name__))
+
 
 class GraphService(BaseService):
     """High-level service for knowledge graph operations.
@@ -632,8 +637,6 @@ class GraphService(BaseService):
             if not page_check_result or len(page_check_result) == 0:
                 self.logger.error(f"Cannot store chunk embedding: Page {page_id} not found in database")
                 raise ValueError(f"Page {page_id} not found")
-            else:
-                self.logger.info(f"Found page {page_id}, proceeding with chunk creation")
 
             # Validate embedding vector
             if embedding is None:
@@ -644,20 +647,18 @@ class GraphService(BaseService):
                 self.logger.error(f"Cannot store empty embedding for chunk {chunk_index} of page {page_id}")
                 raise ValueError("Embedding vector cannot be empty")
             
-            # Log embedding details
-            self.logger.info(f"Storing embedding for chunk {chunk_index}/{total_chunks} of page {page_id}")
-            self.logger.debug(f"Embedding vector: length={len(embedding)}, first 5 values={embedding[:5]}")
-            self.logger.debug(f"Chunk details: start_char={start_char}, end_char={end_char}, model={model}")
-            
-            # Add diagnostic vector check
-            try:
-                import numpy as np
-                embedding_array = np.array(embedding, dtype=float)
-                norm = np.linalg.norm(embedding_array)
-                has_nans = np.isnan(embedding_array).any()
-                self.logger.debug(f"Vector norm: {norm:.6f}, contains NaNs: {has_nans}")
-            except ImportError:
-                self.logger.debug("NumPy not available for vector diagnostics")
+            # Vector diagnostics are only computed when debug logging is on
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Storing chunk embedding %s",
+                    Fields(
+                        page_id=page_id, chunk=f"{chunk_index}/{total_chunks}",
+                        start_char=start_char, end_char=end_char, model=model,
+                        length=len(embedding), head=embedding[:5],
+                        norm=f"{math.sqrt(math.fsum(v * v for v in embedding)):.6f}",
+                        has_nans=any(math.isnan(v) for v in embedding)
+                    )
+                )
             
             # Create a Chunk node and connect to Page
             query = """
@@ -683,18 +684,6 @@ class GraphService(BaseService):
                 c.chunk_index as index
             """
             
-            # Log query parameters (without the full embedding vector)
-            log_params = {
-                "page_id": page_id,
-                "chunk_index": chunk_index,
-                "total_chunks": total_chunks,
-                "start_char": start_char,
-                "end_char": end_char,
-                "model": model,
-                "embedding_length": len(embedding)
-            }
-            self.logger.debug(f"Executing query with parameters: {log_params}")
-            
             # Execute query with more detailed error handling
             try:
                 result = await self.graph_operations.connection.execute_query(
@@ -717,7 +706,10 @@ class GraphService(BaseService):
                     vector_length = result[0].get("vector_length", 0)
                     index = result[0].get("index", -1)
                     
-                    self.logger.info(f"Chunk {index} embedding stored: {stored}, vector length: {vector_length}")
+                    _chunk_log.info(
+                        "stored", "Chunk %s of page %s embedding stored: %s, vector length: %s",
+                        index, page_id, stored, vector_length
+                    )
                     
                     if not stored or vector_length == 0:
                         self.logger.warning(f"Chunk embedding may not have been stored properly!")
@@ -1270,4 +1262,454 @@ class GraphService(BaseService):
                 cause=e
             )
         
-    
\ No newline at end of file
+    
+    # Graph overview (level-of-detail)
+
+    OVERVIEW_GROUPINGS = ("domain", "keyword")
+
+    async def get_graph_version(self, tx: Optional[Transaction] = None) -> str:
+        """Cheap key that changes when pages or relationships change.
+        
+        Combines the page and relationship counts (served from the count
+        store) with the latest ``last_accessed`` and ``updated_at`` (read
+        from their indexes), so callers can validate cached overviews
+        without running the overview queries.
+        
+        Args:
+            tx: Optional transaction
+            
+        Returns:
+            Opaque version string
+        """
+        query = """
+        CALL { MATCH (p:Page) RETURN count(p) AS pages }
+        CALL { MATCH ()-[r]->() RETURN count(r) AS relationships }
+        CALL {
+            MATCH (p:Page) WHERE p.last_accessed IS NOT NULL
+            WITH p.last_accessed AS value ORDER BY value DESC LIMIT 1
+            RETURN collect(value) AS last_accessed
+        }
+        CALL {
+            MATCH (p:Page) WHERE p.updated_at IS NOT NULL
+            WITH p.updated_at AS value ORDER BY value DESC LIMIT 1
+            RETURN collect(value) AS updated_at
+        }
+        RETURN pages, relationships, last_accessed, updated_at
+        """
+        try:
+            result = await self.graph_operations.connection.execute_query(
+                query,
+                transaction=tx,
+                read_only=True
+            )
+            row = result[0] if result else {}
+            return ":".join(str(row.get(name)) for name in (
+                "pages", "relationships", "last_accessed", "updated_at"
+            ))
+        except Exception as e:
+            self.logger.error(f"Error getting graph version: {str(e)}", exc_info=True)
+            raise ServiceError(
+                message="Failed to get graph version",
+                cause=e
+            )
+
+    async def get_overview_clusters(
+        self,
+        group_by: str = "domain",
+        limit: int = 50,
+        tx: Optional[Transaction] = None
+    ) -> List[Dict[str, Any]]:
+        """Get aggregated super-nodes for a coarse graph overview.
+        
+        Args:
+            group_by: Cluster pages by "domain" or "keyword"
+            limit: Maximum number of clusters, largest first
+            tx: Optional transaction
+            
+        Returns:
+            List of dicts with ``key`` and ``size`` (page count)
+        """
+        if group_by not in self.OVERVIEW_GROUPINGS:
+            raise ValidationError(f"Unsupported overview grouping: {group_by}")
+        
+        if group_by == "domain":
+            query = """
+            MATCH (p:Page)
+            WHERE p.domain IS NOT NULL
+            RETURN p.domain AS key, count(p) AS size
+            ORDER BY size DESC, key
+            LIMIT $limit
+            """
+        else:
+            query = """
+            MATCH (p:Page)-[:HAS_KEYWORD]->(k:Keyword)
+            RETURN k.text AS key, count(p) AS size
+            ORDER BY size DESC, key
+            LIMIT $limit
+            """
+        
+        try:
+            return await self.graph_operations.connection.execute_query(
+                query,
+                {"limit": limit},
+                transaction=tx,
+                read_only=True
+            )
+        except Exception as e:
+            self.logger.error(f"Error getting overview clusters: {str(e)}", exc_info=True)
+            raise ServiceError(
+                message="Failed to get overview clusters",
+                details={"group_by": group_by, "limit": limit},
+                cause=e
+            )
+
+    async def get_cluster_edges(
+        self,
+        keys: List[str],
+        group_by: str = "domain",
+        tx: Optional[Transaction] = None
+    ) -> List[Dict[str, Any]]:
+        """Get aggregated edges between overview clusters.
+        
+        Domain clusters are linked by the page relationships that cross them;
+        keyword clusters are linked by the number of pages they share.
+        
+        Args:
+            keys: Cluster keys returned by get_overview_clusters
+            group_by: Cluster pages by "domain" or "keyword"
+            tx: Optional transaction
+            
+        Returns:
+            List of dicts with ``source``, ``target``, ``type`` and ``weight``
+        """
+        if group_by not in self.OVERVIEW_GROUPINGS:
+            raise ValidationError(f"Unsupported overview grouping: {group_by}")
+        if not keys:
+            return []
+        
+        if group_by == "domain":
+            query = """
+            MATCH (a:Page)-[r]->(b:Page)
+            WHERE a.domain IN $keys AND b.domain IN $keys AND a.domain <> b.domain
+            RETURN a.domain AS source, b.domain AS target, type(r) AS type, count(r) AS weight
+            ORDER BY source, target, type
+            """
+        else:
+            query = """
+            MATCH (k1:Keyword)<-[:HAS_KEYWORD]-(p:Page)-[:HAS_KEYWORD]->(k2:Keyword)
+            WHERE k1.text IN $keys AND k2.text IN $keys AND k1.text < k2.text
+            RETURN k1.text AS source, k2.text AS target, 'CO_OCCURS' AS type, count(p) AS weight
+            ORDER BY source, target
+            """
+        
+        try:
+            return await self.graph_operations.connection.execute_query(
+                query,
+                {"keys": keys},
+                transaction=tx,
+                read_only=True
+            )
+        except Exception as e:
+            self.logger.error(f"Error getting cluster edges: {str(e)}", exc_info=True)
+            raise ServiceError(
+                message="Failed to get cluster edges",
+                details={"group_by": group_by, "cluster_count": len(keys)},
+                cause=e
+            )
+
+    async def get_overview_pages(
+        self,
+        group_by: Optional[str] = None,
+        cluster: Optional[str] = None,
+        after_url: Optional[str] = None,
+        limit: int = 100,
+        tx: Optional[Transaction] = None
+    ) -> List[Dict[str, Any]]:
+        """Get page nodes for a fine-grained overview.
+        
+        Pages are ordered by URL and paged with a keyset cursor so that
+        results are deterministic and can be loaded incrementally.
+        
+        Args:
+            group_by: Optional grouping the cluster filter refers to
+            cluster: Optional domain or keyword to restrict pages to
+            after_url: Return pages with URLs after this cursor
+            limit: Maximum number of pages
+            tx: Optional transaction
+            
+        Returns:
+            List of page dicts (id, url, domain, title, last_active)
+        """
+        if cluster and group_by == "keyword":
+            match = "MATCH (p:Page)-[:HAS_KEYWORD]->(:Keyword {text: $cluster})"
+        elif cluster:
+            match = "MATCH (p:Page {domain: $cluster})"
+        else:
+            match = "MATCH (p:Page)"
+        
+        query = f"""
+        {match}
+        WHERE $after_url IS NULL OR p.url > $after_url
+        RETURN
+            p.id AS id,
+            p.url AS url,
+            p.domain AS domain,
+            p.title AS title,
+            p.last_active AS last_active
+        ORDER BY p.url
+        LIMIT $limit
+        """
+        
+        try:
+            return await self.graph_operations.connection.execute_query(
+                query,
+                {"cluster": cluster, "after_url": after_url, "limit": limit},
+                transaction=tx,
+                read_only=True
+            )
+        except Exception as e:
+            self.logger.error(f"Error getting overview pages: {str(e)}", exc_info=True)
+            raise ServiceError(
+                message="Failed to get overview pages",
+                details={"cluster": cluster, "after_url": after_url},
+                cause=e
+            )
+
+    async def get_page_edges(
+        self,
+        source_urls: List[str],
+        target_urls: List[str],
+        limit: int = 1000,
+        tx: Optional[Transaction] = None
+    ) -> List[Dict[str, Any]]:
+        """Get relationships between two sets of pages, in either direction.
+        
+        Each source page is looked up through the url constraint and only its
+        own relationships are expanded, so the cost follows the pages
+        requested rather than the size of the graph.
+        
+        Args:
+            source_urls: URLs on one side of the relationship
+            target_urls: URLs on the other side
+            limit: Maximum number of edges
+            tx: Optional transaction
+            
+        Returns:
+            List of dicts with source/target id and url, type, score and properties
+        """
+        if not source_urls or not target_urls:
+            return []
+        
+        query = """
+        UNWIND $sources AS url
+        MATCH (:Page {url: url})-[r]-(other:Page)
+        WHERE other.url IN $targets
+        WITH DISTINCT r
+        WITH r, startNode(r) AS p1, endNode(r) AS p2
+        RETURN
+            p1.id AS source_id,
+            p1.url AS source_url,
+            p2.id AS target_id,
+            p2.url AS target_url,
+            type(r) AS rel_type,
+            r.score AS score,
+            properties(r) AS properties
+        ORDER BY source_url, target_url, rel_type
+        LIMIT $limit
+        """
+        
+        try:
+            return await self.graph_operations.connection.execute_query(
+                query,
+                {"sources": source_urls, "targets": target_urls, "limit": limit},
+                transaction=tx,
+                read_only=True
+            )
+        except Exception as e:
+            self.logger.error(f"Error getting page edges: {str(e)}", exc_info=True)
+            raise ServiceError(
+                message="Failed to get page edges",
+                details={"source_count": len(source_urls), "target_count": len(target_urls)},
+                cause=e
+            )
+
+    # Retrieval
+
+    # Lucene query syntax characters escaped before full-text search
+    _FULLTEXT_SPECIAL_CHARS = set('+-&|!(){}[]^"~*?:\\/')
+
+    def _escape_fulltext_query(self, query: str) -> str:
+        """Escape Lucene operators so free-form questions are searched as terms."""
+        return "".join(
+            f"\\{char}" if char in self._FULLTEXT_SPECIAL_CHARS else char
+            for char in query
+        )
+
+    async def fulltext_search_pages(
+        self,
+        query: str,
+        limit: int = 20,
+        index_name: str = "page_fulltext",
+        tx: Optional[Transaction] = None
+    ) -> List[Dict[str, Any]]:
+        """Search pages with the BM25-scored full-text index.
+        
+        Args:
+            query: Free-form search text
+            limit: Maximum number of results
+            index_name: Name of the full-text index over Page title/content
+            tx: Optional transaction
+            
+        Returns:
+            List of dicts with id, url, title and score, best first
+        """
+        escaped = self._escape_fulltext_query(query).strip()
+        if not escaped:
+            return []
+        
+        cypher = """
+        CALL db.index.fulltext.queryNodes($index_name, $query, {limit: $limit})
+        YIELD node, score
+        RETURN node.id AS id, node.url AS url, node.title AS title, score
+        """
+        
+        try:
+            return await self.graph_operations.connection.execute_query(
+                cypher,
+                {"index_name": index_name, "query": escaped, "limit": limit},
+                transaction=tx,
+                read_only=True
+            )
+        except Exception as e:
+            self.logger.error(f"Error in full-text page search: {str(e)}", exc_info=True)
+            raise ServiceError(
+                message="Full-text page search failed",
+                details={"index_name": index_name, "limit": limit},
+                cause=e
+            )
+
+    async def vector_search_pages(
+        self,
+        embedding: List[float],
+        limit: int = 20,
+        index_name: str = "page_content_embedding_index",
+        tx: Optional[Transaction] = None
+    ) -> List[Dict[str, Any]]:
+        """Search pages with an approximate nearest-neighbour vector index.
+        
+        Args:
+            embedding: Query embedding vector
+            limit: Maximum number of results
+            index_name: Name of the Page vector index to query
+            tx: Optional transaction
+            
+        Returns:
+            List of dicts with id, url, title and similarity, best first
+        """
+        cypher = """
+        CALL db.index.vector.queryNodes($index_name, $limit, $embedding)
+        YIELD node, score
+        RETURN node.id AS id, node.url AS url, node.title AS title, score AS similarity
+        """
+        
+        try:
+            return await self.graph_operations.connection.execute_query(
+                cypher,
+                {"index_name": index_name, "limit": limit, "embedding": embedding},
+                transaction=tx,
+                read_only=True
+            )
+        except Exception as e:
+            self.logger.error(f"Error in vector page search: {str(e)}", exc_info=True)
+            raise ServiceError(
+                message="Vector page search failed",
+                details={"index_name": index_name, "limit": limit},
+                cause=e
+            )
+
+    async def vector_search_chunks(
+        self,
+        embedding: List[float],
+        limit: int = 20,
+        index_name: str = "chunk_embedding_index",
+        tx: Optional[Transaction] = None
+    ) -> List[Dict[str, Any]]:
+        """Search content chunks with the chunk vector index.
+        
+        Args:
+            embedding: Query embedding vector
+            limit: Maximum number of chunks
+            index_name: Name of the Chunk vector index to query
+            tx: Optional transaction
+            
+        Returns:
+            List of dicts with page id/url/title, chunk offsets and similarity
+        """
+        cypher = """
+        CALL db.index.vector.queryNodes($index_name, $limit, $embedding)
+        YIELD node, score
+        MATCH (p:Page {id: node.page_id})
+        RETURN
+            p.id AS id,
+            p.url AS url,
+            p.title AS title,
+            node.chunk_index AS chunk_index,
+            node.start_char AS start_char,
+            node.end_char AS end_char,
+            score AS similarity
+        """
+        
+        try:
+            return await self.graph_operations.connection.execute_query(
+                cypher,
+                {"index_name": index_name, "limit": limit, "embedding": embedding},
+                transaction=tx,
+                read_only=True
+            )
+        except Exception as e:
+            self.logger.error(f"Error in vector chunk search: {str(e)}", exc_info=True)
+            raise ServiceError(
+                message="Vector chunk search failed",
+                details={"index_name": index_name, "limit": limit},
+                cause=e
+            )
+
+    async def get_pages_content(
+        self,
+        page_ids: Optional[List[str]] = None,
+        urls: Optional[List[str]] = None,
+        tx: Optional[Transaction] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch id, url, title and content for several pages in one query.
+        
+        Args:
+            page_ids: Page ids to fetch
+            urls: Page URLs to fetch
+            tx: Optional transaction
+            
+        Returns:
+            List of page dicts; missing pages are simply absent
+        """
+        if not page_ids and not urls:
+            return []
+        
+        cypher = """
+        MATCH (p:Page)
+        WHERE p.id IN $page_ids OR p.url IN $urls
+        RETURN p.id AS id, p.url AS url, p.title AS title, p.content AS content
+        """
+        
+        try:
+            return await self.graph_operations.connection.execute_query(
+                cypher,
+                {"page_ids": page_ids or [], "urls": urls or []},
+                transaction=tx,
+                read_only=True
+            )
+        except Exception as e:
+            self.logger.error(f"Error fetching page content: {str(e)}", exc_info=True)
+            raise ServiceError(
+                message="Failed to fetch page content",
+                details={"page_count": len(page_ids or []) + len(urls or [])},
+                cause=e
+            )
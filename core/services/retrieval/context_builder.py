@@ -0,0 +1,236 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from core.llm.common.utils import estimate_tokens, get_model_context_length
+from core.utils.logger import get_logger
+
+
+@dataclass
+class ContextConfig:
+    """Configuration for token-budgeted context assembly.
+
+    Attributes:
+        context_fraction: Share of the model context window given to sources
+        max_context_tokens: Hard cap on source tokens regardless of model size
+        min_context_tokens: Floor so small-context models still get some context
+        chunk_size: Characters per chunk when a page has no stored chunk offsets
+        chunk_overlap: Overlap between generated chunks
+        redundancy_threshold: Shingle overlap above which a chunk is dropped
+        shingle_size: Words per shingle used for redundancy detection
+    """
+    context_fraction: float = 0.25
+    max_context_tokens: int = 6000
+    min_context_tokens: int = 512
+    chunk_size: int = 1000
+    chunk_overlap: int = 200
+    redundancy_threshold: float = 0.7
+    shingle_size: int = 3
+
+
+@dataclass
+class ContextChunk:
+    """A scored span of a source page."""
+    url: str
+    title: str
+    text: str
+    start_char: int
+    end_char: int
+    score: float
+    tokens: int = 0
+
+
+@dataclass
+class BuiltContext:
+    """Assembled prompt context and its token accounting."""
+    text: str
+    tokens_used: int
+    token_budget: int
+    chunks: List[ContextChunk] = field(default_factory=list)
+    dropped_redundant: int = 0
+    dropped_budget: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tokens_used": self.tokens_used,
+            "token_budget": self.token_budget,
+            "chunks_used": len(self.chunks),
+            "sources_used": len({chunk.url for chunk in self.chunks}),
+            "dropped_redundant": self.dropped_redundant,
+            "dropped_budget": self.dropped_budget
+        }
+
+
+class ContextBuilder:
+    """Select the best source chunks that fit a per-model token budget.
+
+    Pages that carry chunk hits from retrieval are cut at the stored chunk
+    offsets and ranked by chunk similarity; other pages are split into
+    overlapping windows ranked by query term overlap. Chunks are taken
+    greedily by score, skipping near-duplicates, until the budget is full,
+    then emitted grouped by source in document order.
+    """
+
+    _WORD_RE = re.compile(r"\w+")
+
+    def __init__(self, config: Optional[ContextConfig] = None):
+        self.config = config or ContextConfig()
+        self.logger = get_logger(__name__)
+
+    def token_budget(self, provider_type: str, model_id: Optional[str], reserved_tokens: int = 0) -> int:
+        """Compute the source token budget for a model.
+
+        Args:
+            provider_type: Provider type value (e.g. "anthropic")
+            model_id: Model identifier
+            reserved_tokens: Tokens needed for the question, system prompt and output
+
+        Returns:
+            Number of tokens available for source context
+        """
+        context_length = get_model_context_length(provider_type, model_id)
+        budget = min(
+            int(context_length * self.config.context_fraction),
+            context_length - reserved_tokens,
+            self.config.max_context_tokens
+        )
+        return max(budget, min(self.config.min_context_tokens, context_length - reserved_tokens), 0)
+
+    def build(self, query: str, content: List[Dict[str, Any]], token_budget: int) -> BuiltContext:
+        """Assemble context text from retrieved content items.
+
+        Args:
+            query: User query used to rank chunks without stored similarity
+            content: Items with url, title, content, relevance and optional chunks
+            token_budget: Maximum number of tokens of source context
+
+        Returns:
+            BuiltContext with the formatted text and token usage
+        """
+        query_terms = self._terms(query)
+        candidates: List[ContextChunk] = []
+        for item in content:
+            candidates.extend(self._candidate_chunks(item, query_terms))
+        candidates.sort(key=lambda chunk: chunk.score, reverse=True)
+
+        selected: List[ContextChunk] = []
+        selected_shingles: List[Set[Tuple[str, ...]]] = []
+        # Per-source header tokens are charged when a source is first used
+        used_sources: Set[str] = set()
+        tokens_used = 0
+        dropped_redundant = 0
+        dropped_budget = 0
+
+        for chunk in candidates:
+            shingles = self._shingles(chunk.text)
+            if self._is_redundant(shingles, selected_shingles):
+                dropped_redundant += 1
+                continue
+
+            cost = chunk.tokens
+            if chunk.url not in used_sources:
+                cost += estimate_tokens(self._source_header(chunk))
+            if tokens_used + cost > token_budget:
+                dropped_budget += 1
+                continue
+
+            selected.append(chunk)
+            selected_shingles.append(shingles)
+            used_sources.add(chunk.url)
+            tokens_used += cost
+
+        built = BuiltContext(
+            text=self._format(selected),
+            tokens_used=tokens_used,
+            token_budget=token_budget,
+            chunks=selected,
+            dropped_redundant=dropped_redundant,
+            dropped_budget=dropped_budget
+        )
+        self.logger.debug(
+            f"Built context: {tokens_used}/{token_budget} tokens from {len(selected)} chunks "
+            f"({dropped_redundant} redundant, {dropped_budget} over budget)"
+        )
+        return built
+
+    def _candidate_chunks(self, item: Dict[str, Any], query_terms: Set[str]) -> List[ContextChunk]:
+        text = item.get("content") or ""
+        if not text:
+            return []
+        url = item.get("url", "")
+        title = item.get("title") or url
+        relevance = float(item.get("relevance") or 0.0)
+
+        spans: List[Tuple[int, int, Optional[float]]] = [
+            (chunk["start_char"], chunk["end_char"], chunk.get("similarity"))
+            for chunk in item.get("chunks") or []
+            if chunk.get("start_char") is not None and chunk.get("end_char") is not None
+        ]
+        if not spans:
+            step = max(1, self.config.chunk_size - self.config.chunk_overlap)
+            spans = [
+                (start, min(start + self.config.chunk_size, len(text)), None)
+                for start in range(0, len(text), step)
+            ]
+
+        chunks = []
+        for start, end, similarity in spans:
+            chunk_text = text[start:end].strip()
+            if not chunk_text:
+                continue
+            if similarity is None:
+                similarity = self._term_overlap(chunk_text, query_terms)
+            chunks.append(ContextChunk(
+                url=url,
+                title=title,
+                text=chunk_text,
+                start_char=start,
+                end_char=end,
+                # Page relevance breaks ties between equally similar chunks
+                score=float(similarity) + 0.1 * relevance,
+                tokens=estimate_tokens(chunk_text)
+            ))
+        return chunks
+
+    def _terms(self, text: str) -> Set[str]:
+        return {word for word in self._WORD_RE.findall(text.lower()) if len(word) > 2}
+
+    def _term_overlap(self, text: str, query_terms: Set[str]) -> float:
+        if not query_terms:
+            return 0.0
+        return len(query_terms & self._terms(text)) / len(query_terms)
+
+    def _shingles(self, text: str) -> Set[Tuple[str, ...]]:
+        words = self._WORD_RE.findall(text.lower())
+        size = self.config.shingle_size
+        if len(words) < size:
+            return {tuple(words)} if words else set()
+        return {tuple(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+    def _is_redundant(
+        self,
+        shingles: Set[Tuple[str, ...]],
+        selected: List[Set[Tuple[str, ...]]]
+    ) -> bool:
+        """A chunk is redundant if most of it already appears in one selected chunk."""
+        if not shingles:
+            return True
+        for other in selected:
+            if len(shingles & other) / len(shingles) >= self.config.redundancy_threshold:
+                return True
+        return False
+
+    def _source_header(self, chunk: ContextChunk) -> str:
+        return f"Source: {chunk.url}\nTitle: {chunk.title}\nContent: "
+
+    def _format(self, chunks: List[ContextChunk]) -> str:
+        by_source: Dict[str, List[ContextChunk]] = {}
+        for chunk in chunks:
+            by_source.setdefault(chunk.url, []).append(chunk)
+
+        sections = []
+        for source_chunks in by_source.values():
+            source_chunks.sort(key=lambda chunk: chunk.start_char)
+            body = "\n...\n".join(chunk.text for chunk in source_chunks)
+            sections.append(self._source_header(source_chunks[0]) + body)
+        return "\n\n".join(sections)
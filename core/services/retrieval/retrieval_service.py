@@ -0,0 +1,226 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, List, Optional
+
+from core.services.base import BaseService
+from core.services.graph.graph_service import GraphService
+from core.services.embeddings.embedding_service import EmbeddingService
+from core.utils.logger import get_logger
+
+
+@dataclass
+class RetrievalConfig:
+    """Configuration for hybrid retrieval.
+
+    Attributes:
+        rrf_k: Reciprocal-rank fusion constant (higher flattens rank weights)
+        per_source_limit: Candidates requested from each search source
+        max_results: Number of fused pages returned
+        latency_budget: Seconds allowed for all sources; late sources are dropped
+        fulltext_index: Full-text index over Page title/content
+        page_vector_index: Vector index over page content embeddings
+        chunk_vector_index: Vector index over chunk embeddings
+        max_chunks_per_page: Chunk hits kept per fused page
+    """
+    rrf_k: int = 60
+    per_source_limit: int = 20
+    max_results: int = 5
+    latency_budget: float = 1.5
+    fulltext_index: str = "page_fulltext"
+    page_vector_index: str = "page_content_embedding_index"
+    chunk_vector_index: str = "chunk_embedding_index"
+    max_chunks_per_page: int = 3
+
+
+@dataclass
+class RetrievedPage:
+    """A page ranked by reciprocal-rank fusion."""
+    page_id: str
+    url: str
+    title: Optional[str] = None
+    score: float = 0.0
+    ranks: Dict[str, int] = field(default_factory=dict)
+    chunks: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class RetrievalResult:
+    """Fused retrieval output with per-source timing."""
+    pages: List[RetrievedPage]
+    latencies: Dict[str, float] = field(default_factory=dict)
+    timed_out: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    total_latency: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "latencies": self.latencies,
+            "timed_out": self.timed_out,
+            "failed": self.failed,
+            "total_latency": self.total_latency,
+            "result_count": len(self.pages)
+        }
+
+
+class HybridRetrievalService(BaseService):
+    """Hybrid full-text + vector retrieval with reciprocal-rank fusion.
+
+    BM25 full-text search, page-level vector search and chunk-level vector
+    search run concurrently; whatever finishes within the latency budget is
+    fused with RRF and deduplicated per page. Vector sources are skipped
+    when no embedding service is available.
+    """
+
+    SOURCE_FULLTEXT = "fulltext"
+    SOURCE_PAGE_VECTOR = "page_vector"
+    SOURCE_CHUNK_VECTOR = "chunk_vector"
+
+    def __init__(
+        self,
+        graph_service: GraphService,
+        embedding_service: Optional[EmbeddingService] = None,
+        config: Optional[RetrievalConfig] = None
+    ):
+        super().__init__()
+        self.graph_service = graph_service
+        self.embedding_service = embedding_service
+        self.config = config or RetrievalConfig()
+        self.logger = get_logger(__name__)
+
+    async def retrieve(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        latency_budget: Optional[float] = None
+    ) -> RetrievalResult:
+        """Retrieve the most relevant pages for a query.
+
+        Args:
+            query: Free-form user query
+            limit: Number of pages to return (defaults to config.max_results)
+            latency_budget: Override for the configured latency budget in seconds
+
+        Returns:
+            RetrievalResult with fused pages and per-source latencies
+        """
+        limit = limit or self.config.max_results
+        budget = latency_budget if latency_budget is not None else self.config.latency_budget
+        started = time.perf_counter()
+        latencies: Dict[str, float] = {}
+
+        async def timed(name: str, operation: Awaitable[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+            source_start = time.perf_counter()
+            try:
+                return await operation
+            finally:
+                latencies[name] = round(time.perf_counter() - source_start, 4)
+
+        tasks: Dict[str, asyncio.Task] = {
+            self.SOURCE_FULLTEXT: asyncio.create_task(timed(
+                self.SOURCE_FULLTEXT,
+                self.graph_service.fulltext_search_pages(
+                    query,
+                    limit=self.config.per_source_limit,
+                    index_name=self.config.fulltext_index
+                )
+            ))
+        }
+
+        embedding_task: Optional[asyncio.Task] = None
+        if self.embedding_service is not None:
+            embedding_task = asyncio.create_task(timed("embedding", self._embed(query)))
+            tasks[self.SOURCE_PAGE_VECTOR] = asyncio.create_task(timed(
+                self.SOURCE_PAGE_VECTOR,
+                self._after_embedding(embedding_task, self._page_vector_search)
+            ))
+            tasks[self.SOURCE_CHUNK_VECTOR] = asyncio.create_task(timed(
+                self.SOURCE_CHUNK_VECTOR,
+                self._after_embedding(embedding_task, self._chunk_vector_search)
+            ))
+
+        done, pending = await asyncio.wait(tasks.values(), timeout=budget)
+        for task in pending:
+            task.cancel()
+        if embedding_task is not None and not embedding_task.done():
+            embedding_task.cancel()
+
+        result = RetrievalResult(pages=[])
+        ranked_lists: Dict[str, List[Dict[str, Any]]] = {}
+        for name, task in tasks.items():
+            if task in pending:
+                result.timed_out.append(name)
+                latencies[name] = budget
+            elif task.exception() is not None:
+                self.logger.warning(f"Retrieval source {name} failed: {task.exception()}")
+                result.failed.append(name)
+            else:
+                ranked_lists[name] = task.result()
+
+        result.pages = self._fuse(ranked_lists)[:limit]
+        result.latencies = dict(latencies)
+        result.total_latency = round(time.perf_counter() - started, 4)
+
+        self.logger.info(
+            f"Hybrid retrieval returned {len(result.pages)} pages in {result.total_latency}s",
+            extra={"latencies": latencies, "timed_out": result.timed_out, "failed": result.failed}
+        )
+        return result
+
+    def _fuse(self, ranked_lists: Dict[str, List[Dict[str, Any]]]) -> List[RetrievedPage]:
+        """Combine ranked lists with reciprocal-rank fusion, one entry per page.
+
+        Each page contributes at most once per source (its best rank), so
+        several matching chunks of one page don't outvote other pages.
+        """
+        fused: Dict[str, RetrievedPage] = {}
+        for source, items in ranked_lists.items():
+            for rank, item in enumerate(items, start=1):
+                key = item.get("id") or item.get("url")
+                if not key:
+                    continue
+                page = fused.get(key)
+                if page is None:
+                    page = RetrievedPage(page_id=item.get("id"), url=item.get("url"), title=item.get("title"))
+                    fused[key] = page
+
+                if source == self.SOURCE_CHUNK_VECTOR and len(page.chunks) < self.config.max_chunks_per_page:
+                    page.chunks.append({
+                        "chunk_index": item.get("chunk_index"),
+                        "start_char": item.get("start_char"),
+                        "end_char": item.get("end_char"),
+                        "similarity": item.get("similarity")
+                    })
+
+                if source not in page.ranks:
+                    page.ranks[source] = rank
+                    page.score += 1.0 / (self.config.rrf_k + rank)
+
+        return sorted(fused.values(), key=lambda page: page.score, reverse=True)
+
+    async def _embed(self, query: str) -> Optional[List[float]]:
+        embedding = await self.embedding_service.get_embedding(query)
+        # EmbeddingService returns a zero vector on provider failure
+        if not embedding or not any(embedding.vector):
+            return None
+        return embedding.vector
+
+    async def _after_embedding(self, embedding_task: asyncio.Task, search) -> List[Dict[str, Any]]:
+        vector = await asyncio.shield(embedding_task)
+        if vector is None:
+            return []
+        return await search(vector)
+
+    async def _page_vector_search(self, vector: List[float]) -> List[Dict[str, Any]]:
+        return await self.graph_service.vector_search_pages(
+            vector,
+            limit=self.config.per_source_limit,
+            index_name=self.config.page_vector_index
+        )
+
+    async def _chunk_vector_search(self, vector: List[float]) -> List[Dict[str, Any]]:
+        return await self.graph_service.vector_search_chunks(
+            vector,
+            limit=self.config.per_source_limit,
+            index_name=self.config.chunk_vector_index
+        )
@@ -0,0 +1,297 @@
+import asyncio
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Optional
+
+from core.domain.content.models.page import Page
+from core.infrastructure.database.db_connection import DatabaseConnection
+from core.services.base import BaseService
+from core.utils.logger import get_logger
+
+
+@dataclass
+class StatsBucket:
+    """Capture counters accumulated for a single day."""
+    captures: int = 0
+    domains: Counter = field(default_factory=Counter)
+    contexts: Counter = field(default_factory=Counter)
+
+
+class StatsService(BaseService):
+    """Incrementally maintained system statistics.
+
+    Totals are updated in memory as pages, relationships and agent tasks are
+    written, and captures are rolled up into per-day buckets, so date-range
+    requests can be answered without scanning the graph. Relationship and
+    query totals are not date-filtered. A background task periodically
+    reconciles page and relationship totals with Neo4j's count store and
+    rebuilds the capture rollups, correcting any drift (e.g. writes made
+    outside the pipeline).
+
+    Agent tasks only live in memory, so the query total is the graph's QUERY
+    task count plus the agent tasks recorded since startup.
+    """
+
+    def __init__(
+        self,
+        db_connection: DatabaseConnection,
+        reconcile_interval: int = 300,
+        top_n: int = 10
+    ):
+        super().__init__()
+        self.db_connection = db_connection
+        self.reconcile_interval = reconcile_interval
+        self.top_n = top_n
+        self.logger = get_logger(__name__)
+
+        self.captures: int = 0
+        self.relationships: int = 0
+        self.queries: int = 0
+        self._recorded_queries: int = 0
+        self.domains: Counter = Counter()
+        self.contexts: Counter = Counter()
+        self.relationship_types: Counter = Counter()
+        self.buckets: Dict[date, StatsBucket] = defaultdict(StatsBucket)
+
+        self.last_updated: Optional[datetime] = None
+        self.last_reconciled: Optional[datetime] = None
+        self._reconcile_task: Optional[asyncio.Task] = None
+
+    async def initialize(self) -> None:
+        """Seed counters from the database and start periodic reconciliation."""
+        await super().initialize()
+        await self.reconcile()
+        if self.reconcile_interval > 0 and not self._reconcile_task:
+            self._reconcile_task = asyncio.create_task(self._run_periodic_reconcile())
+
+    async def cleanup(self) -> None:
+        """Stop the reconciliation task."""
+        if self._reconcile_task:
+            self._reconcile_task.cancel()
+            try:
+                await self._reconcile_task
+            except asyncio.CancelledError:
+                pass
+            self._reconcile_task = None
+        await super().cleanup()
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether counters have been seeded at least once."""
+        return self.last_reconciled is not None
+
+    def record_page_captured(
+        self,
+        domain: Optional[str],
+        browser_contexts: Iterable[str] = (),
+        when: Optional[datetime] = None
+    ) -> None:
+        """Record a newly stored page.
+
+        Args:
+            domain: Domain of the page
+            browser_contexts: Browser context values of the page
+            when: Capture time (defaults to now)
+        """
+        bucket = self.buckets[(when or datetime.now()).date()]
+        self.captures += 1
+        bucket.captures += 1
+        if domain:
+            self.domains[domain] += 1
+            bucket.domains[domain] += 1
+        for context in browser_contexts:
+            self.contexts[context] += 1
+            bucket.contexts[context] += 1
+        self._touch()
+
+    def record_page_stored(self, page: Page, keywords_stored: int) -> None:
+        """Storage hook: count a new page and its HAS_KEYWORD relationships.
+
+        Args:
+            page: The newly stored page
+            keywords_stored: Number of keywords linked to the page
+        """
+        self.record_page_captured(page.domain, [ctx.value for ctx in page.browser_contexts])
+        self.record_relationships("HAS_KEYWORD", keywords_stored)
+
+    def record_relationships(
+        self,
+        rel_type: str,
+        count: int = 1
+    ) -> None:
+        """Record newly created relationships of a given type.
+
+        Args:
+            rel_type: Relationship type name
+            count: Number of relationships created
+        """
+        if count <= 0:
+            return
+        self.relationships += count
+        self.relationship_types[rel_type] += count
+        self._touch()
+
+    def record_query(self, task_data: Optional[Dict[str, Any]] = None) -> None:
+        """Task hook: count a newly created agent query.
+
+        Args:
+            task_data: Data of the created task (unused)
+        """
+        self.queries += 1
+        self._recorded_queries += 1
+        self._touch()
+
+    def get_stats(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        detailed: bool = False
+    ) -> Dict[str, Any]:
+        """Return current statistics.
+
+        Date ranges filter captures and their breakdowns at day granularity
+        from the rollup buckets; relationships and queries are always totals.
+
+        Args:
+            start_date: Optional inclusive start of the range
+            end_date: Optional inclusive end of the range
+            detailed: Whether to include per-domain/context/type breakdowns
+
+        Returns:
+            Dictionary with captures, relationships, queries and optional details
+        """
+        stats = {
+            "captures": self.captures,
+            "relationships": self.relationships,
+            "queries": self.queries
+        }
+        domains, contexts = self.domains, self.contexts
+        if start_date is not None or end_date is not None:
+            start_day = start_date.date() if start_date else date.min
+            end_day = end_date.date() if end_date else date.max
+            stats["captures"] = 0
+            domains, contexts = Counter(), Counter()
+            for day, bucket in self.buckets.items():
+                if start_day <= day <= end_day:
+                    stats["captures"] += bucket.captures
+                    domains.update(bucket.domains)
+                    contexts.update(bucket.contexts)
+
+        if detailed:
+            stats["details"] = {
+                "top_domains": [
+                    {"domain": domain, "count": count}
+                    for domain, count in domains.most_common(self.top_n)
+                ],
+                "context_distribution": [
+                    {"context": context, "count": count}
+                    for context, count in contexts.items()
+                ],
+                "relationship_types": [
+                    {"type": rel_type, "count": count}
+                    for rel_type, count in self.relationship_types.most_common()
+                ]
+            }
+
+        stats["last_updated"] = (self.last_updated or datetime.now()).isoformat()
+        stats["last_reconciled"] = (
+            self.last_reconciled.isoformat() if self.last_reconciled else None
+        )
+        return stats
+
+    async def reconcile(self) -> None:
+        """Refresh totals and capture rollups from Neo4j.
+
+        Page and relationship totals come from count-store backed queries
+        (label-only / type-only counts), which Neo4j answers without scanning.
+        The domain, context and daily breakdowns need one aggregation pass
+        over the pages, which runs at the reconcile interval.
+        """
+        try:
+            captures = await self._count("MATCH (p:Page) RETURN count(p) AS count")
+            relationships = await self._count("MATCH ()-[r]->() RETURN count(r) AS count")
+            queries = await self._count(
+                "MATCH (t:Task) WHERE t.type = 'QUERY' RETURN count(t) AS count"
+            )
+
+            rel_types: Counter = Counter()
+            type_rows = await self.db_connection.execute_query(
+                "CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType",
+                read_only=True
+            )
+            for row in type_rows or []:
+                rel_type = row["relationshipType"]
+                # Single-type counts are served from the count store
+                rel_types[rel_type] = await self._count(
+                    f"MATCH ()-[r:`{rel_type}`]->() RETURN count(r) AS count"
+                )
+
+            self.captures = captures
+            self.relationships = relationships
+            self.queries = queries + self._recorded_queries
+            self.relationship_types = Counter({k: v for k, v in rel_types.items() if v})
+
+            await self._seed_buckets()
+
+            self.last_reconciled = datetime.now()
+            self._touch()
+            self.logger.debug(
+                f"Stats reconciled: {captures} pages, {relationships} relationships"
+            )
+        except Exception as e:
+            self.logger.error(f"Stats reconciliation failed: {str(e)}", exc_info=True)
+
+    async def _seed_buckets(self) -> None:
+        """Rebuild day buckets and breakdowns with a single aggregation pass."""
+        rows = await self.db_connection.execute_query(
+            """
+            MATCH (p:Page)
+            WITH p, coalesce(p.discovered_at, p.created_at) AS ts
+            RETURN
+                CASE WHEN ts IS NULL THEN null ELSE toString(date(datetime(ts))) END AS day,
+                p.domain AS domain,
+                coalesce(p.browser_contexts, []) AS contexts,
+                count(p) AS count
+            """,
+            read_only=True
+        )
+
+        buckets: Dict[date, StatsBucket] = defaultdict(StatsBucket)
+        domains: Counter = Counter()
+        contexts: Counter = Counter()
+        for row in rows or []:
+            count = row["count"]
+            if row["domain"]:
+                domains[row["domain"]] += count
+            for context in row["contexts"]:
+                contexts[context] += count
+            if not row["day"]:
+                continue
+            bucket = buckets[date.fromisoformat(row["day"])]
+            bucket.captures += count
+            if row["domain"]:
+                bucket.domains[row["domain"]] += count
+            for context in row["contexts"]:
+                bucket.contexts[context] += count
+
+        self.buckets = buckets
+        self.domains = domains
+        self.contexts = contexts
+
+    async def _count(self, query: str) -> int:
+        """Run a single-value count query."""
+        result = await self.db_connection.execute_query(query, read_only=True)
+        return result[0]["count"] if result else 0
+
+    async def _run_periodic_reconcile(self) -> None:
+        """Reconcile counters on a fixed interval."""
+        try:
+            while True:
+                await asyncio.sleep(self.reconcile_interval)
+                await self.reconcile()
+        except asyncio.CancelledError:
+            self.logger.debug("Stats reconciliation task cancelled")
+
+    def _touch(self) -> None:
+        self.last_updated = datetime.now()
@@ -60,6 +60,10 @@ def load_config() -> AppConfig:
         # Rate Limiting
         rate_limit_requests=int(os.getenv('RATE_LIMIT_REQUESTS', '100')),
         rate_limit_window_seconds=int(os.getenv('RATE_LIMIT_WINDOW_SECONDS', '3600')),
+        rate_limit_enabled=os.getenv('RATE_LIMIT_ENABLED', 'True').lower() in ('true', '1', 't'),
+        rate_limit_routes=os.getenv('RATE_LIMIT_ROUTES', ''),
+        rate_limit_tokens=os.getenv('RATE_LIMIT_TOKENS', ''),
+        rate_limit_sqlite_path=os.getenv('RATE_LIMIT_SQLITE_PATH') or None,
     )
     
     return config
@@ -35,6 +35,13 @@ class BaseConfig:
     # Rate limiting
     rate_limit_requests: int = 100
     rate_limit_window_seconds: int = 3600
+    rate_limit_enabled: bool = True
+    # Comma-separated "path_prefix=requests/seconds" overrides
+    rate_limit_routes: str = ""
+    # Comma-separated "token=requests/seconds" overrides
+    rate_limit_tokens: str = ""
+    # Share buckets between worker processes through this SQLite file
+    rate_limit_sqlite_path: Optional[str] = None
     
     # Other shared settings
     enable_metadata_comparison: bool = False
@@ -1,5 +1,9 @@
 import logging
-from typing import Optional
+import logging.handlers
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
 from core.utils.config import load_config
 
 # Load configuration once at module level
@@ -45,4 +49,135 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
         handler.setLevel(log_level)
         logger.addHandler(handler)
     
-    return logger
\ No newline at end of file
+    return logger
+
+class Lazy:
+    """Defer an expensive log argument until a handler formats the record.
+
+    Use with %-style arguments so nothing is computed when the level is
+    disabled: ``logger.debug("Keywords: %s", Lazy(lambda: [k.text for k in kws]))``
+    """
+
+    __slots__ = ("_factory",)
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+
+    def __str__(self) -> str:
+        return str(self._factory())
+
+    __repr__ = __str__
+
+
+class Fields:
+    """Structured ``key=value`` fields, rendered lazily.
+
+    Passing the fields both as a message argument and in ``extra`` keeps
+    them readable in plain text logs and available to structured handlers:
+    ``logger.info("Stored chunk %s", f, extra={"fields": f.values})``
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, **values: Any):
+        self.values = values
+
+    def __str__(self) -> str:
+        return " ".join(f"{key}={value}" for key, value in self.values.items())
+
+    __repr__ = __str__
+
+
+class LogSampler:
+    """Rate-limit per-item log lines on hot paths.
+
+    At most ``burst`` records per key are emitted every ``interval`` seconds;
+    the number suppressed in between is appended to the next emitted record.
+    The level check happens first, so a disabled level costs one call.
+    """
+
+    def __init__(self, logger: logging.Logger, interval: float = 10.0, burst: int = 5):
+        self.logger = logger
+        self.interval = interval
+        self.burst = burst
+        self._windows: Dict[str, list] = {}
+
+    def log(self, level: int, key: str, msg: str, *args: Any, **kwargs: Any) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
+        now = time.monotonic()
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= self.interval:
+            suppressed = window[2] if window else 0
+            window = self._windows[key] = [now, 0, 0]
+        else:
+            suppressed = 0
+        if window[1] >= self.burst:
+            window[2] += 1
+            return
+        window[1] += 1
+        if suppressed:
+            msg = f"{msg} (%d similar messages suppressed)"
+            args = args + (suppressed,)
+        self.logger.log(level, msg, *args, **kwargs)
+
+    def debug(self, key: str, msg: str, *args: Any, **kwargs: Any) -> None:
+        self.log(logging.DEBUG, key, msg, *args, **kwargs)
+
+    def info(self, key: str, msg: str, *args: Any, **kwargs: Any) -> None:
+        self.log(logging.INFO, key, msg, *args, **kwargs)
+
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_queue_lock = threading.Lock()
+
+
+def start_queue_logging(max_size: int = 10000) -> None:
+    """Move root handler I/O to a background thread.
+
+    The root logger's handlers are replaced by a QueueHandler, and a
+    QueueListener thread feeds records to the original handlers, so log
+    writes never block the event loop. Records are dropped rather than
+    blocking if the queue is full. Safe to call more than once.
+    """
+    global _queue_listener
+    with _queue_lock:
+        if _queue_listener is not None:
+            return
+        root = logging.getLogger()
+        handlers = list(root.handlers)
+        if not handlers:
+            return
+        records: queue.Queue = queue.Queue(max_size)
+        queue_handler = _NonBlockingQueueHandler(records)
+        for handler in handlers:
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        _queue_listener = logging.handlers.QueueListener(
+            records, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+
+
+def stop_queue_logging() -> None:
+    """Flush queued records and restore the original root handlers."""
+    global _queue_listener
+    with _queue_lock:
+        if _queue_listener is None:
+            return
+        listener, _queue_listener = _queue_listener, None
+        listener.stop()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if isinstance(handler, _NonBlockingQueueHandler):
+                root.removeHandler(handler)
+        for handler in listener.handlers:
+            root.addHandler(handler)
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
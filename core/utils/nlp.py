@@ -1,7 +1,9 @@
-import spacy
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from core.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import spacy
+
 logger = get_logger(__name__)
 
 def initialize_spacy_model(model_name: str = "en_core_web_sm") -> Optional['spacy.language.Language']:
@@ -13,6 +15,9 @@ def initialize_spacy_model(model_name: str = "en_core_web_sm") -> Optional['spac
     Returns:
         Loaded spaCy model, or None if initialization fails
     """
+    # Imported here so only callers that load a model pay for spaCy
+    import spacy
+
     try:
         logger.info(f"Loading spaCy model: {model_name}")
         nlp = spacy.load(model_name)
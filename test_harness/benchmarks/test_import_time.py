@@ -0,0 +1,74 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Packages that must only be imported once warm-up runs, not at startup
+DEFERRED_MODULES = ("spacy", "nltk", "readability", "pycountry", "us")
+
+# Modules loaded by `uvicorn api.main:app` before the server accepts requests
+STARTUP_MODULES = ("api.main",)
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+
+
+def _import_profile(module: str) -> List[Tuple[str, int, int]]:
+    """Parse ``-X importtime`` output into (module, self us, cumulative us)."""
+    result = _run(f"import {module}", "-X", "importtime")
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    profile = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        profile.append((name.strip(), int(self_us), int(cumulative_us)))
+    return profile
+
+
+def _loaded_top_level(module: str) -> Dict[str, bool]:
+    code = (
+        "import sys, json\n"
+        f"import {module}\n"
+        f"print(json.dumps({{m: m in sys.modules for m in {list(DEFERRED_MODULES)!r}}}))"
+    )
+    result = _run(code)
+    assert result.returncode == 0, result.stderr[-2000:]
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_startup_import_profile():
+    """Log the slowest imports on the startup path."""
+    for module in STARTUP_MODULES:
+        profile = _import_profile(module)
+        total_ms = next(cumulative for name, _, cumulative in profile if name == module) / 1000
+        slowest = sorted(profile, key=lambda entry: entry[1], reverse=True)[:15]
+        logger.info(f"Import of {module}: {total_ms:.1f} ms cumulative")
+        for name, self_us, cumulative_us in slowest:
+            logger.info(f"  {name:<60} self {self_us / 1000:8.1f} ms  cumulative {cumulative_us / 1000:8.1f} ms")
+
+
+def test_heavy_dependencies_are_deferred():
+    """spaCy, NLTK, readability, pycountry and us load during warm-up, not at import."""
+    for module in STARTUP_MODULES:
+        loaded = _loaded_top_level(module)
+        eager = [name for name, is_loaded in loaded.items() if is_loaded]
+        assert not eager, f"{module} imports {', '.join(eager)} at module level"
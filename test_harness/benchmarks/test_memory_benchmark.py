@@ -0,0 +1,127 @@
+import gc
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Set
+
+from core.domain.content.keyword_identifier import KeywordIdentifier
+from core.domain.content.models.page import Page
+from core.domain.content.types import KeywordType
+from core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PAGE_COUNT = 10_000
+KEYWORDS_PER_PAGE = 10
+CONTENT_TEMPLATE = "Benchmark page {index} about graph databases and keyword extraction. " * 40
+
+
+@dataclass
+class _UnslottedKeywordIdentifier:
+    """Field-for-field copy of KeywordIdentifier without __slots__."""
+    text: str
+    canonical_text: str
+    normalized_text: str
+    keyword_type: KeywordType
+    score: float = 0.5
+    variants: Set[str] = field(default_factory=set)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    id: str = field(init=False)
+
+    def __post_init__(self):
+        self.variants.add(self.text)
+        self.variants.add(self.canonical_text)
+        self.id = KeywordIdentifier._generate_id(self)
+
+
+def _build_pages(count: int) -> List[Page]:
+    """Build pages the way bulk processing leaves them in memory."""
+    pages = []
+    for index in range(count):
+        page = Page(url=f"https://example.com/{index}", domain="example.com")
+        page.content = CONTENT_TEMPLATE.format(index=index)
+        page.metadata.custom_metadata['content_metrics'] = {
+            'original_length': len(page.content),
+            'cleaned_length': len(page.content),
+            'is_html': False
+        }
+        keywords = [
+            KeywordIdentifier(
+                text=f"keyword {index} {k}",
+                canonical_text=f"keyword {index} {k}",
+                normalized_text=f"keyword {index} {k}",
+                keyword_type=KeywordType.CONCEPT
+            )
+            for k in range(KEYWORDS_PER_PAGE)
+        ]
+        page.update_keywords({kw.canonical_text: kw.score for kw in keywords})
+        page.mark_processed(processing_time=0.01)
+        pages.append(page)
+    return pages
+
+
+def _peak_bytes(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        objects = build()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del objects
+    return peak
+
+
+def test_models_are_slotted():
+    """Hot models must not carry a per-instance __dict__."""
+    page = Page(url="https://example.com", domain="example.com")
+    assert not hasattr(page, '__dict__')
+    assert not hasattr(page.metadata, '__dict__')
+    assert not hasattr(page.metadata.metrics, '__dict__')
+
+    keyword = KeywordIdentifier(
+        text="graph", canonical_text="graph",
+        normalized_text="graph", keyword_type=KeywordType.TERM
+    )
+    assert not hasattr(keyword, '__dict__')
+    assert keyword.id.startswith("kw_")
+
+
+def test_keyword_identifier_memory():
+    """Slotted identifiers should use measurably less memory than a plain dataclass."""
+    def build(cls):
+        return lambda: [
+            cls(
+                text=f"keyword {i}", canonical_text=f"keyword {i}",
+                normalized_text=f"keyword {i}", keyword_type=KeywordType.CONCEPT
+            )
+            for i in range(PAGE_COUNT * KEYWORDS_PER_PAGE)
+        ]
+
+    slotted = _peak_bytes(build(KeywordIdentifier))
+    unslotted = _peak_bytes(build(_UnslottedKeywordIdentifier))
+    logger.info(
+        f"{PAGE_COUNT * KEYWORDS_PER_PAGE} keyword identifiers: "
+        f"slotted {slotted / 2**20:.1f} MiB, unslotted {unslotted / 2**20:.1f} MiB"
+    )
+    assert slotted < unslotted
+
+
+def test_page_working_set_memory():
+    """Report the peak memory of 10k processed pages.
+
+    Content dominates the footprint, so everything beyond one copy of the
+    text per page is model overhead and should stay small.
+    """
+    peak = _peak_bytes(lambda: _build_pages(PAGE_COUNT))
+    content_bytes = PAGE_COUNT * len(CONTENT_TEMPLATE.format(index=PAGE_COUNT))
+    overhead_per_page = (peak - content_bytes) / PAGE_COUNT
+    logger.info(
+        f"{PAGE_COUNT} pages: peak {peak / 2**20:.1f} MiB, "
+        f"content {content_bytes / 2**20:.1f} MiB, "
+        f"{overhead_per_page / 1024:.1f} KiB model overhead per page"
+    )
+    # A duplicated content copy alone would add ~len(content) per page
+    assert peak - content_bytes < content_bytes
@@ -0,0 +1,137 @@
+import asyncio
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from api.middleware import ErrorHandlerMiddleware, LoggingMiddleware, TimingMiddleware
+from core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+REQUESTS = 2000
+PAYLOAD = {"success": True, "data": {"items": list(range(50))}, "metadata": {}}
+
+
+class _LegacyTimingMiddleware(BaseHTTPMiddleware):
+    """The previous TimingMiddleware: re-serialises JSON bodies on every request."""
+
+    async def dispatch(self, request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        if isinstance(response, JSONResponse):
+            try:
+                data = json.loads(response.body.decode())
+                if "metadata" in data:
+                    data["metadata"]["process_time"] = process_time
+                    response = JSONResponse(status_code=response.status_code, content=data)
+            except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+                pass
+        response.headers["X-Process-Time"] = str(process_time)
+        return response
+
+
+class _LegacyPassThroughMiddleware(BaseHTTPMiddleware):
+    """Stand-in for the previous logging and error handler layers."""
+
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+async def _json_app(scope, receive, send):
+    await JSONResponse(PAYLOAD)(scope, receive, send)
+
+
+async def _streaming_app(scope, receive, send):
+    async def chunks():
+        for i in range(3):
+            yield f"chunk {i}\n"
+    await StreamingResponse(chunks(), media_type="text/plain")(scope, receive, send)
+
+
+def _scope() -> Dict[str, Any]:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/stats",
+        "raw_path": b"/api/v1/stats",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+
+
+async def _call(app: Callable, scope: Dict[str, Any]) -> List[Dict[str, Any]]:
+    messages: List[Dict[str, Any]] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages
+
+
+def _per_request_us(app: Callable) -> float:
+    async def run():
+        for _ in range(50):
+            await _call(app, _scope())
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            await _call(app, _scope())
+        return (time.perf_counter() - start) / REQUESTS * 1e6
+    return asyncio.run(run())
+
+
+def _asgi_stack(app: Callable) -> Callable:
+    return ErrorHandlerMiddleware(LoggingMiddleware(TimingMiddleware(app)))
+
+
+def _legacy_stack(app: Callable) -> Callable:
+    return _LegacyPassThroughMiddleware(_LegacyPassThroughMiddleware(_LegacyTimingMiddleware(app)))
+
+
+def test_middleware_overhead():
+    """Pure ASGI middlewares should cost less per request than BaseHTTPMiddleware."""
+    bare = _per_request_us(_json_app)
+    legacy = _per_request_us(_legacy_stack(_json_app))
+    asgi = _per_request_us(_asgi_stack(_json_app))
+    logger.info(
+        f"Per-request time over {REQUESTS} requests: bare {bare:.1f} us, "
+        f"BaseHTTPMiddleware stack {legacy:.1f} us (+{legacy - bare:.1f}), "
+        f"ASGI stack {asgi:.1f} us (+{asgi - bare:.1f})"
+    )
+    assert asgi < legacy
+
+
+def test_timing_header_without_body_rewrite():
+    messages = asyncio.run(_call(_asgi_stack(_json_app), _scope()))
+    start = messages[0]
+    headers = dict(start["headers"])
+    assert b"x-process-time" in headers
+    assert b"x-request-id" in headers
+    # Body is forwarded byte-for-byte
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    assert json.loads(body) == PAYLOAD
+
+
+def test_streaming_passes_through_with_trailer():
+    scope = _scope()
+    scope["extensions"] = {"http.response.trailers": {}}
+    messages = asyncio.run(_call(_asgi_stack(_streaming_app), scope))
+
+    assert messages[0]["trailers"] is True
+    bodies = [m for m in messages if m["type"] == "http.response.body"]
+    assert [m["body"] for m in bodies if m["body"]] == [b"chunk 0\n", b"chunk 1\n", b"chunk 2\n"]
+    assert messages[-1]["type"] == "http.response.trailers"
+    assert dict(messages[-1]["headers"])[b"server-timing"].startswith(b"total;dur=")
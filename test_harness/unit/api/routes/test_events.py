@@ -0,0 +1,55 @@
+import pytest
+from api.routes.events import _follow, _sse_frames
+from core.services.events.event_bus import TaskEventBus
+
+
+async def collect(frames):
+    return [frame async for frame in frames]
+
+
+@pytest.mark.asyncio
+async def test_stream_stays_open_while_failed_task_is_still_running():
+    bus = TaskEventBus()
+    subscription = bus.subscribe(topics=["analysis"], task_ids=["t1"])
+    # One URL failed while another is still being processed
+    bus.publish("analysis", "t1", "error", progress=0.5, final=False)
+
+    follow = _follow(subscription)
+    kind, payload = await follow.__anext__()
+    assert (kind, payload["status"], payload["terminal"]) == ("event", "error", False)
+
+    bus.publish("analysis", "t1", "error", progress=1.0, final=True)
+    kind, payload = await follow.__anext__()
+    assert payload["terminal"]
+    with pytest.raises(StopAsyncIteration):
+        await follow.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_stream_ends_when_every_followed_task_finished():
+    bus = TaskEventBus()
+    bus.publish("agent", "t1", "completed")
+    subscription = bus.subscribe(task_ids=["t1", "t2"])
+    bus.publish("agent", "t2", "processing")
+    bus.publish("agent", "t2", "error")
+
+    frames = await collect(_sse_frames(subscription))
+
+    assert [frame.split("\n")[1] for frame in frames] == ["event: agent", "event: agent"]
+    assert '"task_id": "t1"' in frames[0] and '"status": "error"' in frames[1]
+    assert subscription.closed
+
+
+@pytest.mark.asyncio
+async def test_lagged_subscribers_are_told_how_many_events_were_dropped():
+    bus = TaskEventBus()
+    subscription = bus.subscribe(task_ids=["t1", "t2"], max_pending=1)
+    bus.publish("agent", "t1", "processing")
+    bus.publish("agent", "t2", "completed")
+
+    follow = _follow(subscription)
+
+    assert await follow.__anext__() == ("lagged", {"dropped": 1})
+    kind, payload = await follow.__anext__()
+    assert (kind, payload["task_id"]) == ("event", "t2")
+    subscription.close()
@@ -0,0 +1,27 @@
+import pytest
+from unittest.mock import Mock
+from api.task_manager import TaskManager
+
+
+@pytest.mark.asyncio
+async def test_create_task_runs_task_created_hooks():
+    hook = Mock()
+    task_manager = TaskManager("agent", on_task_created=[hook])
+
+    task_id = await task_manager.create_task({"query": "what is neo4j?"})
+
+    hook.assert_called_once_with({"query": "what is neo4j?"})
+    assert (await task_manager.get_task(task_id))["status"] == "enqueued"
+
+
+@pytest.mark.asyncio
+async def test_failing_hook_does_not_fail_task_creation():
+    second = Mock()
+    task_manager = TaskManager(
+        "agent", on_task_created=[Mock(side_effect=RuntimeError("boom")), second]
+    )
+
+    task_id = await task_manager.create_task()
+
+    assert task_id in task_manager.tasks
+    second.assert_called_once_with({})
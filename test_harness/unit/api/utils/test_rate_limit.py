@@ -0,0 +1,170 @@
+import pytest
+from api.utils.rate_limit import (
+    RateLimit,
+    RateLimitConfig,
+    SQLiteTokenBucketLimiter,
+    TokenBucketLimiter,
+    parse_rate_limits
+)
+
+
+class FakeClock:
+    """Manually advanced clock for bucket refill tests"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def sqlite_config(tmp_path):
+    return RateLimitConfig(sqlite_path=str(tmp_path / "rate_limit.sqlite"))
+
+
+class TestTokenBucketLimiter:
+    def test_rejects_when_empty_and_refills(self, clock):
+        limiter = TokenBucketLimiter(RateLimitConfig(), clock=clock)
+        limit = RateLimit(2, 60.0)
+
+        assert limiter.acquire("a", limit).allowed
+        assert limiter.acquire("a", limit).allowed
+        rejected = limiter.acquire("a", limit)
+        assert not rejected.allowed
+        assert rejected.retry_after == pytest.approx(30.0)
+
+        # One token comes back every 30 seconds
+        clock.now += 30.0
+        assert limiter.acquire("a", limit).allowed
+        assert not limiter.acquire("a", limit).allowed
+
+    def test_keys_have_separate_buckets(self, clock):
+        limiter = TokenBucketLimiter(RateLimitConfig(), clock=clock)
+        limit = RateLimit(1, 60.0)
+
+        assert limiter.acquire("a", limit).allowed
+        assert limiter.acquire("b", limit).allowed
+        assert not limiter.acquire("a", limit).allowed
+
+    def test_evicts_idle_buckets(self, clock):
+        limiter = TokenBucketLimiter(RateLimitConfig(idle_ttl=60.0), clock=clock)
+        limit = RateLimit(5, 60.0)
+        limiter.acquire("idle", limit)
+
+        clock.now += 61.0
+        limiter.acquire("active", limit)
+
+        assert len(limiter) == 1
+
+    def test_evicts_least_recently_used_over_max_keys(self, clock):
+        limiter = TokenBucketLimiter(RateLimitConfig(max_keys=2), clock=clock)
+        limit = RateLimit(5, 60.0)
+        for key in ("a", "b", "c"):
+            limiter.acquire(key, limit)
+
+        assert len(limiter) == 2
+        # "a" was dropped, so it starts again from a full bucket
+        assert limiter.acquire("a", limit).remaining == 4
+
+
+class TestSQLiteTokenBucketLimiter:
+    def test_rejects_when_empty_and_refills(self, sqlite_config, clock):
+        limiter = SQLiteTokenBucketLimiter(sqlite_config, clock=clock)
+        limit = RateLimit(1, 10.0)
+
+        assert limiter.acquire("a", limit).allowed
+        assert not limiter.acquire("a", limit).allowed
+        clock.now += 10.0
+        assert limiter.acquire("a", limit).allowed
+        limiter.close()
+
+    def test_processes_share_buckets(self, sqlite_config, clock):
+        first = SQLiteTokenBucketLimiter(sqlite_config, clock=clock)
+        second = SQLiteTokenBucketLimiter(sqlite_config, clock=clock)
+        limit = RateLimit(1, 60.0)
+
+        assert first.acquire("a", limit).allowed
+        assert not second.acquire("a", limit).allowed
+        first.close()
+        second.close()
+
+    def test_fails_open_on_database_errors(self, sqlite_config):
+        limiter = SQLiteTokenBucketLimiter(sqlite_config)
+        limiter.close()
+
+        decision = limiter.acquire("a", RateLimit(1, 60.0))
+
+        assert decision.allowed
+
+
+class TestParseRateLimits:
+    def test_parses_pairs(self):
+        limits = parse_rate_limits("/api/v1/agent=10/60, /api/v1/llm=30")
+
+        assert limits == {
+            "/api/v1/agent": RateLimit(10, 60.0),
+            "/api/v1/llm": RateLimit(30, 60.0)
+        }
+
+    def test_keeps_padding_in_tokens(self):
+        assert parse_rate_limits("dG9rZW4==5/1") == {"dG9rZW4=": RateLimit(5, 1.0)}
+
+    def test_empty_spec(self):
+        assert parse_rate_limits("") == {}
+
+    @pytest.mark.parametrize("spec", ["nolimit", "=5/60", "/api=abc/60"])
+    def test_rejects_malformed_entries(self, spec):
+        with pytest.raises(ValueError):
+            parse_rate_limits(spec)
+
+
+class TestRateLimitConfig:
+    def test_longest_route_prefix_and_token_override(self):
+        config = RateLimitConfig(
+            default=RateLimit(100, 60.0),
+            routes={"/api": RateLimit(50, 60.0), "/api/v1/agent": RateLimit(5, 60.0)},
+            tokens={"trusted": RateLimit(1000, 60.0)}
+        )
+
+        assert config.resolve("/api/v1/agent/query", None) == ("/api/v1/agent", RateLimit(5, 60.0))
+        assert config.resolve("/api/v1/pages", None) == ("/api", RateLimit(50, 60.0))
+        assert config.resolve("/health", None) == ("*", RateLimit(100, 60.0))
+        assert config.resolve("/api/v1/agent", "trusted")[1] == RateLimit(1000, 60.0)
+
+
+@pytest.mark.asyncio
+async def test_unknown_tokens_share_the_client_ip_bucket():
+    """Sending a fresh bearer token per request does not reset the limit"""
+    from api.middleware import RateLimitMiddleware
+
+    statuses = []
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    middleware = RateLimitMiddleware(app, config=RateLimitConfig(default=RateLimit(2, 60.0)))
+    for attempt in range(3):
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/pages",
+            "client": ("10.0.0.1", 1234),
+            "headers": [(b"authorization", f"Bearer random-{attempt}".encode())]
+        }
+        await middleware(scope, receive, send)
+
+    assert statuses == [200, 200, 429]
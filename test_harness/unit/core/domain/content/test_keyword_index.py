@@ -0,0 +1,69 @@
+from unittest.mock import Mock
+from core.domain.content.analysis import AnalysisContext
+from core.domain.content.keyword_index import AhoCorasickMatcher, KeywordPositionIndex, fold_case
+
+
+def matches(patterns, text):
+    return sorted(AhoCorasickMatcher(patterns).iter_matches(text))
+
+
+def test_overlapping_patterns_all_match():
+    text = "New York City is big"
+
+    assert matches(["new york", "york city", "new york city", "york"], text) == [
+        (0, 8, "new york"),
+        (0, 13, "new york city"),
+        (4, 8, "york"),
+        (4, 13, "york city")
+    ]
+
+
+def test_multi_word_patterns_match_across_whitespace_runs():
+    text = "A graph\n\n  Database and a graph  database."
+
+    assert matches(["Graph Database"], text) == [
+        (2, 19, "graph database"),
+        (26, 41, "graph database")
+    ]
+
+
+def test_matches_respect_word_boundaries():
+    assert matches(["graph"], "graphs paragraph graph_db graph") == [(26, 31, "graph")]
+
+
+def test_offsets_survive_characters_that_change_length_when_lowercased():
+    # "İ".lower() is two characters long
+    text = "İİ Graph Database in İstanbul"
+
+    found = matches(["graph database", "İSTANBUL"], text)
+
+    assert found == [(3, 17, "graph database"), (21, 29, "İstanbul")]
+    for start, end, pattern in found:
+        assert fold_case(text[start:end]) == pattern
+
+
+def test_non_ascii_case_folding():
+    assert matches(["Straße", "ÉCOLE"], "STRASSE straße École") == [
+        (8, 14, "straße"),
+        (15, 20, "école")
+    ]
+
+
+def test_position_index():
+    index = KeywordPositionIndex("Neo4j, neo4j and NEO4J", ["Neo4j", "missing"])
+
+    assert "NEO4J" in index
+    assert index.positions("neo4j") == [(0, 5), (7, 12), (17, 22)]
+    assert index.first_position("missing") == -1
+    assert index.count("unknown") == 0
+
+
+def test_span_for_uses_original_offsets():
+    text = "İİ graph database"
+    doc = Mock()
+    context = AnalysisContext(text, doc)
+
+    context.span_for("Graph Database")
+
+    doc.char_span.assert_called_once_with(3, 17, alignment_mode="strict")
+    assert context.positions("graph database") == [(3, 17)]
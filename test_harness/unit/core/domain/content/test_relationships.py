@@ -0,0 +1,53 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from core.domain.content.models.relationships import RelationshipManager
+
+
+def page_keywords(document_id):
+    """Keywords whose texts contain each other, so hierarchy detection links them"""
+    texts = ["graph", "graph database", "graph database index"]
+    return [
+        {"id": f"{document_id}:{text}", "canonical_text": text, "document_id": document_id}
+        for text in texts
+    ]
+
+
+def test_concurrent_detection_keeps_page_states_separate():
+    manager = RelationshipManager()
+    documents = ["page-a", "page-b"]
+    # Hold both detections open until each has added a relationship
+    barrier = threading.Barrier(len(documents))
+    add_relationship = manager.add_relationship
+    waited = threading.local()
+
+    def interleaved_add_relationship(*args, **kwargs):
+        if not getattr(waited, "done", False):
+            waited.done = True
+            barrier.wait(timeout=5)
+        add_relationship(*args, **kwargs)
+
+    manager.add_relationship = interleaved_add_relationship
+
+    def detect(document_id):
+        state = manager.new_state(document_id)
+        for keyword in page_keywords(document_id):
+            manager.register_keyword(keyword["id"], keyword.get("keyword_type"), state=state)
+        return manager.detect_relationships(
+            page_keywords(document_id),
+            {"document_id": document_id, "cleaned_content": ""},
+            state=state
+        )
+
+    with ThreadPoolExecutor(max_workers=len(documents)) as executor:
+        states = dict(zip(documents, executor.map(detect, documents)))
+
+    for document_id, state in states.items():
+        assert state.document_id == document_id
+        assert len(state.relationships) == 3
+        keyword_ids = {kid for pair in state.relationships for kid in pair}
+        assert all(kid.startswith(f"{document_id}:") for kid in keyword_ids)
+        assert all(kid.startswith(f"{document_id}:") for kid in state.keyword_types)
+        rows = manager.prepare_neo4j_relationships(min_confidence=0.0, state=state)
+        assert rows
+    # Nothing leaked into the manager's default state
+    assert not manager.prepare_neo4j_relationships(min_confidence=0.0)
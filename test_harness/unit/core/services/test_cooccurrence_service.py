@@ -0,0 +1,48 @@
+from unittest.mock import Mock
+from core.services.graph.cooccurrence_service import CooccurrenceConfig, KeywordCooccurrenceService
+
+
+def make_service(**config):
+    return KeywordCooccurrenceService(
+        Mock(), CooccurrenceConfig(seed_on_start=False, flush_interval=0, **config)
+    )
+
+
+def pair_entries(service):
+    return sum(len(targets) for targets in service._pairs.values())
+
+
+def test_neighbours_ranked_by_npmi():
+    service = make_service(min_npmi=0.0)
+    for _ in range(3):
+        service.add_page(["neo4j", "cypher"])
+    service.add_page(["neo4j", "python"])
+    service.add_page(["neo4j", "python"])
+    service.add_page(["python", "pandas"])
+    for _ in range(4):
+        service.add_page(["rust", "cargo"])
+
+    neighbours = service.get_neighbours("Neo4j")
+
+    assert [n.keyword for n in neighbours] == ["cypher", "python"]
+    assert neighbours[0].count == 3
+
+
+def test_unknown_keywords_are_not_cached():
+    service = make_service()
+    service.add_page(["neo4j", "cypher"])
+
+    for i in range(100):
+        assert service.get_neighbours(f"unknown {i}") == []
+
+    assert not any(key.startswith("unknown") for key in service._neighbours)
+
+
+def test_stats_pair_count_tracks_pruning_and_eviction():
+    service = make_service(max_pairs_per_keyword=4, max_keywords=10)
+    for i in range(30):
+        service.add_page([f"k{i}", f"k{i + 1}", f"k{i + 2}", "common"])
+        assert service._pair_entries == pair_entries(service)
+
+    assert len(service.keyword_counts) <= 10
+    assert service.stats()["pairs"] == pair_entries(service) // 2
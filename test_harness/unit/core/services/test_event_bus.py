@@ -0,0 +1,82 @@
+import pytest
+from core.services.events.event_bus import EventBusConfig, TaskEventBus
+
+
+@pytest.mark.asyncio
+async def test_newer_events_replace_pending_ones():
+    bus = TaskEventBus()
+    subscription = bus.subscribe(topics=["analysis"])
+
+    bus.publish("analysis", "t1", "queued")
+    bus.publish("analysis", "t2", "queued")
+    bus.publish("analysis", "t1", "processing", progress=0.5)
+
+    first = await subscription.get(timeout=0)
+    second = await subscription.get(timeout=0)
+
+    # t1 keeps its place in line but only its newest state is delivered
+    assert (first.task_id, first.status, first.progress) == ("t1", "processing", 0.5)
+    assert (second.task_id, second.status) == ("t2", "queued")
+    assert subscription.coalesced == 1
+    assert await subscription.get(timeout=0) is None
+
+
+@pytest.mark.asyncio
+async def test_oldest_task_dropped_beyond_max_pending():
+    bus = TaskEventBus(EventBusConfig(max_pending=2))
+    subscription = bus.subscribe()
+
+    for task_id in ("t1", "t2", "t3"):
+        bus.publish("analysis", task_id, "queued")
+
+    assert subscription.lagged
+    assert subscription.dropped == 1
+    assert [(await subscription.get(timeout=0)).task_id for _ in range(2)] == ["t2", "t3"]
+    assert bus.stats()["dropped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_task_subscriptions_replay_latest_state():
+    bus = TaskEventBus()
+    bus.publish("analysis", "t1", "queued")
+    bus.publish("analysis", "t1", "processing")
+    bus.publish("agent", "t2", "completed")
+    bus.publish("analysis", "other", "queued")
+
+    subscription = bus.subscribe(task_ids=["t2", "t1"])
+
+    replayed = [await subscription.get(timeout=0) for _ in range(2)]
+    assert [(e.task_id, e.status) for e in replayed] == [("t1", "processing"), ("t2", "completed")]
+    assert await subscription.get(timeout=0) is None
+
+    without_replay = bus.subscribe(task_ids=["t1"], replay=False)
+    assert await without_replay.get(timeout=0) is None
+
+
+def test_snapshots_are_bounded():
+    bus = TaskEventBus(EventBusConfig(max_snapshots=2))
+    for task_id in ("t1", "t2", "t3"):
+        bus.publish("analysis", task_id, "queued")
+
+    assert bus.latest("analysis", "t1") is None
+    assert bus.latest("analysis", "t3").status == "queued"
+
+
+def test_task_filtered_subscriptions_only_see_their_tasks():
+    bus = TaskEventBus()
+    subscription = bus.subscribe(task_ids=["t1"])
+
+    bus.publish("analysis", "t2", "queued")
+    bus.publish("analysis", "t1", "queued")
+
+    assert len(subscription._pending) == 1
+    subscription.close()
+    assert bus.stats()["subscribers"] == 0
+
+
+def test_final_flag_overrides_status():
+    bus = TaskEventBus()
+
+    assert bus.publish("agent", "t1", "error").terminal
+    assert not bus.publish("analysis", "t2", "error", final=False).terminal
+    assert bus.publish("analysis", "t2", "error", final=True).to_dict()["terminal"]
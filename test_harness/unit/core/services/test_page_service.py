@@ -0,0 +1,64 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+from core.domain.content.models.page import PageStatus
+from core.domain.content.models.page_view import PAGE_SUMMARY_PROPERTIES
+from core.services.content.page_service import PageService
+from core.services.graph.graph_service import GraphService
+
+
+@pytest.fixture
+def page_service():
+    """PageService whose Neo4j connection returns projected rows"""
+    connection = Mock()
+    connection.execute_query = AsyncMock(return_value=[])
+    graph_operations = Mock(connection=connection)
+    return PageService(GraphService(graph_operations))
+
+
+def projected_row(**properties):
+    """Row as returned by the listing map projection: every key, null if unset"""
+    row = dict.fromkeys(PAGE_SUMMARY_PROPERTIES)
+    row.update(properties)
+    return {"p": row}
+
+
+@pytest.mark.asyncio
+async def test_query_pages_with_minimal_node(page_service):
+    """Pages stored with only id/url/domain/title/status can be listed"""
+    connection = page_service.graph_service.graph_operations.connection
+    connection.execute_query.return_value = [projected_row(
+        id="0b7c6f2e-6a34-4f34-9d51-5b1f4f0f2f6a",
+        url="https://example.com/a",
+        domain="example.com",
+        title="Example",
+        status="active"
+    )]
+
+    pages = await page_service.query_pages(Mock())
+
+    assert len(pages) == 1
+    page = pages[0]
+    assert page.url == "https://example.com/a"
+    assert page.status == PageStatus.ACTIVE
+    assert page.metadata.metadata_quality_score == 0.0
+    assert page.metadata.browser_contexts == set()
+
+
+@pytest.mark.asyncio
+async def test_query_pages_loads_requested_properties(page_service):
+    """Requested heavy properties are applied to the listed pages"""
+    connection = page_service.graph_service.graph_operations.connection
+    connection.execute_query.return_value = [projected_row(
+        url="https://example.com/b",
+        domain="example.com",
+        keywords_json='{"neo4j": 0.9}',
+        custom_metadata_json=None
+    )]
+
+    pages = await page_service.query_pages(
+        Mock(), properties=("keywords_json", "custom_metadata_json")
+    )
+
+    assert pages[0].keywords == {"neo4j": 0.9}
+    assert pages[0].metadata.custom_metadata == {}
+    assert "keywords_json" in connection.execute_query.call_args.args[0]
@@ -0,0 +1,121 @@
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from core.services.stats.stats_service import StatsService
+
+
+@pytest.fixture
+def stats_service():
+    """StatsService over a Neo4j connection that returns no rows"""
+    connection = Mock()
+    connection.execute_query = AsyncMock(return_value=[])
+    return StatsService(connection, reconcile_interval=0)
+
+
+def graph_rows(query, read_only=True):
+    """Canned answers for the reconcile queries"""
+    if "CALL db.relationshipTypes()" in query:
+        return [{"relationshipType": "HAS_KEYWORD"}, {"relationshipType": "LINKS_TO"}]
+    if "[r:`HAS_KEYWORD`]" in query:
+        return [{"count": 7}]
+    if "[r:`LINKS_TO`]" in query:
+        return [{"count": 3}]
+    if "count(p) AS count" in query and "day" not in query:
+        return [{"count": 4}]
+    if "count(r) AS count" in query:
+        return [{"count": 10}]
+    if "t.type = 'QUERY'" in query:
+        return [{"count": 2}]
+    # Rollup aggregation
+    return [
+        {"day": "2026-10-01", "domain": "example.com", "contexts": ["active_tab"], "count": 3},
+        {"day": None, "domain": "other.org", "contexts": [], "count": 1}
+    ]
+
+
+def stored_page(domain, *contexts):
+    return SimpleNamespace(
+        domain=domain,
+        browser_contexts=[SimpleNamespace(value=context) for context in contexts]
+    )
+
+
+def test_counters_update_on_writes(stats_service):
+    stats_service.record_page_stored(stored_page("example.com", "active_tab"), keywords_stored=5)
+    stats_service.record_relationships("LINKS_TO", 2)
+    stats_service.record_relationships("LINKS_TO", 0)
+    stats_service.record_query({"query": "what is neo4j?"})
+
+    stats = stats_service.get_stats(detailed=True)
+
+    assert (stats["captures"], stats["relationships"], stats["queries"]) == (1, 7, 1)
+    details = stats["details"]
+    assert details["top_domains"] == [{"domain": "example.com", "count": 1}]
+    assert details["context_distribution"] == [{"context": "active_tab", "count": 1}]
+    assert {"type": "HAS_KEYWORD", "count": 5} in details["relationship_types"]
+
+
+def test_date_range_filters_captures_only(stats_service):
+    stats_service.record_page_captured("old.com", when=datetime(2026, 1, 1))
+    stats_service.record_page_captured("new.com", ["background_tab"], when=datetime(2026, 10, 1))
+    stats_service.record_relationships("LINKS_TO", 4)
+    stats_service.record_query()
+
+    stats = stats_service.get_stats(
+        start_date=datetime(2026, 9, 1), end_date=datetime(2026, 10, 31), detailed=True
+    )
+
+    assert stats["captures"] == 1
+    assert stats["relationships"] == 4
+    assert stats["queries"] == 1
+    assert stats["details"]["top_domains"] == [{"domain": "new.com", "count": 1}]
+    assert stats["details"]["context_distribution"] == [{"context": "background_tab", "count": 1}]
+
+
+@pytest.mark.asyncio
+async def test_reconcile_refreshes_totals_and_rollups(stats_service):
+    stats_service.db_connection.execute_query.side_effect = graph_rows
+    stats_service.record_page_captured("drifted.com")
+    stats_service.record_query()
+
+    await stats_service.reconcile()
+
+    assert stats_service.is_ready
+    stats = stats_service.get_stats(detailed=True)
+    assert stats["captures"] == 4
+    assert stats["relationships"] == 10
+    # Graph QUERY tasks plus agent tasks recorded in memory
+    assert stats["queries"] == 3
+    assert stats["details"]["top_domains"] == [
+        {"domain": "example.com", "count": 3},
+        {"domain": "other.org", "count": 1}
+    ]
+
+    ranged = stats_service.get_stats(
+        start_date=datetime(2026, 10, 1), end_date=datetime(2026, 10, 1)
+    )
+    assert ranged["captures"] == 3
+
+
+@pytest.mark.asyncio
+async def test_every_reconcile_rebuilds_breakdowns(stats_service):
+    stats_service.db_connection.execute_query.side_effect = graph_rows
+    await stats_service.reconcile()
+    stats_service.record_page_captured("drifted.com")
+
+    await stats_service.reconcile()
+
+    assert "drifted.com" not in stats_service.domains
+    assert stats_service.domains["example.com"] == 3
+
+
+@pytest.mark.asyncio
+async def test_reconcile_failure_keeps_counters(stats_service):
+    stats_service.record_query()
+    stats_service.db_connection.execute_query.side_effect = RuntimeError("neo4j down")
+
+    await stats_service.reconcile()
+
+    assert not stats_service.is_ready
+    assert stats_service.get_stats()["queries"] == 1
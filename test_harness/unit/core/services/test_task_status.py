@@ -0,0 +1,112 @@
+import pytest
+from core.services.content.task_status import TaskStatusConfig, TaskStatusStore
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def track(store, task_id, *urls):
+    for url in urls:
+        store.set(url, {"task_id": task_id, "status": "queued", "progress": 0.0})
+
+
+def finish(store, *urls):
+    for url in urls:
+        store.update(url, {"status": "completed", "progress": 1.0})
+
+
+def test_counters_follow_url_transitions(clock):
+    store = TaskStatusStore(clock=clock)
+    track(store, "t1", "a", "b")
+
+    assert store.summary("t1")["status"] == "queued"
+
+    store.update("a", {"status": "processing", "progress": 0.5})
+    summary = store.summary("t1")
+    assert summary["status"] == "processing"
+    assert summary["progress"] == pytest.approx(0.25)
+    assert summary["counts"] == {"processing": 1, "queued": 1}
+
+    finish(store, "a", "b")
+    summary = store.summary("t1")
+    assert summary["status"] == "completed"
+    assert summary["all_progress_complete"]
+
+    # Re-queueing a URL makes the task unfinished again
+    store.set("b", {"task_id": "t1", "status": "queued", "progress": 0.0})
+    assert store.summary("t1")["counts"] == {"completed": 1, "queued": 1}
+    assert store._finished_urls == 0
+
+
+def test_first_error_is_reported(clock):
+    store = TaskStatusStore(clock=clock)
+    track(store, "t1", "a", "b", "c")
+    store.update("b", {"status": "error", "error": "timeout"})
+    store.update("c", {"status": "error", "error": "404"})
+
+    summary = store.summary("t1")
+
+    assert summary["status"] == "error"
+    assert summary["error"] == "timeout"
+    # "a" is still queued, so the task has not finished yet
+    assert not summary["finished"]
+
+    store.update("b", {"status": "processing"})
+    assert store.summary("t1")["error"] == "404"
+
+
+def test_finished_tasks_expire_after_ttl(clock):
+    store = TaskStatusStore(TaskStatusConfig(finished_ttl=60.0), clock=clock)
+    track(store, "done", "a")
+    track(store, "running", "b")
+    finish(store, "a")
+
+    clock.now += 61.0
+
+    assert store.summary("done") is None
+    assert "a" not in store
+    assert store.summary("running") is not None
+
+
+def test_reads_extend_ttl_but_untouched_reads_do_not(clock):
+    store = TaskStatusStore(TaskStatusConfig(finished_ttl=60.0), clock=clock)
+    track(store, "t1", "a")
+    finish(store, "a")
+
+    clock.now += 50.0
+    assert store.summary("t1") is not None
+    clock.now += 50.0
+    assert store.summary("t1", touch=False) is not None
+    clock.now += 20.0
+
+    assert store.evict() == 1
+    assert store.summary("t1") is None
+
+
+def test_least_recently_used_finished_tasks_are_evicted(clock):
+    store = TaskStatusStore(TaskStatusConfig(max_finished_urls=2), clock=clock)
+    for task_id, url in (("t1", "a"), ("t2", "b")):
+        track(store, task_id, url)
+        finish(store, url)
+    # Reading t1 makes t2 the least recently used
+    store.summary("t1")
+
+    track(store, "t3", "c")
+    finish(store, "c")
+
+    assert store.summary("t2") is None
+    assert store.summary("t1") is not None
+    assert store.summary("t3") is not None
+